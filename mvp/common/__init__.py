@@ -0,0 +1,9 @@
+"""
+Shared helpers for the pygame -> FFmpeg video pipelines.
+Projects import this package by adding the `mvp/` folder to sys.path.
+"""
+
+from .audio_pipe import AudioPipe
+from .frame_sink import FrameSink
+from .stderr_drain import EncoderProgress, StderrDrain
+from .worker_pool import AdaptiveWorkerPool
@@ -0,0 +1,79 @@
+"""
+Audio Pipe Module.
+Feeds raw PCM into an FFmpeg input through a named pipe (os.mkfifo), so
+video frames (stdin) and audio can go to the same encoder process.
+"""
+
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from typing import List, Optional
+
+
+class AudioPipe:
+    """Writes PCM blocks to a FIFO on a writer thread."""
+
+    def __init__(self, samplerate: int, channels: int = 2, sample_fmt: str = "f32le") -> None:
+        if not self.supported():
+            raise OSError("Named pipes (os.mkfifo) are not available on this platform")
+        self.samplerate = samplerate
+        self.channels = channels
+        self.sample_fmt = sample_fmt
+
+        self._dir = tempfile.mkdtemp(prefix="audio_pipe_")
+        self.path = os.path.join(self._dir, "audio.pcm")
+        os.mkfifo(self.path)
+
+        self.bytes_written = 0
+        self.error: Optional[BaseException] = None
+        # Unbounded: a block per frame is a few KB and the writer must never
+        # stall the render loop while FFmpeg is busy with video.
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="AudioPipeWriter", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def supported() -> bool:
+        return hasattr(os, "mkfifo")
+
+    def input_args(self) -> List[str]:
+        """FFmpeg input options for this pipe."""
+        return ["-probesize", "32", "-analyzeduration", "0",
+                "-f", self.sample_fmt, "-ar", str(self.samplerate),
+                "-ac", str(self.channels), "-i", self.path]
+
+    def write(self, data) -> None:
+        """Queue a bytes-like PCM block (already in sample_fmt layout)."""
+        if self.error is not None:
+            raise BrokenPipeError(f"Audio pipe closed: {self.error}")
+        self._queue.put(bytes(data))
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Signal EOF, wait for the writer and remove the FIFO."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # FFmpeg never opened (or stopped reading) the pipe: open the read
+            # end ourselves so the blocked writer can fail and exit.
+            try:
+                fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+                os.close(fd)
+            except OSError:
+                pass
+            self._thread.join(1.0)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _run(self) -> None:
+        try:
+            # Blocks until FFmpeg opens its input
+            with open(self.path, "wb", buffering=0) as fifo:
+                while True:
+                    data = self._queue.get()
+                    if data is None:
+                        return
+                    fifo.write(data)
+                    self.bytes_written += len(data)
+        except OSError as e:
+            self.error = e
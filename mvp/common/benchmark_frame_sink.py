@@ -0,0 +1,102 @@
+"""
+Frame Sink Benchmark.
+Compares the legacy `pygame.image.tostring -> stdin.write` capture with
+FrameSink (threaded and synchronous) on a 1080x1920 surface.
+
+    python benchmark_frame_sink.py [frames] [--ffmpeg]
+
+Without --ffmpeg the frames go to a null consumer process, which isolates
+the Python-side copy cost from the encoder speed.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.frame_sink import FrameSink
+
+WIDTH, HEIGHT = 1080, 1920
+NULL_CONSUMER = [sys.executable, "-c",
+                 "import os, shutil, sys; shutil.copyfileobj(sys.stdin.buffer, open(os.devnull, 'wb'), 1 << 20)"]
+
+
+class NullFrameSink(FrameSink):
+    """FrameSink that discards frames instead of encoding them."""
+
+    def _spawn(self, command):
+        return subprocess.Popen(NULL_CONSUMER, stdin=subprocess.PIPE)
+
+
+def _draw(surface: pygame.Surface, i: int) -> None:
+    """Cheap stand-in for a game frame."""
+    surface.fill((5, 5, 8))
+    pygame.draw.circle(surface, (255, 30, 80), (i * 7 % WIDTH, i * 11 % HEIGHT), 35)
+
+
+def bench_legacy(surface: pygame.Surface, frames: int, command) -> dict:
+    process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    copy = 0.0
+    start = time.perf_counter()
+    for i in range(frames):
+        _draw(surface, i)
+        t0 = time.perf_counter()
+        data = pygame.image.tostring(surface, "RGB")
+        copy += time.perf_counter() - t0
+        process.stdin.write(data)
+    process.stdin.close()
+    process.wait()
+    wall = time.perf_counter() - start
+    return {"copy_ms": copy / frames * 1000, "wall_ms": wall / frames * 1000}
+
+
+def bench_sink(surface: pygame.Surface, frames: int, sink: FrameSink) -> dict:
+    start = time.perf_counter()
+    for i in range(frames):
+        _draw(surface, i)
+        sink.write(surface)
+    sink.close()
+    wall = time.perf_counter() - start
+    return {
+        "copy_ms": sink.copy_time / frames * 1000,
+        "stall_ms": sink.stall_time / frames * 1000,
+        "wall_ms": wall / frames * 1000,
+    }
+
+
+def run_benchmark(frames: int = 300, use_ffmpeg: bool = False) -> dict:
+    pygame.init()
+    surface = pygame.display.set_mode((WIDTH, HEIGHT))
+    out = os.path.join(tempfile.gettempdir(), "frame_sink_bench.mp4")
+
+    sink_cls = FrameSink if use_ffmpeg else NullFrameSink
+    legacy_cmd = NULL_CONSUMER
+    if use_ffmpeg:
+        legacy_cmd = sink_cls(out).build_command((WIDTH, HEIGHT), "rgb24")
+
+    results = {
+        "legacy tostring": bench_legacy(surface, frames, legacy_cmd),
+        "FrameSink sync": bench_sink(surface, frames, sink_cls(out, threaded=False, loglevel="error")),
+        "FrameSink threaded": bench_sink(surface, frames, sink_cls(out, threaded=True, loglevel="error")),
+    }
+
+    print(f"{'MODE':<20} | {'COPY ms/frame':<14} | {'STALL ms/frame':<14} | {'WALL ms/frame':<14}")
+    print("-" * 72)
+    for name, r in results.items():
+        stall = f"{r['stall_ms']:.3f}" if "stall_ms" in r else "-"
+        print(f"{name:<20} | {r['copy_ms']:<14.3f} | {stall:<14} | {r['wall_ms']:<14.3f}")
+
+    pygame.quit()
+    return results
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    run_benchmark(int(args[0]) if args else 300, use_ffmpeg="--ffmpeg" in sys.argv)
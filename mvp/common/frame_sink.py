@@ -0,0 +1,239 @@
+"""
+Frame Sink Module.
+Streams pygame surfaces to an FFmpeg rawvideo pipe without the
+`tostring -> bytes -> stdin.write` double copy.
+
+The surface memory is handed to FFmpeg in its native pixel layout
+(e.g. `bgr0` for the usual 32-bit display surface), so no channel
+swizzling happens in Python. In threaded mode each frame is copied once
+into a pooled buffer and a writer thread feeds the pipe, which lets the
+encoder run while the next frame is simulated.
+
+FFmpeg's stderr is drained on its own thread (see stderr_drain.py), which
+also exposes the encoder throughput through `FrameSink.progress`.
+
+Extra inputs (e.g. the FIFO of an AudioPipe) can be muxed in the same
+process via `extra_inputs` + `extra_output_args`.
+"""
+
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import pygame
+
+from .stderr_drain import EncoderProgress, StderrDrain
+
+# FFmpeg packed 32-bit formats we can feed straight from surface memory
+PACKED_32BIT_FORMATS = {"bgr0", "bgra", "rgb0", "rgba", "0rgb", "argb", "0bgr", "abgr"}
+
+
+def surface_pix_fmt(surface: pygame.Surface) -> Optional[str]:
+    """
+    Returns the FFmpeg pix_fmt that matches the raw surface memory,
+    or None if the surface has to be converted (24-bit, padded rows...).
+    """
+    if surface.get_bytesize() != 4:
+        return None
+    if surface.get_pitch() != surface.get_width() * 4:
+        return None
+
+    masks = surface.get_masks()
+    shifts = surface.get_shifts()
+    letters = []
+    for byte in range(4):
+        shift = byte * 8 if sys.byteorder == "little" else (3 - byte) * 8
+        letter = "0"
+        for channel, mask, ch_shift in zip("rgba", masks, shifts):
+            if mask and ch_shift == shift:
+                letter = channel
+        letters.append(letter)
+
+    name = "".join(letters)
+    return name if name in PACKED_32BIT_FORMATS else None
+
+
+class FrameSink:
+    """Pipes pygame surfaces into an FFmpeg encoder process."""
+
+    def __init__(self, output_path: Union[str, Path], fps: int = 60,
+                 preset: str = "medium", crf: int = 18, threaded: bool = True,
+                 queue_size: int = 4, loglevel: Optional[str] = None,
+                 extra_inputs: Sequence[str] = (),
+                 extra_output_args: Sequence[str] = ()) -> None:
+        self.output_path = str(output_path)
+        self.fps = fps
+        self.preset = preset
+        self.crf = crf
+        self.threaded = threaded
+        self.queue_size = max(1, queue_size)
+        self.loglevel = loglevel
+        self.extra_inputs = list(extra_inputs)
+        self.extra_output_args = list(extra_output_args)
+
+        self.process: Optional[subprocess.Popen] = None
+        self.size: Optional[Tuple[int, int]] = None
+        self.pix_fmt: Optional[str] = None
+        self.frame_count = 0
+
+        # Copy/stall instrumentation (seconds, summed over all frames)
+        self.copy_time = 0.0
+        self.stall_time = 0.0
+
+        self._queue: "queue.Queue[Optional[bytearray]]" = queue.Queue(maxsize=self.queue_size)
+        self._free: "queue.Queue[bytearray]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self.stderr: Optional[StderrDrain] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def build_command(self, size: Tuple[int, int], pix_fmt: str) -> List[str]:
+        """FFmpeg command line for the given input geometry."""
+        command = ["ffmpeg", "-y"]
+        if self.loglevel:
+            command += ["-v", self.loglevel]
+        command += [
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-s", f"{size[0]}x{size[1]}",
+            "-pix_fmt", pix_fmt, "-r", str(self.fps),
+            "-i", "-",
+        ]
+        # Further inputs (e.g. an AudioPipe FIFO) come after the video stdin
+        command += self.extra_inputs
+        command += [
+            "-c:v", "libx264", "-preset", self.preset, "-crf", str(self.crf),
+            "-pix_fmt", "yuv420p",
+            # Machine-readable progress on stderr, even with -v error
+            "-progress", "pipe:2", "-nostats",
+        ]
+        command += self.extra_output_args
+        command.append(self.output_path)
+        return command
+
+    def _spawn(self, command: List[str]) -> subprocess.Popen:
+        return subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def _start(self, surface: pygame.Surface) -> None:
+        self.size = surface.get_size()
+        self.pix_fmt = surface_pix_fmt(surface) or "rgb24"
+        self.process = self._spawn(self.build_command(self.size, self.pix_fmt))
+        if self.process.stderr is not None:
+            self.stderr = StderrDrain(self.process.stderr)
+
+        if self.threaded:
+            frame_bytes = self.size[0] * self.size[1] * (4 if self.pix_fmt != "rgb24" else 3)
+            # queue_size in flight + one being written + one being filled
+            for _ in range(self.queue_size + 2):
+                self._free.put(bytearray(frame_bytes))
+            self._writer = threading.Thread(target=self._write_loop, name="FrameSinkWriter", daemon=True)
+            self._writer.start()
+
+    def close(self) -> None:
+        """Flush pending frames, close the pipe and wait for FFmpeg."""
+        if self.process is None:
+            return
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self.process.wait()
+        if self.stderr is not None:
+            self.stderr.join(timeout=5.0)
+            if returncode != 0:
+                print(f"❌ FFmpeg exited with code {returncode}:\n{self.stderr.tail()}")
+        self.process = None
+
+    @property
+    def progress(self) -> EncoderProgress:
+        """Latest encoder throughput (frame, fps, speed) parsed from stderr."""
+        if self.stderr is None:
+            return EncoderProgress()
+        return self.stderr.progress
+
+    @property
+    def encoder_lag(self) -> int:
+        """Frames handed to the sink that FFmpeg has not reported as encoded yet."""
+        return max(0, self.frame_count - self.progress.frame)
+
+    def __enter__(self) -> "FrameSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Frame path
+    # ------------------------------------------------------------------
+
+    def write(self, surface: pygame.Surface) -> None:
+        """Queue one frame. Raises BrokenPipeError if FFmpeg went away."""
+        if self._error is not None:
+            raise self._error
+        if self.process is None:
+            self._start(surface)
+
+        if self.pix_fmt == "rgb24":
+            data = pygame.image.tobytes(surface, "RGB")
+            if self.threaded:
+                self._enqueue(surface, data)
+            else:
+                self.process.stdin.write(data)
+        elif self.threaded:
+            self._enqueue(surface, None)
+        else:
+            # Synchronous zero-copy: the pipe reads straight from pixel memory.
+            # The view locks the surface, so it must be released before the next draw.
+            view = surface.get_view("0")
+            try:
+                self.process.stdin.write(view)
+            finally:
+                del view
+
+        self.frame_count += 1
+
+    def _enqueue(self, surface: pygame.Surface, data: Optional[bytes]) -> None:
+        t0 = time.perf_counter()
+        buf = self._free.get()
+        t1 = time.perf_counter()
+
+        if data is not None:
+            buf[:] = data
+        else:
+            view = surface.get_view("0")
+            try:
+                memoryview(buf)[:] = memoryview(view).cast("B")
+            finally:
+                del view
+        t2 = time.perf_counter()
+
+        self._queue.put(buf)
+        t3 = time.perf_counter()
+
+        self.stall_time += (t1 - t0) + (t3 - t2)
+        self.copy_time += t2 - t1
+
+    def _write_loop(self) -> None:
+        stdin = self.process.stdin
+        while True:
+            buf = self._queue.get()
+            if buf is None:
+                return
+            try:
+                if self._error is None:
+                    stdin.write(buf)
+            except (BrokenPipeError, OSError) as e:
+                self._error = e if isinstance(e, BrokenPipeError) else BrokenPipeError(str(e))
+            finally:
+                self._free.put(buf)
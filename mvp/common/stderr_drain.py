@@ -0,0 +1,97 @@
+"""
+FFmpeg stderr drain.
+A daemon thread that keeps reading an encoder's stderr so the 64 KiB pipe
+buffer never fills up (which would stall FFmpeg and, through stdin, the
+whole render loop). The last lines are kept in a ring buffer for error
+reports and `frame=`/`fps=`/`speed=` progress is parsed into a metric the
+simulation loop can poll.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import IO, Deque, Optional
+
+# Matches both the classic stats line ("frame=  120 fps= 60 ... speed=2.0x")
+# and the key=value blocks written by `-progress pipe:2`.
+_PROGRESS_RE = re.compile(rb"(frame|fps|speed)=\s*([0-9.]+)")
+# Other `-progress` keys (bitrate=, out_time=, progress=continue...)
+_KEY_VALUE_RE = re.compile(rb"^\w+=\s*\S*$")
+
+
+@dataclass
+class EncoderProgress:
+    """Latest encoder throughput reported by FFmpeg."""
+    frame: int = 0
+    fps: float = 0.0
+    speed: float = 0.0
+    updated_at: float = 0.0 # time.monotonic() of the last update
+
+
+class StderrDrain:
+    """Continuously drains a subprocess stderr stream on a daemon thread."""
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, stream: IO[bytes], max_lines: int = 200) -> None:
+        self.stream = stream
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+        self.bytes_read = 0
+        self._progress = EncoderProgress()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="FFmpegStderrDrain", daemon=True)
+        self._thread.start()
+
+    @property
+    def progress(self) -> EncoderProgress:
+        """Snapshot of the latest progress values."""
+        with self._lock:
+            return replace(self._progress)
+
+    def tail(self, n: int = 20) -> str:
+        """Last n stderr lines, for error messages."""
+        with self._lock:
+            return "\n".join(list(self.lines)[-n:])
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        read = getattr(self.stream, "read1", self.stream.read)
+        pending = b""
+        try:
+            while True:
+                chunk = read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.bytes_read += len(chunk)
+                # FFmpeg terminates stats lines with \r, everything else with \n
+                parts = re.split(rb"[\r\n]", pending + chunk)
+                pending = parts.pop()
+                self._consume(parts)
+        except (OSError, ValueError):
+            pass # Stream closed under us
+        if pending:
+            self._consume([pending])
+
+    def _consume(self, raw_lines) -> None:
+        with self._lock:
+            for raw in raw_lines:
+                if not raw:
+                    continue
+                matches = _PROGRESS_RE.findall(raw)
+                if matches:
+                    for key, value in matches:
+                        if key == b"frame":
+                            self._progress.frame = int(float(value))
+                        elif key == b"fps":
+                            self._progress.fps = float(value)
+                        else:
+                            self._progress.speed = float(value)
+                    self._progress.updated_at = time.monotonic()
+                    continue
+                if _KEY_VALUE_RE.match(raw):
+                    continue
+                self.lines.append(raw.decode("utf-8", errors="replace"))
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import threading
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+
+# Add mvp/ to path to import the common package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from common.frame_sink import FrameSink
+from common.stderr_drain import StderrDrain
+
+# Child that floods stderr (8 MiB) BEFORE it starts reading stdin, like a
+# chatty encoder. Without a drain the child blocks on stderr and the parent
+# blocks on stdin forever.
+NOISY_ENCODER = r"""
+import sys
+junk = b"x" * 1023 + b"\n"
+for _ in range(8 * 1024):
+    sys.stderr.buffer.write(junk)
+sys.stderr.buffer.write(b"frame=  42 fps= 30.5 q=28.0 size=     256kB time=00:00:01.40 speed=1.50x\r")
+sys.stderr.buffer.flush()
+sys.stdin.buffer.read()
+"""
+
+
+class NoisyFrameSink(FrameSink):
+    def _spawn(self, command):
+        return subprocess.Popen([sys.executable, "-c", NOISY_ENCODER],
+                                stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+class TestStderrDrain(unittest.TestCase):
+    def test_writer_never_blocks_on_full_stderr(self):
+        surface = pygame.Surface((256, 256), 0, 32)
+        sink = NoisyFrameSink("unused.mp4", threaded=True)
+
+        def render():
+            for i in range(60):
+                surface.fill((i, i, i))
+                sink.write(surface)
+            sink.close()
+
+        worker = threading.Thread(target=render, daemon=True)
+        worker.start()
+        worker.join(timeout=30)
+
+        self.assertFalse(worker.is_alive(), "frame writer blocked on ffmpeg stderr")
+        self.assertGreaterEqual(sink.stderr.bytes_read, 8 * 1024 * 1024)
+        self.assertEqual(sink.progress.frame, 42)
+        self.assertAlmostEqual(sink.progress.fps, 30.5)
+        self.assertAlmostEqual(sink.progress.speed, 1.5)
+
+    def test_progress_key_value_blocks(self):
+        r, w = os.pipe()
+        with os.fdopen(w, "wb") as writer:
+            writer.write(b"frame=120\nfps=59.94\nbitrate=   1.2kbits/s\nspeed=2.01x\nprogress=continue\n")
+            writer.write(b"[libx264 @ 0x1] final ratefactor: 20.1\n")
+        drain = StderrDrain(os.fdopen(r, "rb"))
+        drain.join(timeout=5)
+
+        progress = drain.progress
+        self.assertEqual(progress.frame, 120)
+        self.assertAlmostEqual(progress.fps, 59.94)
+        self.assertAlmostEqual(progress.speed, 2.01)
+        # Only real log lines end up in the ring buffer
+        self.assertEqual(drain.tail(), "[libx264 @ 0x1] final ratefactor: 20.1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+# Add mvp/ to path to import the common package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from common import worker_pool
+from common.worker_pool import AdaptiveWorkerPool, available_memory_mb, total_memory_mb
+
+
+def allocate(index, mb):
+    block = bytearray(mb * 2**20)
+    block[::4096] = b"x" * len(block[::4096]) # Touch every page
+    return index * 10
+
+
+def fail(index, mb):
+    raise ValueError(f"job {index} failed")
+
+
+class TestAdaptiveWorkerPool(unittest.TestCase):
+    def test_memory_probes(self):
+        self.assertGreater(total_memory_mb(), 0)
+        self.assertGreater(available_memory_mb(), 0)
+        self.assertLessEqual(available_memory_mb(), total_memory_mb())
+
+    def test_runs_jobs_and_logs_peak_rss(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, "stats.csv")
+            pool = AdaptiveWorkerPool(allocate, log_path=log, max_workers=2, poll_interval=0.1)
+            results = pool.run([(i, 64) for i in range(3)])
+
+            self.assertEqual(results, [0, 10, 20])
+            self.assertGreaterEqual(pool.job_peak_mb, 64)
+            self.assertGreaterEqual(pool.workers, 1)
+            with open(log) as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(sorted(int(r["job"]) for r in rows), [0, 1, 2])
+            for row in rows:
+                self.assertEqual(row["status"], "ok")
+                self.assertGreaterEqual(float(row["peak_rss_mb"]), 64)
+                self.assertGreaterEqual(float(row["cpu_s"]), 0)
+            # Every job ran in its own process
+            self.assertEqual(len({r["pid"] for r in rows}), 3)
+
+    def test_fresh_processes_before_python_3_11(self):
+        # The CI interpreter (3.10) has no max_tasks_per_child
+        saved = worker_pool.TASKS_PER_CHILD
+        worker_pool.TASKS_PER_CHILD = False
+        try:
+            pool = AdaptiveWorkerPool(allocate, max_workers=2, poll_interval=0.1)
+            self.assertEqual(pool.run([(i, 8) for i in range(4)]), [0, 10, 20, 30])
+        finally:
+            worker_pool.TASKS_PER_CHILD = saved
+        self.assertEqual(len({row["pid"] for row in pool.stats}), 4)
+        self.assertTrue(all(row["status"] == "ok" for row in pool.stats))
+
+    def test_no_new_jobs_under_memory_threshold(self):
+        pool = AdaptiveWorkerPool(allocate, max_workers=4)
+        pool.workers = 4
+        pool.job_peak_mb = 100
+        pool.low_memory_mb = available_memory_mb() + 10**6
+        self.assertTrue(pool.can_start(0))
+        self.assertFalse(pool.can_start(1))
+        pool.low_memory_mb = 0
+        self.assertTrue(pool.can_start(3))
+        self.assertFalse(pool.can_start(4))
+
+    def test_errors_are_returned(self):
+        pool = AdaptiveWorkerPool(fail, max_workers=1, poll_interval=0.1)
+        results = pool.run([(0, 1), (1, 1)])
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertTrue(all(r["status"].startswith("error") for r in pool.stats))
+
+
+if __name__ == "__main__":
+    unittest.main()
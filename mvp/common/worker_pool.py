@@ -0,0 +1,217 @@
+"""
+Worker Pool Module.
+RAM-aware process pool for batch video jobs.
+
+The first job runs alone and its peak RSS (the job process plus its
+largest child, i.e. FFmpeg) is measured with `resource.getrusage`. The pool
+is then sized from physical memory and CPU count, and before each new job
+is started the available memory is checked again: a job that would push it
+under `low_memory_mb` waits, so fewer jobs run at once.
+
+Every job runs in a fresh process (`max_tasks_per_child=1` on Python 3.11+,
+a single-use executor per job before), so its ru_maxrss is its own. Per-job peak RSS, wall time and CPU time are appended
+to a CSV for capacity planning.
+"""
+
+import concurrent.futures
+import csv
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# ProcessPoolExecutor(max_tasks_per_child=...) is new in Python 3.11 (CI runs 3.10)
+TASKS_PER_CHILD = sys.version_info >= (3, 11)
+
+CSV_FIELDS = ["job", "pid", "status", "peak_rss_mb", "child_peak_rss_mb", "wall_s", "cpu_s",
+              "running", "available_mb", "finished_at"]
+
+
+def total_memory_mb() -> float:
+    """Physical memory (os.sysconf)."""
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2**20
+
+
+def available_memory_mb() -> float:
+    """MemAvailable from /proc/meminfo (free pages via os.sysconf elsewhere)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES") / 2**20
+
+
+def _maxrss_mb(who: int) -> float:
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    scale = 1 if os.uname().sysname == "Darwin" else 1024
+    return resource.getrusage(who).ru_maxrss * scale / 2**20
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _measured_call(fn: Callable, args: Tuple) -> Tuple[Any, Dict[str, float]]:
+    """Runs in the worker process: fn(*args) plus its resource usage."""
+    wall0, cpu0 = time.perf_counter(), _cpu_seconds()
+    result = fn(*args)
+    stats = {
+        "pid": os.getpid(),
+        "peak_rss_mb": round(_maxrss_mb(resource.RUSAGE_SELF), 1),
+        # Largest single (waited-for) child, e.g. the FFmpeg encoder
+        "child_peak_rss_mb": round(_maxrss_mb(resource.RUSAGE_CHILDREN), 1),
+        "wall_s": round(time.perf_counter() - wall0, 2),
+        "cpu_s": round(_cpu_seconds() - cpu0, 2),
+    }
+    return result, stats
+
+
+class _SingleUseExecutor:
+    """
+    ProcessPoolExecutor stand-in for Python < 3.11: every submit() gets its
+    own one-worker executor, shut down as soon as the job is done.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers # Callers limit concurrency themselves
+        self._executors: List[concurrent.futures.ProcessPoolExecutor] = []
+
+    def submit(self, fn: Callable, *args) -> concurrent.futures.Future:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+        self._executors.append(executor)
+        future = executor.submit(fn, *args)
+        future.add_done_callback(lambda _: executor.shutdown(wait=False))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        self._executors = []
+        return False
+
+
+def fresh_process_executor(max_workers: int):
+    """An executor that runs every job in a new process."""
+    if TASKS_PER_CHILD:
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1)
+    return _SingleUseExecutor(max_workers)
+
+
+class AdaptiveWorkerPool:
+    """
+    Runs fn(*args) for every job, as many at once as memory and CPUs allow.
+
+    reserve_mb: memory kept free for the OS and the parent.
+    low_memory_mb: no new job is started if it would leave less memory available.
+    headroom: safety factor applied to the measured peak RSS of a job.
+    """
+
+    def __init__(self, fn: Callable, log_path: Optional[Union[str, Path]] = None,
+                 max_workers: Optional[int] = None, reserve_mb: float = 1024.0,
+                 low_memory_mb: float = 1536.0, headroom: float = 1.25,
+                 poll_interval: float = 1.0):
+        self.fn = fn
+        self.log_path = Path(log_path) if log_path else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.reserve_mb = reserve_mb
+        self.low_memory_mb = low_memory_mb
+        self.headroom = headroom
+        self.poll_interval = poll_interval
+        self.job_peak_mb = 0.0 # Largest job footprint seen so far
+        self.workers = 1
+        self.stats: List[Dict[str, Any]] = []
+        self._started: Dict[int, Tuple[int, float]] = {} # job -> (jobs running, available MB) at start
+
+    def pool_size(self) -> int:
+        """Workers that fit in physical memory (and CPUs) for the measured job peak."""
+        per_job = max(self.job_peak_mb * self.headroom, 1.0)
+        fit = int((total_memory_mb() - self.reserve_mb) // per_job)
+        return max(1, min(self.max_workers, os.cpu_count() or 1, fit))
+
+    def can_start(self, running: int) -> bool:
+        """
+        True if one more job may start next to `running` ones: the pool is
+        not full and the new job would leave at least low_memory_mb available.
+        One job is always allowed, so the batch keeps moving.
+        """
+        if running >= self.workers:
+            return False
+        if running == 0:
+            return True
+        per_job = self.job_peak_mb * self.headroom
+        return available_memory_mb() - per_job >= self.low_memory_mb
+
+    def run(self, jobs: Sequence[Tuple], on_result: Optional[Callable[[Any], None]] = None) -> List[Any]:
+        """Runs all jobs (tuples of args). Returns results in job order."""
+        results: List[Any] = [None] * len(jobs)
+        if not jobs:
+            return results
+
+        with fresh_process_executor(self.max_workers) as executor:
+            # 1. Probe: the first job alone gives the peak RSS of a job
+            self._started[0] = (1, available_memory_mb())
+            self._finish(0, executor.submit(_measured_call, self.fn, jobs[0]), results, on_result)
+            self.workers = self.pool_size()
+            print(f"🧮 Job peak {self.job_peak_mb:.0f} MB, {total_memory_mb():.0f} MB RAM, "
+                  f"{os.cpu_count()} CPUs -> {self.workers} workers")
+
+            # 2. The rest, never more at once than memory allows
+            pending = list(range(1, len(jobs)))
+            running: Dict[concurrent.futures.Future, int] = {}
+            throttled = False
+            while pending or running:
+                while pending and self.can_start(len(running)):
+                    index = pending.pop(0)
+                    self._started[index] = (len(running) + 1, available_memory_mb())
+                    running[executor.submit(_measured_call, self.fn, jobs[index])] = index
+                # Scale down: running jobs finish, no new ones start until memory is back
+                low = bool(pending) and len(running) < self.workers
+                if low != throttled:
+                    if low:
+                        print(f"⚠️ Low memory ({available_memory_mb():.0f} MB available): "
+                              f"{len(running)} of {self.workers} workers")
+                    throttled = low
+
+                done, _ = concurrent.futures.wait(running, timeout=self.poll_interval,
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    self._finish(running.pop(future), future, results, on_result)
+        return results
+
+    def _finish(self, index: int, future: concurrent.futures.Future, results: List[Any],
+                on_result: Optional[Callable[[Any], None]]) -> None:
+        running, available = self._started.pop(index)
+        row: Dict[str, Any] = {"job": index, "running": running, "available_mb": round(available),
+                               "finished_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+        try:
+            result, stats = future.result()
+            row.update(stats, status="ok")
+            self.job_peak_mb = max(self.job_peak_mb, stats["peak_rss_mb"] + stats["child_peak_rss_mb"])
+        except Exception as e:
+            result = e
+            row.update(status=f"error: {e}")
+        results[index] = result
+        self.stats.append(row)
+        self._log(row)
+        if on_result is not None:
+            on_result(result)
+
+    def _log(self, row: Dict[str, Any]) -> None:
+        if self.log_path is None:
+            return
+        new_file = not self.log_path.exists()
+        with open(self.log_path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            if new_file:
+                writer.writeheader()
+            writer.writerow({k: row.get(k, "") for k in CSV_FIELDS})
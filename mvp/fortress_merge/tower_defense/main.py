@@ -76,8 +76,7 @@ def main(output_file=None):
         renderer.render(engine)
         
         # Capture
-        frame_data = renderer.get_frame_data()
-        encoder.write_frame(frame_data)
+        encoder.write_surface(renderer.surface)
         
         # Check End Game
         if engine.game_over:
@@ -85,7 +84,7 @@ def main(output_file=None):
             # Record a few more frames of the Game Over screen
             for _ in range(90): # 1.5 second linger
                 renderer.render(engine)
-                encoder.write_frame(renderer.get_frame_data())
+                encoder.write_surface(renderer.surface)
             break
 
         # Stats
@@ -1,10 +1,14 @@
 """
 FFmpeg Video Encoder Wrapper
 """
-import subprocess
 import os
+import sys
 from sim import config
 
+# Shared helpers live in mvp/common
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from common.frame_sink import FrameSink
+
 class VideoEncoder:
     def __init__(self, output_path: str):
         self.output_path = output_path
@@ -16,39 +20,18 @@ class VideoEncoder:
     def start(self):
         # Ensure output directory exists
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        
-        command = [
-            'ffmpeg',
-            '-y', # Overwrite
-            '-f', 'rawvideo',
-            '-vcodec', 'rawvideo',
-            '-s', f'{self.width}x{self.height}',
-            '-pix_fmt', 'rgb24',
-            '-r', str(self.fps),
-            '-i', '-', # Input from pipe
-            '-c:v', 'libx264',
-            '-pix_fmt', 'yuv420p',
-            '-preset', 'fast',
-            '-crf', '18', # High quality
-             self.output_path
-        ]
-        
-        self.process = subprocess.Popen(
-            command,
-            stdin=subprocess.PIPE,
-            stderr=subprocess.PIPE 
-            # Note: stderr=PIPE might fill up buffer if we don't read it. 
-            # Safest is usually None or handle generic output.
-            # But for debugging let's keep it.
-        )
+
+        # FFmpeg itself is spawned on the first frame, once the pixel layout is known.
+        # Frames are pushed by a writer thread so encoding overlaps the simulation.
+        self.process = FrameSink(self.output_path, fps=self.fps, preset='fast', crf=18)
         print(f"Started FFMPEG recording to {self.output_path}")
 
-    def write_frame(self, raw_data):
+    def write_surface(self, surface):
+        """Streams the surface memory straight to the encoder (no RGB conversion)."""
         if self.process:
-            self.process.stdin.write(raw_data)
+            self.process.write(surface)
 
     def finish(self):
         if self.process:
-            self.process.stdin.close()
-            self.process.wait()
+            self.process.close()
             print("Video encoding finished.")
@@ -6,15 +6,22 @@ import random
 import math
 import pymunk
 import pygame
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import config
 
+LAYER_COLORKEY = (255, 0, 255) # Transparent color of the baked layer (never an obstacle color)
+
 class ArenaGenerator:
-    def __init__(self, space: pymunk.Space):
+    def __init__(self, space: pymunk.Space, rng=random):
         self.space = space
+        self.rng = rng # random.Random of the match (or the random module)
         self.obstacles: List[pymunk.Shape] = []
         self.moving_bodies: List[pymunk.Body] = []
+        # Static shapes pre-rendered once per layout (surface, top-left)
+        self.static_layer: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self.moving_shapes: List[pymunk.Shape] = [] # Kinematic shapes, drawn every frame
+        self.layout: List[tuple] = [] # Creation calls, to rebuild the arena without the RNG
         
     def generate(self, difficulty: int = 1) -> str:
         """
@@ -31,7 +38,7 @@ class ArenaGenerator:
         
         # Weighted choice: less likely to get "empty"
         weights = [5, 20, 20, 20, 20, 10, 5]
-        layout = random.choices(layout_types, weights=weights, k=1)[0]
+        layout = self.rng.choices(layout_types, weights=weights, k=1)[0]
         
         print(f"🏟️ Generating Arena: {layout.upper()}")
         
@@ -47,9 +54,26 @@ class ArenaGenerator:
             self._create_spinners()
         elif layout == "funnel":
             self._create_funnel()
+
+        # Bake now when rendering; simulate-only matches never draw
+        if pygame.display.get_surface() is not None:
+            self.bake_static_layer()
             
         return layout
 
+    @classmethod
+    def from_layout(cls, space: pymunk.Space, layout: List[tuple]) -> "ArenaGenerator":
+        """Rebuilds an arena from another one's `layout` (replays)."""
+        arena = cls(space)
+        for kind, *args in layout:
+            if kind == "box":
+                body = arena._create_box(*args)
+                if body.body_type != pymunk.Body.STATIC:
+                    arena.moving_bodies.append(body)
+            elif kind == "circle":
+                arena._create_circle(*args)
+        return arena
+
     def update(self) -> None:
         """Update logic for moving obstacles (spinners, etc)."""
         # Physics engine handles rotation, but we can enforce constant velocity here if needed
@@ -59,27 +83,65 @@ class ArenaGenerator:
                 body.angular_velocity = body.angular_velocity_target
 
     def draw(self, screen: pygame.Surface) -> None:
-        """Draw obstacles."""
+        """Draw obstacles: the baked static layer, then the moving ones."""
+        if self.static_layer is None:
+            self.bake_static_layer()
+        layer, origin = self.static_layer
+        if layer is not None:
+            screen.blit(layer, origin)
+        for shape in self.moving_shapes:
+            self._draw_shape(screen, shape)
+
+    def draw_unbaked(self, screen: pygame.Surface) -> None:
+        """Draws every obstacle shape by shape (reference for the baked layer)."""
         for shape in self.obstacles:
-            color = (80, 80, 90) # Dark concrete color
-            if hasattr(shape, "color"):
-                color = shape.color
-
-            if isinstance(shape, pymunk.Poly):
-                # Convert physics coordinates to screen coordinates
-                points = []
-                for v in shape.get_vertices():
-                    p = shape.body.local_to_world(v)
-                    points.append((int(p.x), int(p.y)))
-                pygame.draw.polygon(screen, color, points)
-                pygame.draw.polygon(screen, (200, 200, 200), points, 2) # Highlight edge
-            
-            elif isinstance(shape, pymunk.Circle):
-                pos = shape.body.position
-                p = (int(pos.x), int(pos.y))
-                r = int(shape.radius)
-                pygame.draw.circle(screen, color, p, r)
-                pygame.draw.circle(screen, (200, 200, 200), p, r, 2)
+            self._draw_shape(screen, shape)
+
+    def bake_static_layer(self) -> None:
+        """Renders the static obstacles once, cropped to their bounding box."""
+        static = [s for s in self.obstacles if s.body.body_type == pymunk.Body.STATIC]
+        self.moving_shapes = [s for s in self.obstacles if s.body.body_type != pymunk.Body.STATIC]
+        if not static:
+            self.static_layer = (None, (0, 0))
+            return
+        # Bounding box of the shapes plus a margin for the 2px outline
+        bbs = [s.cache_bb() for s in static]
+        left = int(math.floor(min(bb.left for bb in bbs))) - 2
+        top = int(math.floor(min(bb.bottom for bb in bbs))) - 2
+        right = int(math.ceil(max(bb.right for bb in bbs))) + 3
+        bottom = int(math.ceil(max(bb.top for bb in bbs))) + 3
+
+        # Colorkey + RLE: transparent runs are skipped, far cheaper than per-pixel alpha
+        layer = pygame.Surface((right - left, bottom - top))
+        layer.fill(LAYER_COLORKEY)
+        for shape in static:
+            self._draw_shape(layer, shape, (left, top))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        self.static_layer = (layer, (left, top))
+
+    def _draw_shape(self, surface: pygame.Surface, shape: pymunk.Shape, origin: Tuple[int, int] = (0, 0)) -> None:
+        ox, oy = origin
+        color = (80, 80, 90) # Dark concrete color
+        if hasattr(shape, "color"):
+            color = shape.color
+
+        if isinstance(shape, pymunk.Poly):
+            # Convert physics coordinates to screen coordinates
+            points = []
+            for v in shape.get_vertices():
+                p = shape.body.local_to_world(v)
+                points.append((int(p.x) - ox, int(p.y) - oy))
+            pygame.draw.polygon(surface, color, points)
+            pygame.draw.polygon(surface, (200, 200, 200), points, 2) # Highlight edge
+        
+        elif isinstance(shape, pymunk.Circle):
+            pos = shape.body.position
+            p = (int(pos.x) - ox, int(pos.y) - oy)
+            r = int(shape.radius)
+            pygame.draw.circle(surface, color, p, r)
+            pygame.draw.circle(surface, (200, 200, 200), p, r, 2)
 
     def clear(self) -> None:
         """Remove all obstacles from space."""
@@ -87,11 +149,15 @@ class ArenaGenerator:
             self.space.remove(shape, shape.body)
         self.obstacles.clear()
         self.moving_bodies.clear()
+        self.moving_shapes = []
+        self.layout.clear()
+        self.static_layer = None
 
     # --- Layout Algorithms ---
 
     def _create_box(self, x: float, y: float, w: float, h: float, angle: float = 0.0, dynamic: bool = False) -> pymunk.Body:
         """Helper to create a box obstacle."""
+        self.layout.append(("box", x, y, w, h, angle, dynamic))
         mass = 1000 if dynamic else 0
         moment = pymunk.moment_for_box(mass, (w, h)) if dynamic else float('inf')
         body_type = pymunk.Body.KINEMATIC if dynamic else pymunk.Body.STATIC
@@ -111,6 +177,7 @@ class ArenaGenerator:
 
     def _create_circle(self, x: float, y: float, r: float) -> None:
         """Helper to create a static circle peg."""
+        self.layout.append(("circle", x, y, r))
         body = pymunk.Body(body_type=pymunk.Body.STATIC)
         body.position = (x, y)
         
@@ -124,11 +191,11 @@ class ArenaGenerator:
 
     def _create_columns(self) -> None:
         """Random pillars."""
-        for _ in range(random.randint(4, 8)):
-            x = random.randint(100, config.WIDTH - 100)
-            y = random.randint(100, config.HEIGHT - 100)
-            w = random.randint(50, 150)
-            h = random.randint(50, 150)
+        for _ in range(self.rng.randint(4, 8)):
+            x = self.rng.randint(100, config.WIDTH - 100)
+            y = self.rng.randint(100, config.HEIGHT - 100)
+            w = self.rng.randint(50, 150)
+            h = self.rng.randint(50, 150)
             self._create_box(x, y, w, h)
 
     def _create_central_block(self) -> None:
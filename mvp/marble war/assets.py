@@ -12,6 +12,7 @@ import sys
 import pygame
 
 import config
+from effects import ExplosionAtlas
 
 
 # ============================================================================
@@ -21,9 +22,10 @@ import config
 class AssetManager:
     """Centralized asset loading to eliminate duplication."""
     
-    def __init__(self) -> None:
+    def __init__(self, rng=random) -> None:
         # Base path resolution (Robust Fix)
         self.root_dir = Path(__file__).resolve().parent
+        self.rng = rng # Soundtrack choice
         
         self.powerup_images: Dict[str, pygame.Surface] = {}
         self.projectile_img: Optional[pygame.Surface] = None
@@ -31,6 +33,7 @@ class AssetManager:
         self.bomb_img: Optional[pygame.Surface] = None
         self.face_assets: Dict[str, pygame.Surface] = {}
         self.weapon_img: Optional[pygame.Surface] = None
+        self.explosion_atlases: Dict[int, ExplosionAtlas] = {} # id(image) -> atlas
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
     
     def get_path(self, relative_path: str) -> str:
@@ -39,11 +42,16 @@ class AssetManager:
 
     def load_all(self) -> None:
         """Load all game assets."""
+        self.load_images()
+        self._load_sounds()
+        self._setup_background_music()
+
+    def load_images(self) -> None:
+        """Only what the renderer draws (no sounds, no soundtrack choice)."""
         self._load_powerup_images()
         self._load_combat_assets()
         self._load_face_assets()
-        self._load_sounds()
-        self._setup_background_music()
+        self._build_explosion_atlases()
     
     def _load_powerup_images(self) -> None:
         """Load power-up icons."""
@@ -115,6 +123,19 @@ class AssetManager:
             except Exception as e:
                 print(f"Warning: Could not load face asset {path}: {e}")
 
+    def _build_explosion_atlases(self) -> None:
+        """Pre-fade the images explosions use (explosion, dead face)."""
+        for img in (self.explosion_img, self.face_assets.get("morto")):
+            if img is not None:
+                self.explosion_atlas(img)
+
+    def explosion_atlas(self, image: pygame.Surface) -> ExplosionAtlas:
+        """Atlas of image (built on first use for images not pre-faded)."""
+        atlas = self.explosion_atlases.get(id(image))
+        if atlas is None:
+            atlas = self.explosion_atlases[id(image)] = ExplosionAtlas(image)
+        return atlas
+
     def _load_and_scale(self, path: str, size: int, is_absolute: bool = False) -> pygame.Surface:
         """Helper to load and scale image."""
         full_path = path if is_absolute else self.get_path(path)
@@ -139,17 +160,24 @@ class AssetManager:
             except Exception as e:
                 print(f"Warning: Could not load sound {rel_path}: {e}")
     
-    def _setup_background_music(self) -> None:
-        """Select and trim background music."""
+    def choose_soundtrack(self) -> Optional[Path]:
+        """Random track from trilha_sonora (None if there is none)."""
         music_dir = self.root_dir / "trilha_sonora"
         if not music_dir.exists():
-            return
+            return None
         
         mp3_files = list(music_dir.glob("*.mp3"))
         if not mp3_files:
+            return None
+        
+        return self.rng.choice(mp3_files)
+    
+    def _setup_background_music(self) -> None:
+        """Select and trim background music."""
+        chosen = self.choose_soundtrack()
+        if chosen is None:
             return
         
-        chosen = random.choice(mp3_files)
         output_path = self.root_dir / "assets/music/current_bg_trimmed.mp3"
         
         print(f"Selected soundtrack: {chosen.name}")
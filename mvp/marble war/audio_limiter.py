@@ -0,0 +1,81 @@
+"""
+Audio Limiter Module.
+Streaming look-ahead peak limiter (numpy block processing).
+
+The gain needed to keep every sample under the ceiling is computed per
+sample, spread over the look-ahead window (attack), released exponentially,
+and applied to the signal delayed by the look-ahead. Blocks of any size can
+be fed in; the output of `process()` is the input delayed by `latency` samples.
+"""
+
+import numpy as np
+from scipy.ndimage import minimum_filter1d
+
+
+class LookaheadLimiter:
+    """Stereo-linked look-ahead limiter for float (n, channels) blocks."""
+
+    def __init__(self, samplerate: int = 48000, ceiling: float = 0.97,
+                 attack_ms: float = 5.0, release_ms: float = 50.0):
+        self.samplerate = samplerate
+        self.ceiling = ceiling
+        self.latency = max(1, int(samplerate * attack_ms / 1000.0))
+        # Per-sample decay of the gain reduction (log domain)
+        self._log_release = -1.0 / max(1.0, samplerate * release_ms / 1000.0)
+        self.reset()
+
+    def reset(self, channels: int = 2):
+        self._pending = np.zeros((self.latency, channels), dtype=np.float32)
+        self._gain_hist = np.ones(self.latency - 1, dtype=np.float64)
+        self._reduction = 0.0 # 1 - gain after release, at the last sample
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Limits one block. Returns as many samples as it was given, delayed by `latency`."""
+        if len(block) == 0:
+            return block.astype(np.float32)
+
+        L = self.latency
+        x = np.concatenate([self._pending, np.asarray(block, dtype=np.float32)])
+        n_out = len(x) - L
+
+        # 1. Gain that keeps each sample under the ceiling
+        peak = np.max(np.abs(x), axis=1)
+        with np.errstate(divide="ignore"):
+            required = np.minimum(1.0, self.ceiling / peak)
+
+        # 2. Look-ahead: min over [j, j + L] (the filter is centered, so shift it)
+        half = (L + 1) // 2
+        target = minimum_filter1d(required, size=L + 1)[half:half + n_out]
+
+        # 3. Release: reduction[j] = max(1 - target[j], reduction[j-1] * a)
+        #    as a running max in the log domain (no per-sample Python loop)
+        steps = np.arange(n_out) * self._log_release
+        with np.errstate(divide="ignore"):
+            log_red = np.log(1.0 - target) - steps
+            carry = np.log(self._reduction) + self._log_release if self._reduction > 0 else -np.inf
+        log_red[0] = max(log_red[0], carry)
+        reduction = np.exp(np.maximum.accumulate(log_red) + steps)
+        self._reduction = float(reduction[-1])
+        gain = 1.0 - reduction
+
+        # 4. Attack: moving average over L samples (ramps in before the peak)
+        hist = np.concatenate([self._gain_hist, gain])
+        csum = np.concatenate([[0.0], np.cumsum(hist)])
+        smooth = (csum[L:] - csum[:-L]) / L
+        self._gain_hist = hist[-(L - 1):] if L > 1 else hist[:0]
+
+        out = x[:n_out] * smooth[:, None].astype(np.float32)
+        self._pending = x[n_out:]
+        # Guard against float rounding right at the ceiling
+        return np.clip(out, -self.ceiling, self.ceiling)
+
+    def flush(self) -> np.ndarray:
+        """Pushes out the `latency` samples still held in the delay line."""
+        return self.process(np.zeros_like(self._pending))
+
+    def process_track(self, track: np.ndarray, block_size: int = 48000) -> np.ndarray:
+        """Whole track in blocks, latency compensated (same length as the input)."""
+        self.reset(track.shape[1])
+        blocks = [self.process(track[i:i + block_size]) for i in range(0, len(track), block_size)]
+        blocks.append(self.flush())
+        return np.concatenate(blocks)[self.latency:]
@@ -0,0 +1,118 @@
+"""
+Audio Mixer Module.
+Vectorized SFX event mixer used by AudioRenderer.
+
+Events are grouped by (sound, pitch bucket). Each resampled kernel is built
+once and cached (the old loop resampled it for every event). Inside a group,
+hits that start on the same sample (events are logged per frame, so this is
+common) are merged with `np.add.at` on their gains, then each distinct
+offset is scattered into the float32 output with one slice-add.
+
+A fully index-based scatter (np.add.at / np.bincount over events x taps)
+was measured at ~4x slower than slice-adds: it is memory bound on the
+int64 index arrays.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Pitch variation range and resolution (21 buckets = 1% steps)
+PITCH_MIN = 0.9
+PITCH_MAX = 1.1
+PITCH_BUCKETS = 21
+
+
+def resample(kernel: np.ndarray, pitch: float) -> np.ndarray:
+    """Nearest-sample pitch shift (same indexing as the original per-event loop)."""
+    if pitch == 1.0:
+        return kernel
+    indices = np.round(np.arange(0, len(kernel), pitch)).astype(int)
+    indices = indices[indices < len(kernel)]
+    return kernel[indices]
+
+
+def quantize_pitch(pitch: float) -> int:
+    """Pitch -> bucket index in [0, PITCH_BUCKETS)."""
+    step = (PITCH_MAX - PITCH_MIN) / (PITCH_BUCKETS - 1)
+    bucket = int(round((pitch - PITCH_MIN) / step))
+    return min(PITCH_BUCKETS - 1, max(0, bucket))
+
+
+def bucket_pitch(bucket: int) -> float:
+    step = (PITCH_MAX - PITCH_MIN) / (PITCH_BUCKETS - 1)
+    return round(PITCH_MIN + bucket * step, 6)
+
+
+class EventMixer:
+    """Mixes audio events into a float32 stereo buffer."""
+
+    def __init__(self, kernels: Dict[str, np.ndarray], samplerate: int = 48000, rng=random,
+                 pitched: Optional[Dict[Tuple[str, int], np.ndarray]] = None):
+        """pitched: pre-resampled kernels keyed (name, bucket), e.g. from an SfxBank."""
+        self.kernels = kernels
+        self.samplerate = samplerate
+        self.rng = rng # Pitch of events without an explicit one
+        self._cache: Dict[Tuple[str, int], np.ndarray] = dict(pitched) if pitched else {}
+
+    def kernel(self, name: str, bucket: int) -> Optional[np.ndarray]:
+        """Resampled float32 stereo kernel for (sound, pitch bucket), cached."""
+        key = (name, bucket)
+        cached = self._cache.get(key)
+        if cached is None:
+            base = self.kernels.get(name)
+            if base is None:
+                return None
+            cached = np.ascontiguousarray(resample(base, bucket_pitch(bucket)), dtype=np.float32)
+            self._cache[key] = cached
+        return cached
+
+    def mix(self, events: List[dict], num_samples: int) -> np.ndarray:
+        """New (num_samples, 2) float32 buffer with all events mixed in."""
+        out = np.zeros((num_samples, 2), dtype=np.float32)
+        self.mix_into(out, events)
+        return out
+
+    def mix_into(self, out: np.ndarray, events: List[dict], offset: int = 0) -> None:
+        """
+        Adds events to `out` (n, 2), whose row 0 is sample `offset`.
+        Samples falling outside the buffer are dropped.
+        An event may carry an explicit "pitch"; otherwise one is drawn.
+        """
+        groups: Dict[Tuple[str, int], List[Tuple[int, float, float]]] = {}
+        for evt in events:
+            name = evt["name"]
+            if name not in self.kernels:
+                continue
+            pitch = evt.get("pitch")
+            if pitch is None:
+                pitch = self.rng.uniform(PITCH_MIN, PITCH_MAX)
+            x_pos = evt.get("x", 0.5)
+            vol = evt["vol"]
+            start = int(evt["t"] * self.samplerate) - offset
+            groups.setdefault((name, quantize_pitch(pitch)), []).append(
+                (start, (1.0 - x_pos) * vol, x_pos * vol))
+
+        for (name, bucket), hits in groups.items():
+            data = np.asarray(hits, dtype=np.float64)
+            self._scatter(out, self.kernel(name, bucket),
+                          data[:, 0].astype(np.int64), data[:, 1:].astype(np.float32))
+
+    def _scatter(self, out: np.ndarray, kernel: np.ndarray,
+                 starts: np.ndarray, gains: np.ndarray) -> None:
+        n = len(out)
+        length = len(kernel)
+        keep = (starts < n) & (starts + length > 0)
+        if not keep.any():
+            return
+
+        # Merge hits sharing an offset: same kernel, gains just add up
+        offsets, inverse = np.unique(starts[keep], return_inverse=True)
+        merged = np.zeros((len(offsets), 2), dtype=np.float32)
+        np.add.at(merged, inverse, gains[keep])
+
+        for start, gain in zip(offsets.tolist(), merged):
+            lo = max(start, 0)
+            hi = min(start + length, n)
+            out[lo:hi] += kernel[lo - start:hi - start] * gain
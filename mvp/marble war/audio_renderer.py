@@ -9,103 +9,87 @@ import subprocess
 import numpy as np
 from scipy.io import wavfile
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Optional
 
 import config
+from audio_limiter import LookaheadLimiter
+from audio_mixer import EventMixer, PITCH_MAX, PITCH_MIN, resample
+from sfx_bank import SfxBank
+from span_tracer import TRACER
 
 class AudioRenderer:
-    def __init__(self):
+    SAMPLERATE = 48000
+    
+    def __init__(self, engine: str = "vector", limiter: str = "lookahead",
+                 rng: Optional[random.Random] = None, bank: Optional[SfxBank] = None):
+        """
+        engine: "vector" (EventMixer) or "loop" (reference per-event loop).
+        limiter: "lookahead" (LookaheadLimiter) or "normalize" (global peak normalization).
+        rng: source of the random pitch variation; reseed it with the match
+        seed (rng.seed(seed)) to reproduce a soundtrack.
+        bank: decoded SFX + background music (e.g. attached from shared
+        memory by a batch worker). Loaded from the on-disk cache when None.
+        """
         print("🔊 Initializing Audio Renderer...")
         self.root_dir = Path(__file__).parent
-        self.samplerate = 48000
-        self.sfx_kernels = self._load_assets()
+        self.samplerate = self.SAMPLERATE
+        self.engine = engine
+        self.limiter = limiter
+        self.bank = bank if bank is not None else SfxBank.load(self.root_dir, self.samplerate)
+        self.sfx_kernels = self.bank.kernels
+        self.rng = rng if rng is not None else random.Random()
+        self.mixer = EventMixer(self.sfx_kernels, self.samplerate, self.rng, pitched=self.bank.pitched)
         
-    def _load_assets(self) -> Dict[str, np.ndarray]:
-        """Load all SFX into memory once."""
-        kernels = {}
-        
-        # 1. Load SFX
-        sound_files = config.AUDIO_PATHS.copy()
-        # Remove BG from SFX list to handle separately (or keep it if logic changes)
-        # In current logic, BG is handled dynamically per video or fixed.
-        
-        for name, rel_path in sound_files.items():
-            if name == "bg": continue # Handle BG separately
-            
-            path = self.root_dir / rel_path
-            if path.exists():
-                try:
-                    sr, data = wavfile.read(str(path))
-                    # Normalize to int16 range if needed (scipy reads as is)
-                    if data.dtype != np.int16:
-                        if data.dtype == np.float32:
-                            data = (data * 32767).astype(np.int16)
-                    
-                    # Ensure Stereo
-                    if len(data.shape) == 1:
-                        data = np.stack([data, data], axis=1)
-                        
-                    kernels[name] = data
-                except Exception as e:
-                    print(f"⚠️ Failed to load SFX {path}: {e}")
-            else:
-                print(f"⚠️ SFX missing: {path}")
-                
-        return kernels
+    def open_stream(self) -> "AudioStream":
+        """Incremental mixer for the single-pass (video + audio) pipeline."""
+        return AudioStream(self)
+
+    def _event_kernel(self, evt: dict) -> Optional[np.ndarray]:
+        """Pitched, panned and scaled stereo kernel for one event (float64)."""
+        kernel = self.sfx_kernels.get(evt["name"])
+        if kernel is None:
+            return None
+        # Get X position for panning (0.0 to 1.0)
+        # Default to center (0.5) if not provided
+        x_pos = evt.get("x", 0.5)
+
+        # Pitch Variation
+        pitch = evt.get("pitch")
+        if pitch is None:
+            pitch = self.rng.uniform(PITCH_MIN, PITCH_MAX)
+        kernel_pitched = resample(kernel, pitch)
 
-    def render(self, events: List[dict], video_path: Path, output_path: Path):
-        """Render audio for a specific video with Spatial Panning."""
+        # SPATIAL PANNING LOGIC
+        # Left volume = 1.0 - x_pos, Right volume = x_pos
+        kernel_panned = kernel_pitched.astype(np.float64)
+        kernel_panned[:, 0] *= (1.0 - x_pos) # Left channel
+        kernel_panned[:, 1] *= x_pos # Right channel
+        return kernel_panned * evt["vol"]
+
+    def render(self, events: List[dict], video_path: Path, output_path: Path,
+               duration: Optional[float] = None):
+        """
+        Render audio for a specific video with Spatial Panning.
+        `duration` (seconds) skips the ffprobe call when the frame count is known.
+        """
         print(f"🎵 Rendering Spatial Audio for {video_path.name}...")
-        
-        duration = self._get_video_duration(video_path)
+        with TRACER.span("audio_render", events=len(events)):
+            self._render(events, video_path, output_path, duration)
+
+    def _render(self, events: List[dict], video_path: Path, output_path: Path,
+                duration: Optional[float]):
+        if duration is None:
+            duration = self._get_video_duration(video_path)
         if duration == 0:
             duration = max(e["t"] for e in events) + 2.0 if events else 10.0
                 
         num_samples = int(duration * self.samplerate)
-        bg_path = self.root_dir / config.AUDIO_PATHS.get("bg", "assets/music/bg_48.wav")
-        bg_track = self._prepare_bg(bg_path, num_samples)
+        bg_track = self._prepare_bg(self._bg_path(), num_samples)
         
-        sfx_track = np.zeros((num_samples, 2), dtype=np.float64)
-        
-        for evt in events:
-            name = evt["name"]
-            t = evt["t"]
-            vol = evt["vol"]
-            # Get X position for panning (0.0 to 1.0)
-            # Default to center (0.5) if not provided
-            x_pos = evt.get("x", 0.5) 
-            
-            if name in self.sfx_kernels:
-                kernel = self.sfx_kernels[name]
-                
-                # Pitch Variation
-                pitch = random.uniform(0.9, 1.1)
-                if pitch != 1.0:
-                    indices = np.round(np.arange(0, len(kernel), pitch)).astype(int)
-                    indices = indices[indices < len(kernel)]
-                    kernel_pitched = kernel[indices]
-                else:
-                    kernel_pitched = kernel
-                
-                # SPATIAL PANNING LOGIC
-                # Left volume = 1.0 - x_pos, Right volume = x_pos
-                pan_l = 1.0 - x_pos
-                pan_r = x_pos
-                
-                start = int(t * self.samplerate)
-                end = start + len(kernel_pitched)
-                
-                if start >= num_samples: continue
-                if end > num_samples:
-                    kernel_pitched = kernel_pitched[:num_samples - start]
-                    end = num_samples
-                
-                # Apply Pan to kernel (assuming kernel is stereo)
-                kernel_panned = kernel_pitched.astype(np.float64)
-                kernel_panned[:, 0] *= pan_l # Left channel
-                kernel_panned[:, 1] *= pan_r # Right channel
-                    
-                sfx_track[start:end] += kernel_panned * vol
+        if self.engine == "loop":
+            sfx_track = self._mix_loop(events, num_samples)
+        else:
+            sfx_track = self.mixer.mix(events, num_samples)
 
         # 4. Mastering
         # BG Volume: 0.4, SFX: 1.0 (accumulated)
@@ -113,13 +97,7 @@ class AudioRenderer:
             bg_track = np.stack([bg_track, bg_track], axis=1)
             
         final_track = (bg_track.astype(np.float64) * 0.4) + sfx_track
-        
-        # Limiter
-        max_val = np.max(np.abs(final_track))
-        if max_val > 32767:
-            final_track = (final_track / max_val) * 32767
-            
-        final_int16 = final_track.astype(np.int16)
+        final_int16 = self._master(final_track)
         
         # 5. Export Temp Wav
         temp_wav = self.root_dir / f"temp_{output_path.stem}.wav"
@@ -132,6 +110,38 @@ class AudioRenderer:
         if temp_wav.exists():
             temp_wav.unlink()
 
+    def _master(self, track: np.ndarray) -> np.ndarray:
+        """Limiter stage: int16-scaled float mix -> int16."""
+        if self.limiter == "lookahead":
+            # Only the loud passages are turned down, the rest keeps its level
+            limited = LookaheadLimiter(self.samplerate).process_track(track / 32767.0)
+            return (limited * 32767).astype(np.int16)
+
+        # Global peak normalization: one loud hit ducks the whole track
+        max_val = np.max(np.abs(track))
+        if max_val > 32767:
+            track = (track / max_val) * 32767
+        return track.astype(np.int16)
+
+    def _mix_loop(self, events: List[dict], num_samples: int) -> np.ndarray:
+        """Reference mixer: one resample + slice-add per event (float64)."""
+        sfx_track = np.zeros((num_samples, 2), dtype=np.float64)
+        
+        for evt in events:
+            kernel = self._event_kernel(evt)
+            if kernel is None: continue
+
+            start = int(evt["t"] * self.samplerate)
+            end = start + len(kernel)
+
+            if start >= num_samples: continue
+            if end > num_samples:
+                kernel = kernel[:num_samples - start]
+                end = num_samples
+
+            sfx_track[start:end] += kernel
+        return sfx_track
+
     def _get_video_duration(self, video_path: Path) -> float:
         try:
             res = subprocess.run([
@@ -143,12 +153,25 @@ class AudioRenderer:
             print(f"⚠️ Could not probe duration: {e}")
             return 0.0
 
-    def _prepare_bg(self, path: Path, num_samples: int) -> np.ndarray:
+    def _bg_path(self) -> Path:
+        return self.root_dir / config.AUDIO_PATHS.get("bg", "assets/music/bg_48.wav")
+
+    def _load_bg(self, path: Path) -> Optional[np.ndarray]:
+        if path == self.bank.bg_path:
+            return self.bank.bg # Decoded once, shared by every video
         try:
             sr, bg_data = wavfile.read(str(path))
             if bg_data.dtype != np.int16:
                 bg_data = (bg_data * 32767).astype(np.int16)
         except:
+            return None
+        if len(bg_data) == 0:
+            return None
+        return bg_data
+
+    def _prepare_bg(self, path: Path, num_samples: int) -> np.ndarray:
+        bg_data = self._load_bg(path)
+        if bg_data is None:
             # Silent fallback
             return np.zeros((num_samples, 2), dtype=np.int16)
             
@@ -167,4 +190,66 @@ class AudioRenderer:
             "-shortest",
             str(output)
         ]
-        subprocess.run(cmd, check=True)
+        with TRACER.span("mux"):
+            subprocess.run(cmd, check=True)
+
+
+class AudioStream:
+    """
+    Rolling mixer used when audio is muxed in the same FFmpeg pass as the video.
+    Events are mixed as soon as they are logged; `advance()` hands out the
+    finished samples (float32 stereo, -1..1) up to a given sample index.
+
+    Mastering: with the "lookahead" limiter the output is delayed by its
+    look-ahead (5 ms, well under a frame). Global peak normalization needs the
+    whole track, so "normalize" falls back to a hard clip here.
+    """
+
+    def __init__(self, renderer: AudioRenderer):
+        self.renderer = renderer
+        self.samplerate = renderer.samplerate
+        self.position = 0 # First sample not emitted yet
+        # Pending SFX mix; row 0 is `self.position`
+        self._acc = np.zeros((0, 2), dtype=np.float32)
+
+        bg = renderer._load_bg(renderer._bg_path())
+        if bg is not None and len(bg.shape) == 1:
+            bg = np.stack([bg, bg], axis=1)
+        self._bg = bg
+        self._limiter = LookaheadLimiter(self.samplerate) if renderer.limiter == "lookahead" else None
+
+    def add_events(self, events: List[dict]):
+        if not events:
+            return
+        # Upper bound of the mix extent (slowest pitch stretches the kernel)
+        longest = max((len(k) for k in self.renderer.sfx_kernels.values()), default=0)
+        last = max(int(e["t"] * self.samplerate) for e in events) - self.position
+        end = last + int(longest / PITCH_MIN) + 2
+
+        if end > len(self._acc):
+            grown = np.zeros((max(end, 2 * len(self._acc)), 2), dtype=np.float32)
+            grown[:len(self._acc)] = self._acc
+            self._acc = grown
+        # Late events (before `position`) only keep their tail
+        self.renderer.mixer.mix_into(self._acc, events, offset=self.position)
+
+    def advance(self, until_sample: int) -> np.ndarray:
+        """Finished block [position, until_sample) as interleaved float32."""
+        n = until_sample - self.position
+        if n <= 0:
+            return np.zeros((0, 2), dtype=np.float32)
+
+        block = np.zeros((n, 2), dtype=np.float64)
+        ready = min(n, len(self._acc))
+        block[:ready] = self._acc[:ready]
+        self._acc = self._acc[ready:]
+
+        # BG Volume: 0.4 (looped like _prepare_bg), SFX: 1.0 (accumulated)
+        if self._bg is not None:
+            idx = np.arange(self.position, until_sample) % len(self._bg)
+            block += self._bg[idx] * 0.4
+
+        self.position = until_sample
+        if self._limiter is not None:
+            return self._limiter.process(block / 32767.0)
+        return np.clip(block / 32767.0, -1.0, 1.0).astype(np.float32)
@@ -15,6 +15,11 @@ if str(project_root) not in sys.path:
 
 from video_generator import VideoGenerator
 from audio_renderer import AudioRenderer
+from sfx_bank import SfxBank
+
+# Shared helpers live in mvp/common
+sys.path.append(str(project_root.parent))
+from common.worker_pool import AdaptiveWorkerPool
 
 try:
     # Optional integration
@@ -25,60 +30,98 @@ except ImportError:
 
 import sys
 import time
-import concurrent.futures
 from pathlib import Path
 
 # ... (imports)
 
-def process_single_video(index, count, output_dir):
-    """Worker function for parallel processing."""
+def process_single_video(index, count, output_dir, two_pass=True, trace=False, sfx_bank=None):
+    """
+    Worker function for parallel processing.
+    two_pass (default): silent video -> audio render -> mux.
+    two_pass=False: single pass, audio is streamed into the video encoder
+    (opt-in with --single-pass until bench_mux.py shows it is no slower).
+    trace: phase timings go to output_dir/traces/<video>.jsonl
+    (python span_tracer.py summarize batch_output/traces).
+    sfx_bank: SharedBankHandle of the SFX bank shared by generate_batch.
+    """
     print(f"\n🎬 STARTING VIDEO {index+1}/{count}")
     
     # We need fresh instances per process
     from video_generator import VideoGenerator
     from audio_renderer import AudioRenderer
     
-    video_gen = VideoGenerator()
-    audio_gen = AudioRenderer()
+    from common.audio_pipe import AudioPipe
+    from sfx_bank import SfxBank
+    from span_tracer import TRACER
+    import config
     
     timestamp = int(time.time())
     temp_video = output_dir / f"temp_{timestamp}_{index}.mp4"
     final_video = output_dir / f"marble_war_{timestamp}_{index}.mp4"
+    if trace:
+        TRACER.open(output_dir / "traces" / f"{final_video.stem}.jsonl", job=final_video.stem)
+    
+    with TRACER.span("init"):
+        video_gen = VideoGenerator()
+        audio_gen = AudioRenderer(bank=SfxBank.attach(sfx_bank) if sfx_bank else None)
     
     try:
-        # A. Generate Video
-        events = video_gen.render(temp_video)
+        with TRACER.span("video"): # End to end, what the phases add up to
+            if not two_pass and AudioPipe.supported():
+                # A. Video + Audio in one FFmpeg process
+                video_gen.render(final_video, audio=audio_gen)
+                if not final_video.exists() or final_video.stat().st_size == 0:
+                    return f"❌ Video {index+1} failed."
+                return f"✨ SUCCESS: {final_video.name}"
+        
+            # A. Generate Video
+            events = video_gen.render(temp_video)
         
-        if not temp_video.exists() or temp_video.stat().st_size == 0:
-            return f"❌ Video {index+1} failed."
+            if not temp_video.exists() or temp_video.stat().st_size == 0:
+                return f"❌ Video {index+1} failed."
             
-        # B. Render Audio & Mux
-        audio_gen.render(events, temp_video, final_video)
+            # B. Render Audio & Mux (duration is known, no need to probe the file)
+            audio_gen.rng.seed(video_gen.seed)
+            audio_gen.render(events, temp_video, final_video,
+                             duration=video_gen.frames_written / config.FPS)
         
-        # C. Cleanup
-        if temp_video.exists():
-            temp_video.unlink()
+            # C. Cleanup
+            if temp_video.exists():
+                temp_video.unlink()
+            temp_replay = temp_video.with_suffix(".replay.json")
+            if temp_replay.exists():
+                temp_replay.replace(final_video.with_suffix(".replay.json"))
             
-        return f"✨ SUCCESS: {final_video.name}"
+            return f"✨ SUCCESS: {final_video.name}"
     except Exception as e:
         return f"❌ Error in video {index+1}: {e}"
+    finally:
+        TRACER.close()
 
-def generate_batch(count):
+def generate_batch(count, two_pass=True, max_workers=None, trace=False):
     print(f"🚀 Parallel Batch Pipeline: Marble War (Target: {count})")
     print("==================================================")
     
     output_dir = project_root / "batch_output"
     output_dir.mkdir(exist_ok=True)
     
-    # Determine number of workers (max 2-3 given 8GB RAM constraint)
-    max_workers = 2
+    # Workers sized from the peak RSS of the first video (RAM and CPU count),
+    # fewer when free memory runs low. Per-video stats go to batch_stats.csv.
+    pool = AdaptiveWorkerPool(process_single_video, log_path=output_dir / "batch_stats.csv",
+                              max_workers=max_workers)
     
-    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(process_single_video, i, count, output_dir) for i in range(count)]
-        
-        for future in concurrent.futures.as_completed(futures):
-            print(f"📡 {future.result()}")
+    # SFX decoded once (disk cache) and shared with every worker
+    bank = SfxBank.load(project_root, AudioRenderer.SAMPLERATE)
+    handle = bank.share()
+    try:
+        pool.run([(i, count, output_dir, two_pass, trace, handle) for i in range(count)],
+                 on_result=lambda result: print(f"📡 {result}"))
+    finally:
+        bank.unlink()
 
 if __name__ == "__main__":
-    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1
-    generate_batch(count)
\ No newline at end of file
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    count = int(args[0]) if args else 1
+    workers = [int(a.split("=", 1)[1]) for a in sys.argv[1:] if a.startswith("--max-workers=")]
+    generate_batch(count, two_pass="--single-pass" not in sys.argv, max_workers=workers[0] if workers else None,
+                   trace="--trace" in sys.argv)
\ No newline at end of file
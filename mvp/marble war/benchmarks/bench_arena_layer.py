@@ -0,0 +1,79 @@
+"""
+Benchmark: ArenaGenerator.draw with the baked static layer vs drawing every
+obstacle shape each frame, per layout. Also checks that both produce the
+same frame.
+
+Usage: python benchmarks/bench_arena_layer.py [frames]
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pymunk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from arenas import ArenaGenerator
+
+LAYOUTS = {
+    "columns": "_create_columns",
+    "grid_pegs": "_create_pegs",
+    "funnel": "_create_funnel",
+    "x_cross": "_create_x_cross",
+    "central_block": "_create_central_block",
+    "spinners": "_create_spinners",
+}
+
+
+def build(layout: str) -> ArenaGenerator:
+    arena = ArenaGenerator(pymunk.Space(), random.Random(0))
+    getattr(arena, LAYOUTS[layout])()
+    arena.bake_static_layer()
+    return arena
+
+
+def time_draw(draw, arena: ArenaGenerator, screen: pygame.Surface, frames: int) -> float:
+    """Average ms per draw, stepping the space so spinners move."""
+    total = 0.0
+    for _ in range(frames):
+        arena.update()
+        arena.space.step(config.TIMESTEP)
+        screen.fill(config.COLOR_BG)
+        t0 = time.perf_counter()
+        draw(screen)
+        total += time.perf_counter() - t0
+    return total / frames * 1000
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+
+    print(f"\n{frames} frames at {config.WIDTH}x{config.HEIGHT}")
+    print(f"{'LAYOUT':<14} | {'SHAPES':>6} | {'PER SHAPE (ms)':>14} | {'BAKED (ms)':>10} | {'SPEEDUP':>7} | SAME FRAME")
+    print("-" * 76)
+    for layout in LAYOUTS:
+        arena = build(layout)
+        before = time_draw(arena.draw_unbaked, arena, screen, frames)
+        after = time_draw(arena.draw, arena, screen, frames)
+
+        reference = pygame.Surface(screen.get_size())
+        reference.fill(config.COLOR_BG)
+        arena.draw_unbaked(reference)
+        screen.fill(config.COLOR_BG)
+        arena.draw(screen)
+        same = pygame.image.tobytes(reference, "RGB") == pygame.image.tobytes(screen, "RGB")
+
+        print(f"{layout:<14} | {len(arena.obstacles):>6} | {before:>14.3f} | {after:>10.3f} | "
+              f"{before / after:>6.1f}x | {'yes' if same else 'NO'}")
+
+    pygame.quit()
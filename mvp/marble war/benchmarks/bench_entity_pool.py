@@ -0,0 +1,120 @@
+"""
+Benchmark: GameState._remove_dead with EntityPool (mark + one compaction
+pass) vs the list.remove per death it replaced. Kills N of 2N marbles and
+N of 2N projectiles in the same frame, then checks both give the same
+survivors in the same order. (Power-ups stay a plain list: pickups are
+rare, and kill() + compact() measured slower than list.remove for them.)
+
+Usage: python benchmarks/bench_entity_pool.py [deaths...]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pymunk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from effects import ParticleSystem
+from entities import Marble, Projectile
+from entity_pool import EntityPool
+from game_physics import PhysicsEngine
+from game_state import GameState
+
+
+class SilentAudio:
+    def play_sound(self, name, vol=1.0, pos=None):
+        pass
+
+
+def legacy_remove_dead(state: GameState) -> None:
+    """_remove_dead before EntityPool."""
+    dead = state.physics.to_remove_projectiles
+    for p in [p for p in state.projectiles if p in dead]:
+        state.space.remove(p.shape, p.body)
+        state.projectiles.remove(p)
+    dead.clear()
+
+    dead = state.physics.to_remove
+    for m in [m for m in state.marbles if m in dead]:
+        state.space.remove(m.shape, m.body)
+        state.marbles.remove(m)
+    dead.clear()
+
+
+def build_state(deaths: int, seed: int) -> GameState:
+    rng = random.Random(seed)
+    space = pymunk.Space()
+    physics = PhysicsEngine(space, SilentAudio(), ParticleSystem(rng=rng), [], [], None, [])
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = GameState(space, physics, physics.particles, [], [], [], rng)
+    for m in state.marbles:
+        space.remove(m.shape, m.body)
+
+    total = deaths * 2 # Half of everything dies
+    marbles = [Marble(rng.uniform(50, config.WIDTH - 50), rng.uniform(50, config.HEIGHT - 50),
+                      "red", (255, 0, 0), space) for _ in range(total)]
+    projectiles = [Projectile(m.body.position.x, m.body.position.y, 0.0, "red", (255, 0, 0), space)
+                   for m in marbles]
+    state.marbles = EntityPool(marbles, dead=physics.to_remove)
+    state.projectiles = EntityPool(projectiles, dead=physics.to_remove_projectiles)
+    physics.to_remove.update(rng.sample(marbles, deaths))
+    physics.to_remove_projectiles.update(rng.sample(projectiles, deaths))
+    return state
+
+
+def space_only(state: GameState) -> None:
+    """Just the space.remove calls both versions make (the floor)."""
+    for pool, dead in ((state.projectiles, state.physics.to_remove_projectiles),
+                       (state.marbles, state.physics.to_remove)):
+        for e in [e for e in pool if e in dead]:
+            state.space.remove(e.shape, e.body)
+
+
+def as_lists(state: GameState) -> GameState:
+    """The same state on plain lists (what GameState used before)."""
+    state.marbles, state.projectiles = list(state.marbles), list(state.projectiles)
+    return state
+
+
+def best_of(fn, deaths: int, legacy: bool, repeats: int) -> float:
+    """Best ms of fn(state) over fresh states."""
+    best = float("inf")
+    for _ in range(repeats):
+        state = build_state(deaths, seed=deaths)
+        if legacy:
+            as_lists(state)
+        t0 = time.perf_counter()
+        fn(state)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+if __name__ == "__main__":
+    pygame.init()
+    sizes = [int(a) for a in sys.argv[1:]] or [50, 500, 2000]
+    repeats = 20
+
+    print(f"\n{'DEATHS':>6} | {'REMOVE list (ms)':>16} | {'REMOVE pool (ms)':>16} | {'SPACE ONLY (ms)':>15} | SAME")
+    print("-" * 70)
+    for deaths in sizes:
+        remove_list = best_of(legacy_remove_dead, deaths, True, repeats)
+        remove_pool = best_of(GameState._remove_dead, deaths, False, repeats)
+        floor = best_of(space_only, deaths, False, repeats)
+
+        legacy, pool = as_lists(build_state(deaths, seed=deaths)), build_state(deaths, seed=deaths)
+        legacy_remove_dead(legacy)
+        GameState._remove_dead(pool)
+        same = ([m.body.position for m in legacy.marbles] == [m.body.position for m in pool.marbles]
+                and [p.body.position for p in legacy.projectiles] == [p.body.position for p in pool.projectiles])
+        print(f"{deaths:>6} | {remove_list:>16.2f} | {remove_pool:>16.2f} | {floor:>15.2f} | "
+              f"{'yes' if same else 'NO'}")
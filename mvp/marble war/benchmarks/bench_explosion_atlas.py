@@ -0,0 +1,84 @@
+"""
+Benchmark: drawing 100 concurrent explosions (staggered through their fade)
+by fading a copy of the image every frame vs one blit from the pre-faded
+ExplosionAtlas, for the default per-fade-alpha atlas and a coarser one.
+Checks the default atlas gives the same pixels.
+
+Usage: python benchmarks/bench_explosion_atlas.py [explosions] [frames]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from assets import AssetManager
+from effects import Explosion, ExplosionAtlas
+
+
+def spawn(count: int, image: pygame.Surface, atlas, seed: int = 0):
+    rng = random.Random(seed)
+    explosions = []
+    for i in range(count):
+        e = Explosion(rng.uniform(0, config.WIDTH), rng.uniform(0, config.HEIGHT), image, atlas)
+        for _ in range(i % 30): # Spread over the fade
+            e.update()
+        explosions.append(e)
+    return explosions
+
+
+def run(screen: pygame.Surface, explosions, frames: int):
+    """ms per frame drawing every explosion, and the last frame."""
+    total = 0.0
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        t0 = time.perf_counter()
+        for e in explosions:
+            e.draw(screen)
+        total += time.perf_counter() - t0
+        for e in explosions:
+            if not e.update(): # Restart, so there are always `count` on screen
+                e.life, e.alpha = Explosion.DURATION, 255
+    return total / frames * 1000, pygame.image.tobytes(screen, "RGB")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    assets = AssetManager()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assets.load_images()
+    image = assets.explosion_img
+
+    t0 = time.perf_counter()
+    exact = ExplosionAtlas(image)
+    t_build = (time.perf_counter() - t0) * 1000
+    coarse = ExplosionAtlas(image, keyframes=8)
+
+    # Same explosions each run (spawn() is seeded), so only the draw path differs
+    results = {}
+    for name, atlas in (("copy + fade per frame", None), (f"atlas ({len(exact)} keyframes)", exact),
+                        (f"atlas ({len(coarse)} keyframes)", coarse)):
+        explosions = spawn(count, image, atlas)
+        results[name] = run(screen, explosions, frames)
+
+    base_ms, base_frame = results["copy + fade per frame"]
+    print(f"\n{count} explosions, {frames} frames, {image.get_width()}px image, "
+          f"atlas built in {t_build:.2f} ms ({len(exact)} keyframes)")
+    print(f"{'PATH':<24} | {'MS/FRAME':>8} | {'SPEEDUP':>7} | SAME PIXELS")
+    print("-" * 58)
+    for name, (ms, frame) in results.items():
+        print(f"{name:<24} | {ms:>8.3f} | {base_ms / ms:>6.1f}x | {'yes' if frame == base_frame else 'no'}")
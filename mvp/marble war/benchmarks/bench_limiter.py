@@ -0,0 +1,65 @@
+"""
+Benchmark: limiter stages of AudioRenderer on synthetic event mixes.
+Reports throughput (samples/s) plus output peak and RMS (dBFS) for the old
+global peak normalization and the streaming look-ahead limiter.
+
+Usage: python benchmarks/bench_limiter.py [seconds]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_limiter import LookaheadLimiter
+from audio_renderer import AudioRenderer
+from bench_audio_mixer import synthetic_events
+
+
+def dbfs(value: float) -> float:
+    return 20 * np.log10(max(value, 1e-9))
+
+
+def scenarios(names, duration: float):
+    sparse = synthetic_events(names, int(duration * 5), duration, seed=1)
+    dense = synthetic_events(names, int(duration * 150), duration, seed=2)
+    # Quiet game with one huge explosion in the middle
+    spike = synthetic_events(["collision"], int(duration * 20), duration, seed=3)
+    for evt in spike:
+        evt["vol"] *= 0.3
+    spike.append({"t": duration / 2, "name": "elimination", "vol": 12.0, "x": 0.5, "pitch": 1.0})
+    return {"sparse": sparse, "dense": dense, "one explosion": spike}
+
+
+def measure(renderer: AudioRenderer, track: np.ndarray, limiter: str, repeats: int = 3):
+    renderer.limiter = limiter
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        out = renderer._master(track)
+        best = min(best, time.perf_counter() - t0)
+    out = out.astype(np.float64) / 32767.0
+    return len(track) / best, dbfs(np.max(np.abs(out))), dbfs(np.sqrt(np.mean(out ** 2)))
+
+
+if __name__ == "__main__":
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    random.seed(0)
+
+    renderer = AudioRenderer()
+    num_samples = int(duration * renderer.samplerate)
+    ceiling_db = dbfs(LookaheadLimiter().ceiling)
+
+    print(f"\n{'MIX':<14} | {'STAGE':<10} | {'MSAMPLES/S':>10} | {'PEAK dBFS':>9} | {'RMS dBFS':>8}")
+    print("-" * 64)
+    for name, events in scenarios(sorted(renderer.sfx_kernels), duration).items():
+        track = renderer.mixer.mix(events, num_samples).astype(np.float64)
+        for stage in ("normalize", "lookahead"):
+            rate, peak, rms = measure(renderer, track, stage)
+            print(f"{name:<14} | {stage:<10} | {rate / 1e6:>10.1f} | {peak:>9.2f} | {rms:>8.2f}")
+            if stage == "lookahead":
+                assert peak <= ceiling_db + 0.01, f"{name}: peak {peak:.2f} dBFS over the ceiling"
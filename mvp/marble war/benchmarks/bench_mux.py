@@ -0,0 +1,68 @@
+"""
+Benchmark: single-pass (streamed audio) vs two-pass (silent video + audio mux).
+Measures end-to-end wall time per video, from the first simulated frame to the
+final .mp4 with its soundtrack. Both modes play the same seeded match; the
+runs alternate between modes and the median of `repeats` is reported.
+
+Usage: python benchmarks/bench_mux.py [frames] [seed] [repeats]
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from video_generator import VideoGenerator
+from audio_renderer import AudioRenderer
+
+
+def run_two_pass(out_dir: Path, seed: int) -> float:
+    t0 = time.perf_counter()
+    video_gen = VideoGenerator()
+    audio_gen = AudioRenderer()
+    temp_video = out_dir / "two_pass_temp.mp4"
+    final_video = out_dir / "two_pass.mp4"
+    events = video_gen.render(temp_video, seed=seed)
+    audio_gen.rng.seed(seed)
+    audio_gen.render(events, temp_video, final_video,
+                     duration=video_gen.frames_written / config.FPS)
+    temp_video.unlink()
+    return time.perf_counter() - t0
+
+
+def run_single_pass(out_dir: Path, seed: int) -> float:
+    t0 = time.perf_counter()
+    video_gen = VideoGenerator()
+    audio_gen = AudioRenderer()
+    audio_gen.rng.seed(seed)
+    video_gen.render(out_dir / "single_pass.mp4", audio=audio_gen, seed=seed)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    config.TOTAL_FRAMES = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 42
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    times = {"two-pass": [], "single-pass": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        for i in range(repeats):
+            # Alternate which mode goes first, so warm caches favour neither
+            order = [("two-pass", run_two_pass), ("single-pass", run_single_pass)]
+            for name, run in (order if i % 2 == 0 else order[::-1]):
+                times[name].append(run(out_dir, seed))
+        sizes = {p.name: p.stat().st_size for p in out_dir.glob("*.mp4")}
+
+    print(f"\n{'MODE':<12} | {'MEDIAN (s)':>10} | {'MIN (s)':>8} | {'MAX (s)':>8} | {'OUTPUT':>10}")
+    print("-" * 62)
+    for name, output in (("two-pass", "two_pass.mp4"), ("single-pass", "single_pass.mp4")):
+        t = times[name]
+        print(f"{name:<12} | {statistics.median(t):>10.2f} | {min(t):>8.2f} | {max(t):>8.2f} | "
+              f"{sizes.get(output, 0) // 1024:>7} KB")
+    speedup = statistics.median(times["two-pass"]) / statistics.median(times["single-pass"])
+    print(f"Single-pass speedup: {speedup:.2f}x (median of {repeats}, {config.TOTAL_FRAMES} frames, seed {seed})")
@@ -0,0 +1,75 @@
+"""
+Benchmark: structure-of-arrays ParticleSystem vs the object-per-particle one.
+Emits 5k particles (team colors) and reports update and draw time separately,
+plus how far the two renders differ (alpha quantization of the glow atlas).
+
+Usage: python benchmarks/bench_particles.py [particles] [frames]
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from effects import ObjectParticleSystem, ParticleSystem
+
+
+def emit_all(system, count: int, seed: int) -> None:
+    random.seed(seed)
+    colors = list(config.TEAM_COLORS.values()) + [(255, 255, 255)]
+    for i in range(count // system.PARTICLE_COUNT):
+        pos = (random.uniform(0, config.WIDTH), random.uniform(0, config.HEIGHT))
+        system.emit(pos, colors[i % len(colors)])
+
+
+def run(system, screen: pygame.Surface, count: int, frames: int):
+    """Average ms per update / draw over `frames`, refilling to `count` each frame."""
+    t_update = t_draw = 0.0
+    for frame in range(frames):
+        system.clear()
+        emit_all(system, count, seed=frame)
+        for _ in range(frame % 12): # Age them so every alpha level shows up
+            system.update()
+        screen.fill(config.COLOR_BG)
+
+        t0 = time.perf_counter()
+        system.update()
+        t1 = time.perf_counter()
+        system.draw(screen)
+        t2 = time.perf_counter()
+
+        t_update += t1 - t0
+        t_draw += t2 - t1
+    return t_update / frames * 1000, t_draw / frames * 1000
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+
+    results = {}
+    frames_out = {}
+    for name, factory in (("objects", ObjectParticleSystem), ("soa", ParticleSystem)):
+        system = factory()
+        results[name] = run(system, screen, count, frames)
+        frames_out[name] = pygame.surfarray.array3d(screen).astype(np.int16)
+
+    diff = np.abs(frames_out["objects"] - frames_out["soa"])
+    print(f"\n{count} particles, {frames} frames")
+    print(f"{'BACKEND':<10} | {'UPDATE (ms)':>11} | {'DRAW (ms)':>9}")
+    print("-" * 36)
+    for name, (upd, drw) in results.items():
+        print(f"{name:<10} | {upd:>11.2f} | {drw:>9.2f}")
+    print(f"Render diff: max {diff.max()} / mean {diff.mean():.4f} (0-255 per channel)")
@@ -0,0 +1,87 @@
+"""
+Benchmark: one space.step per frame (fixed iterations) vs AdaptiveStepper
+(substeps from speed / radius, fewer iterations in sparse arenas) over many
+seeds, simulate-only. Reports physics ms per frame, how the substeps and
+iterations were spread, and tunnelling events: a marble whose center is
+found outside the arena bounds (counted once per marble).
+
+Usage: python benchmarks/bench_physics_stepper.py [seeds] [frames]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from game import MarbleWar
+from physics_stepper import AdaptiveStepper
+
+
+def escaped(marbles) -> set:
+    return {id(m) for m in marbles
+            if not (0 <= m.body.position.x <= config.WIDTH and 0 <= m.body.position.y <= config.HEIGHT)}
+
+
+class TimedStepper:
+    """Wraps space / AdaptiveStepper and records the time of each step."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.ms = []
+
+    def step(self, dt: float) -> None:
+        t0 = time.perf_counter()
+        self.inner.step(dt)
+        self.ms.append((time.perf_counter() - t0) * 1000)
+
+
+def run(seed: int, frames: int, adaptive: bool):
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = MarbleWar(simulate_only=True, seed=seed)
+    stepper = AdaptiveStepper(game.space, contacts=game.physics) if adaptive else game.space
+    game.stepper = timed = TimedStepper(stepper)
+
+    plans, tunnelled = Counter(), set()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        while game.frame_count < frames and game.step():
+            tunnelled |= escaped(game.state.marbles)
+            if adaptive:
+                plans[(stepper.substeps, stepper.iterations)] += 1
+    return np.array(timed.ms), plans, len(tunnelled)
+
+
+if __name__ == "__main__":
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 1800
+
+    print(f"\n{seeds} seeds, up to {frames} frames each")
+    print(f"{'STEPPING':<10} | {'FRAMES':>7} | {'MS/FRAME':>8} | {'P95 MS':>7} | {'TOTAL (s)':>9} | {'TUNNELLED':>9}")
+    print("-" * 66)
+    for adaptive in (False, True):
+        all_ms, plans, tunnelled = [], Counter(), 0
+        for seed in range(seeds):
+            ms, p, t = run(seed, frames, adaptive)
+            all_ms.append(ms)
+            plans.update(p)
+            tunnelled += t
+        ms = np.concatenate(all_ms)
+        name = "adaptive" if adaptive else "fixed"
+        print(f"{name:<10} | {len(ms):>7} | {ms.mean():>8.3f} | {np.percentile(ms, 95):>7.3f} | "
+              f"{ms.sum() / 1000:>9.2f} | {tunnelled:>9}")
+
+    total = sum(plans.values())
+    print("\nAdaptive plans (substeps, iterations): share of frames")
+    for (k, it), n in sorted(plans.items()):
+        print(f"  k={k} iterations={it:<3} | {n / total:>6.1%}")
@@ -0,0 +1,72 @@
+"""
+Benchmark: SFX bank init, cold (decode + resample every pitch bucket) vs
+warm (.npz disk cache) vs attached from shared memory, and the
+AudioRenderer init time on top of each. Also checks that a mix made with
+the cached bank is identical to one made from freshly decoded kernels.
+
+Usage: python benchmarks/bench_sfx_bank.py [repeats]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_mixer import EventMixer
+from audio_renderer import AudioRenderer
+from bench_audio_mixer import synthetic_events
+from sfx_bank import SfxBank
+
+ROOT = Path(__file__).resolve().parent.parent
+SR = AudioRenderer.SAMPLERATE
+
+
+def best_of(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Path(tmp)
+
+        def cold():
+            for f in cache.glob("*.npz"):
+                f.unlink()
+            return SfxBank.load(ROOT, SR, cache_dir=cache)
+
+        cold_s, bank = best_of(cold, repeats)
+        warm_s, _ = best_of(lambda: SfxBank.load(ROOT, SR, cache_dir=cache), repeats)
+        handle = bank.share()
+        try:
+            attach_s, shared = best_of(lambda: SfxBank.attach(handle), repeats)
+            init_cold, _ = best_of(lambda: AudioRenderer(bank=cold()), repeats)
+            init_warm, _ = best_of(lambda: AudioRenderer(bank=SfxBank.load(ROOT, SR, cache_dir=cache)), repeats)
+            init_shared, renderer = best_of(lambda: AudioRenderer(bank=SfxBank.attach(handle)), repeats)
+
+            # Same samples as kernels resampled on demand
+            events = synthetic_events(sorted(bank.kernels), 3000, 60.0, seed=0)
+            fresh = EventMixer(SfxBank.build(ROOT, SR).kernels, SR).mix(events, 60 * SR)
+            cached = renderer.mixer.mix(events, 60 * SR)
+            assert np.array_equal(fresh, cached), "cached bank changes the mix"
+            del renderer, shared
+        finally:
+            bank.unlink()
+
+    print(f"\nBank: {len(bank.kernels)} SFX, {len(bank.pitched)} pitched kernels, "
+          f"bg {'yes' if bank.bg is not None else 'no'}, {bank.nbytes / 2**20:.1f} MB")
+    print(f"{'SOURCE':<16} | {'BANK (ms)':>9} | {'RENDERER INIT (ms)':>18}")
+    print("-" * 50)
+    print(f"{'cold (decode)':<16} | {cold_s * 1000:>9.2f} | {init_cold * 1000:>18.2f}")
+    print(f"{'warm (.npz)':<16} | {warm_s * 1000:>9.2f} | {init_warm * 1000:>18.2f}")
+    print(f"{'shared memory':<16} | {attach_s * 1000:>9.2f} | {init_shared * 1000:>18.2f}")
@@ -0,0 +1,103 @@
+"""
+Benchmark: GameState.update with the grid spatial index vs linear scans.
+Spawns N marbles in Zombie Outbreak (10% zombies, trap phase skipped so the
+AI runs, a few magnets and shooters) and reports ms per update.
+Infection is disabled to keep the team mix stable, and particles are cleared
+before each update so the numbers isolate the AI queries.
+
+Usage: python benchmarks/bench_spatial.py [frames] [sizes...]
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pymunk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+import gamemodes
+from effects import ParticleSystem
+from entities import Marble
+from entity_pool import EntityPool
+from game_physics import PhysicsEngine
+from game_state import GameState
+from spatial_index import LinearIndex
+
+
+class StableZombieOutbreak(gamemodes.ZombieOutbreak):
+    def handle_collision(self, m1, m2):
+        return False, None
+
+
+class SilentAudio:
+    def play_sound(self, name, vol=1.0, pos=None):
+        pass
+
+
+def build_state(count: int, seed: int) -> GameState:
+    random.seed(seed)
+    space = pymunk.Space()
+    space.gravity = config.GRAVITY
+    space.damping = config.SPACE_DAMPING
+    physics = PhysicsEngine(space, SilentAudio(), ParticleSystem(), [], [], None, [])
+    state = GameState(space, physics, physics.particles, [], [], [])
+    state.portals = []
+
+    for m in state.marbles:
+        space.remove(m.shape, m.body)
+    state.game_mode = StableZombieOutbreak()
+    physics.game_mode = state.game_mode
+
+    marbles = []
+    for i in range(count):
+        x = random.uniform(50, config.WIDTH - 50)
+        y = random.uniform(50, config.HEIGHT - 50)
+        if i % 10 == 0:
+            m = Marble(x, y, "zombie", (50, 255, 50), space)
+            m.infect()
+        else:
+            m = Marble(x, y, "civilian", (0, 100, 255), space)
+        if i % 20 == 1:
+            m.magnet_active = True
+            m.powerup_timer = 1e9
+        elif i % 20 == 2:
+            m.assassin_mode = True
+            m.ammo = 10**9
+        marbles.append(m)
+    state.marbles = EntityPool(marbles, dead=physics.to_remove)
+    return state
+
+
+def run(count: int, frames: int, linear: bool) -> float:
+    state = build_state(count, seed=count)
+    if linear:
+        state.index = LinearIndex()
+        state.zombie_index = LinearIndex()
+    elapsed = 0.0
+    for _ in range(frames):
+        state.space.step(config.TIMESTEP)
+        state.particles.clear()
+        t0 = time.perf_counter()
+        state.update()
+        elapsed += time.perf_counter() - t0
+    return elapsed / frames * 1000
+
+
+if __name__ == "__main__":
+    pygame.init() # Collision handlers create FloatingText (fonts)
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    sizes = [int(a) for a in sys.argv[2:]] or [50, 200, 1000]
+
+    print(f"{'MARBLES':>8} | {'LINEAR (ms)':>11} | {'GRID (ms)':>9} | {'SPEEDUP':>7}")
+    print("-" * 46)
+    for count in sizes:
+        linear = run(count, frames, linear=True)
+        grid = run(count, frames, linear=False)
+        print(f"{count:>8} | {linear:>11.2f} | {grid:>9.2f} | {linear / grid:>6.1f}x")
@@ -0,0 +1,92 @@
+"""
+Benchmark: rendering a match live (pymunk step + game logic + draw) vs
+RenderOnly from a StateRecorder recording (no physics), plus what recording
+costs per step and on disk. Every replayed frame is compared with the live
+one.
+
+Usage: python benchmarks/bench_state_recorder.py [seed] [frames]
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game import MarbleWar
+from state_recorder import RenderOnly, StateRecorder
+
+
+def frame_hash(screen) -> str:
+    return hashlib.sha1(pygame.image.tobytes(screen, "RGB")).hexdigest()
+
+
+if __name__ == "__main__":
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 1800
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "match.rec"
+
+        # 1. Live: step + draw, recording along the way
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = MarbleWar(headless=True, seed=seed)
+        recorder = game.recorder = StateRecorder(path, game)
+        t_step = t_draw = 0.0
+        live = []
+        while game.frame_count < frames:
+            t0 = time.perf_counter()
+            running = game.step()
+            t1 = time.perf_counter()
+            if not running:
+                break
+            game._draw()
+            t_draw += time.perf_counter() - t1
+            t_step += t1 - t0
+            live.append(frame_hash(game.screen))
+        recorder.close()
+        n = len(live)
+
+        # 2. Recording overhead: the same steps without a recorder
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = MarbleWar(headless=True, seed=seed)
+        t_bare = 0.0
+        for _ in range(n):
+            t0 = time.perf_counter()
+            game.step()
+            t_bare += time.perf_counter() - t0
+
+        # 3. Render only
+        t0 = time.perf_counter()
+        player = RenderOnly(path)
+        t_open = time.perf_counter() - t0
+        t_replay = 0.0
+        same = 0
+        for i in range(len(player)):
+            t0 = time.perf_counter()
+            player.draw(i)
+            t_replay += time.perf_counter() - t0
+            same += frame_hash(player.screen) == live[i]
+
+        rows = recorder.rows
+        print(f"\nSeed {seed}: {recorder.header['mode']}, {recorder.header['arena']}, {n} frames")
+        print(f"Recording: {recorder.nbytes / 2**20:.1f} MB ({recorder.nbytes / n / 1024:.1f} KB/frame), "
+              f"{rows['marbles']} marble rows, {rows['particles']} particle rows")
+        print(f"{'PATH':<26} | {'MS/FRAME':>8} | {'TOTAL (s)':>9}")
+        print("-" * 50)
+        print(f"{'step (no recorder)':<26} | {t_bare / n * 1000:>8.2f} | {t_bare:>9.2f}")
+        print(f"{'step + record':<26} | {t_step / n * 1000:>8.2f} | {t_step:>9.2f}")
+        print(f"{'draw':<26} | {t_draw / n * 1000:>8.2f} | {t_draw:>9.2f}")
+        print(f"{'live (step + draw)':<26} | {(t_bare + t_draw) / n * 1000:>8.2f} | {t_bare + t_draw:>9.2f}")
+        print(f"{'RenderOnly':<26} | {t_replay / n * 1000:>8.2f} | {t_replay:>9.2f}  (+{t_open:.2f}s to open)")
+        print(f"Identical frames: {same}/{n}")
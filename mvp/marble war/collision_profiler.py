@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Collision Profiler for Marble War.
+Opt-in instrumentation of the pymunk collision callbacks of PhysicsEngine.
+Each handler is wrapped to count its calls and accumulate its time, per
+simulation step, next to the time of the whole `space.step`, so the share
+of the step spent in Python callbacks can be read frame by frame.
+
+Usage: python collision_profiler.py --arena grid_pegs --frames 1200 --out pegs.csv
+"""
+
+import argparse
+import csv
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import config
+
+
+class CollisionProfiler:
+    """Per-step call counts and time (seconds) per collision handler."""
+
+    def __init__(self) -> None:
+        self.handlers: List[str] = []
+        self.frames: List[Dict[str, float]] = [] # One row per profiled step
+        self._calls: Dict[str, int] = {}
+        self._time: Dict[str, float] = {}
+
+    def wrap(self, name: str, handler: Callable) -> Callable:
+        """Timed wrapper around a pymunk callback (arbiter, space, data)."""
+        if name not in self.handlers:
+            self.handlers.append(name)
+            self._calls[name] = 0
+            self._time[name] = 0.0
+        calls, spent = self._calls, self._time
+        clock = time.perf_counter
+
+        def profiled(arbiter, space, data):
+            t0 = clock()
+            try:
+                return handler(arbiter, space, data)
+            finally:
+                spent[name] += clock() - t0
+                calls[name] += 1
+        profiled.__name__ = getattr(handler, "__name__", name)
+        return profiled
+
+    def step(self, space, dt: float) -> None:
+        """space.step(dt) (or AdaptiveStepper.step), recorded as one frame of the histogram."""
+        t0 = time.perf_counter()
+        space.step(dt)
+        step_time = time.perf_counter() - t0
+
+        row = {"step_ms": step_time * 1000, "callbacks_ms": 0.0}
+        for name in self.handlers:
+            row[f"{name}_calls"] = self._calls[name]
+            row[f"{name}_ms"] = self._time[name] * 1000
+            row["callbacks_ms"] += self._time[name] * 1000
+            self._calls[name] = 0
+            self._time[name] = 0.0
+        self.frames.append(row)
+
+    def columns(self) -> List[str]:
+        cols = ["frame", "step_ms", "callbacks_ms"]
+        for name in self.handlers:
+            cols += [f"{name}_calls", f"{name}_ms"]
+        return cols
+
+    def export_csv(self, path: Path) -> None:
+        """Per-frame rows: step time, callback time and calls/time per handler."""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns())
+            writer.writeheader()
+            for i, row in enumerate(self.frames, start=1):
+                writer.writerow({"frame": i, **{k: round(v, 4) for k, v in row.items()}})
+
+    def histogram(self, bins=(0, 0.1, 0.25, 0.5, 0.75, 1.0)) -> List[int]:
+        """Frame counts per bucket of callback share of the step time."""
+        if not self.frames:
+            return [0] * (len(bins) - 1)
+        share = np.array([r["callbacks_ms"] / r["step_ms"] if r["step_ms"] > 0 else 0.0
+                          for r in self.frames])
+        counts, _ = np.histogram(np.clip(share, 0.0, 1.0), bins=bins)
+        return counts.tolist()
+
+    def report(self) -> None:
+        n = len(self.frames)
+        if n == 0:
+            print("No profiled frames.")
+            return
+        step = np.array([r["step_ms"] for r in self.frames])
+        cb = np.array([r["callbacks_ms"] for r in self.frames])
+        print(f"\n{n} frames | space.step p50 {np.median(step):.3f} ms, p95 {np.percentile(step, 95):.3f} ms | "
+              f"callbacks {cb.sum() / step.sum():.1%} of step time")
+        print(f"{'HANDLER':<36} | {'CALLS/FRAME':>11} | {'MS/FRAME':>8} | {'P95 MS':>7} | {'US/CALL':>7}")
+        print("-" * 80)
+        for name in self.handlers:
+            calls = np.array([r[f"{name}_calls"] for r in self.frames])
+            ms = np.array([r[f"{name}_ms"] for r in self.frames])
+            per_call = ms.sum() * 1000 / calls.sum() if calls.sum() else 0.0
+            print(f"{name:<36} | {calls.mean():>11.1f} | {ms.mean():>8.3f} | "
+                  f"{np.percentile(ms, 95):>7.3f} | {per_call:>7.1f}")
+
+        bins = (0, 0.1, 0.25, 0.5, 0.75, 1.0)
+        print("\nCallback share of space.step per frame:")
+        for lo, hi, count in zip(bins[:-1], bins[1:], self.histogram(bins)):
+            bar = "#" * int(50 * count / n)
+            print(f"  {lo:>4.0%} - {hi:>4.0%} | {count:>6} {bar}")
+
+
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from game import MarbleWar
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--arena", type=str, default=None, help="first seed from --seed with this layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=config.TOTAL_FRAMES)
+    parser.add_argument("--out", type=str, default=None, help="per-frame CSV")
+    args = parser.parse_args()
+
+    seed = args.seed
+    game = MarbleWar(simulate_only=True, seed=seed)
+    while args.arena and game.current_arena != args.arena:
+        seed += 1
+        if seed - args.seed > 500:
+            raise SystemExit(f"No '{args.arena}' arena in 500 seeds")
+        game = MarbleWar(simulate_only=True, seed=seed)
+    print(f"Profiling seed {seed}: {game.current_arena}, {game.state.game_mode.name}")
+
+    profiler = CollisionProfiler()
+    game.physics.attach_profiler(profiler)
+    game.simulate(args.frames)
+    profiler.report()
+    if args.out:
+        profiler.export_csv(Path(args.out))
+        print(f"Per-frame histogram -> {args.out}")
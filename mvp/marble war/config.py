@@ -15,6 +15,7 @@ MARBLE_FRICTION = 0.0 # Sem atrito
 WALL_ELASTICITY = 1.0 # Paredes perfeitamente elásticas
 WALL_FRICTION = 0.0
 WALL_THICKNESS = 100
+ADAPTIVE_PHYSICS = False # Sub-steps + iterações adaptativas (physics_stepper.AdaptiveStepper)
 
 # Collision types
 COLLISION_MARBLE = 1
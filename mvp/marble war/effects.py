@@ -7,10 +7,12 @@ import math
 import random
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 import config
 from game_types import Color, Particle, Position
+from text_cache import TEXT_CACHE
 
 
 
@@ -36,10 +38,13 @@ class PowerUp:
         self.radius = config.POWERUP_RADIUS
         self.color = self.COLOR_MAP.get(type, (255, 255, 255))
 
-    def draw(self, screen: pygame.Surface, images: Dict[str, pygame.Surface]) -> None:
-        """Draw power-up with pulsing animation."""
+    def draw(self, screen: pygame.Surface, images: Dict[str, pygame.Surface],
+             ticks: Optional[int] = None) -> None:
+        """Draw power-up with pulsing animation (ticks: animation clock in ms)."""
         # Pulsing effect
-        t = pygame.time.get_ticks() / 500.0
+        if ticks is None:
+            ticks = pygame.time.get_ticks()
+        t = ticks / 500.0
         r_pulse = self.radius + math.sin(t) * 5
         
         # Outer ring
@@ -66,8 +71,7 @@ class PowerUp:
             pygame.draw.polygon(screen, (255, 255, 255), 
                               [(cx-10, cy+5), (cx-20, cy+0), (cx-10, cy+8)])
         elif self.type == "clone":
-            font = pygame.font.SysFont("Arial", 30, bold=True)
-            txt = font.render("X2", True, self.color)
+            txt = TEXT_CACHE.render("X2", self.color, "Arial", 30, bold=True)
             screen.blit(txt, (cx - txt.get_width()//2, cy - txt.get_height()//2))
         elif self.type == "assassin":
             pygame.draw.rect(screen, self.color, (cx - 15, cy - 5, 30, 10))
@@ -97,7 +101,7 @@ class FloatingText:
         self.text = text
         self.color = color
         self.life = 1.0
-        self.font = pygame.font.SysFont("Arial", size, bold=True)
+        self.size = size
         
     def update(self) -> bool:
         self.pos += self.vel
@@ -108,9 +112,9 @@ class FloatingText:
         if self.life <= 0: return
         
         alpha = int(max(0, self.life * 255))
-        # Render text with outline
-        txt_surf = self.font.render(self.text, True, self.color)
-        outline_surf = self.font.render(self.text, True, (0, 0, 0))
+        # Render text with outline (cached surfaces, shared: alpha is reset below)
+        txt_surf = TEXT_CACHE.render(self.text, self.color, "Arial", self.size, bold=True)
+        outline_surf = TEXT_CACHE.render(self.text, (0, 0, 0), "Arial", self.size, bold=True)
         
         # Apply alpha (requires blit to temp surface for text usually, but simple fade is ok)
         txt_surf.set_alpha(alpha)
@@ -123,6 +127,8 @@ class FloatingText:
             screen.blit(outline_surf, (rect.x + dx, rect.y + dy))
             
         screen.blit(txt_surf, rect)
+        txt_surf.set_alpha(None)
+        outline_surf.set_alpha(None)
 
 # ============================================================================
 # EXPLOSIONS
@@ -133,12 +139,24 @@ class Explosion:
     
     DURATION = 0.5  # seconds
     
-    def __init__(self, x: float, y: float, image: pygame.Surface) -> None:
+    def __init__(self, x: float, y: float, image: pygame.Surface,
+                 atlas: Optional["ExplosionAtlas"] = None) -> None:
         self.pos = pygame.Vector2(x, y)
         self.image = image
+        self.atlas = atlas # Pre-faded frames of image (AssetManager.explosion_atlas)
         self.life = self.DURATION
         self.alpha = 255
 
+    @classmethod
+    def fade_alphas(cls) -> List[int]:
+        """Every alpha update() produces over the explosion's life."""
+        life = cls.DURATION
+        alphas = [255]
+        while life > 0:
+            life -= config.TIMESTEP
+            alphas.append(int(max(0, (life / cls.DURATION) * 255)))
+        return sorted(set(alphas))
+
     def update(self) -> bool:
         """Update explosion. Returns True if still visible."""
         self.life -= config.TIMESTEP
@@ -147,6 +165,11 @@ class Explosion:
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw fading explosion with ADDITIVE BLEND for glow."""
+        if self.atlas is not None:
+            frame = self.atlas.frame(self.alpha)
+            screen.blit(frame, frame.get_rect(center=(int(self.pos.x), int(self.pos.y))),
+                        special_flags=pygame.BLEND_ADD)
+            return
         img_copy = self.image.copy()
         img_copy.fill((255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT)
         rect = img_copy.get_rect(center=(int(self.pos.x), int(self.pos.y)))
@@ -155,12 +178,183 @@ class Explosion:
         screen.blit(img_copy, rect, special_flags=pygame.BLEND_ADD) 
 
 
+class ExplosionAtlas:
+    """
+    Keyframes of an explosion image, pre-faded once so Explosion.draw is a
+    single blit. By default there is one keyframe per alpha the fade
+    actually reaches (pixel-identical to fading on the fly); `keyframes`
+    trades that for N evenly spaced levels, and draw picks the nearest.
+    (BLEND_ADD ignores per-pixel alpha, so on screen the levels currently
+    look the same: the atlas keeps the existing look, only cheaper.)
+    """
+
+    def __init__(self, image: pygame.Surface, keyframes: Optional[int] = None) -> None:
+        self.image = image
+        if keyframes is None:
+            alphas = Explosion.fade_alphas()
+        else:
+            alphas = sorted({round(255 * k / max(1, keyframes - 1)) for k in range(keyframes)})
+        self.frames: Dict[int, pygame.Surface] = {}
+        for alpha in alphas:
+            frame = image.copy()
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            self.frames[alpha] = frame
+        # alpha (0-255) -> nearest keyframe
+        self._lookup = [self.frames[min(alphas, key=lambda a: abs(a - alpha))] for alpha in range(256)]
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def frame(self, alpha: int) -> pygame.Surface:
+        return self._lookup[min(255, max(0, alpha))]
+
+
 # ============================================================================
 # PARTICLE SYSTEM
 # ============================================================================
 
 class ParticleSystem:
-    """Optimized particle system with object pooling and GLOW."""
+    """
+    Structure-of-arrays particle system with GLOW.
+    Positions, velocities, life and color (palette index) live in
+    preallocated numpy arrays, integrated in one vectorized pass. Drawing
+    uses a glow atlas pre-tinted per (color, quantized alpha), so no surface
+    is copied per particle.
+    """
+    
+    PARTICLE_COUNT = 8
+    PARTICLE_SPEED_MIN = 3
+    PARTICLE_SPEED_MAX = 8
+    FADE_RATE = 0.04
+    PARTICLE_SIZE = 6
+    ALPHA_STEP = 8 # Alpha quantization of the glow atlas
+    
+    def __init__(self, capacity: int = 1024, rng=random) -> None:
+        self.rng = rng
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.life = np.zeros(capacity, dtype=np.float64)
+        self.color = np.zeros(capacity, dtype=np.int32) # Index into _palette
+        
+        self._palette: Dict[Color, int] = {}
+        self._palette_colors: List[Color] = []
+        self._atlas: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Pre-create glow surface
+        self._glow_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(self._glow_surf, (255, 255, 255, 50), (10, 10), 10)
+        pygame.draw.circle(self._glow_surf, (255, 255, 255, 200), (10, 10), 4)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def emit(self, pos: Tuple[float, float], color: Color) -> None:
+        """Emit particle burst."""
+        n = self.PARTICLE_COUNT
+        if self.count + n > len(self.life):
+            self._grow(self.count + n)
+        
+        color_idx = self._color_index(color)
+        i = self.count
+        uniform = self.rng.uniform
+        for k in range(n):
+            angle = uniform(0, math.tau)  # tau = 2*pi
+            speed = uniform(self.PARTICLE_SPEED_MIN, self.PARTICLE_SPEED_MAX)
+            self.vel[i + k] = (math.cos(angle) * speed, math.sin(angle) * speed)
+        self.pos[i:i + n] = (pos[0], pos[1])
+        self.life[i:i + n] = 1.0
+        self.color[i:i + n] = color_idx
+        self.count += n
+
+    def set_state(self, pos: np.ndarray, life: np.ndarray, colors: np.ndarray) -> None:
+        """Replaces every particle: pos (n, 2), life (n,), colors (n, 3) RGB (replays)."""
+        n = len(life)
+        if n > len(self.life):
+            self._grow(n)
+        self.pos[:n] = pos
+        self.life[:n] = life
+        if n:
+            packed = (colors[:, 0].astype(np.int32) << 16) | (colors[:, 1].astype(np.int32) << 8) | colors[:, 2]
+            unique, inverse = np.unique(packed, return_inverse=True)
+            indices = np.array([self._color_index(((c >> 16) & 255, (c >> 8) & 255, c & 255))
+                                for c in unique.tolist()], dtype=np.int32)
+            self.color[:n] = indices[inverse]
+        self.count = n
+
+    def _color_index(self, color: Color) -> int:
+        key = tuple(color[:3])
+        color_idx = self._palette.get(key)
+        if color_idx is None:
+            color_idx = self._palette[key] = len(self._palette_colors)
+            self._palette_colors.append(key)
+        return color_idx
+
+    def update(self) -> None:
+        """Integrate all particles and compact out the dead ones."""
+        n = self.count
+        if n == 0:
+            return
+        pos, vel, life = self.pos[:n], self.vel[:n], self.life[:n]
+        pos += vel
+        vel *= 0.95 # Drag
+        life -= self.FADE_RATE
+        
+        alive = life > 0
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            # Stable compaction keeps draw order (older particles first)
+            self.pos[:kept] = pos[alive]
+            self.vel[:kept] = vel[alive]
+            self.life[:kept] = life[alive]
+            self.color[:kept] = self.color[:n][alive]
+            self.count = kept
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw all particles in one batched blit with Additive Blend."""
+        n = self.count
+        if n == 0:
+            return
+        alpha = (self.life[:n] * 255).astype(np.int32)
+        levels = (alpha // self.ALPHA_STEP).tolist()
+        colors = self.color[:n].tolist()
+        dests = (self.pos[:n] - 10).astype(np.int32).tolist()
+        
+        atlas = self._atlas
+        surfaces = []
+        for color_idx, level in zip(colors, levels):
+            glow = atlas.get((color_idx, level))
+            if glow is None:
+                glow = self._tint(color_idx, level)
+            surfaces.append(glow)
+        
+        if hasattr(screen, "fblits"): # pygame-ce
+            screen.fblits(list(zip(surfaces, dests)), pygame.BLEND_ADD)
+        else:
+            screen.blits([(glow, dest, None, pygame.BLEND_ADD) for glow, dest in zip(surfaces, dests)],
+                         doreturn=False)
+
+    def _tint(self, color_idx: int, level: int) -> pygame.Surface:
+        color = self._palette_colors[color_idx]
+        tinted_glow = self._glow_surf.copy()
+        tinted_glow.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        tinted_glow.set_alpha(level * self.ALPHA_STEP)
+        self._atlas[(color_idx, level)] = tinted_glow
+        return tinted_glow
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, 2 * len(self.life))
+        for name in ("pos", "vel", "life", "color"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+
+class ObjectParticleSystem:
+    """Previous object-per-particle implementation (reference for benchmarks)."""
     
     PARTICLE_COUNT = 8
     PARTICLE_SPEED_MIN = 3
@@ -175,6 +369,12 @@ class ParticleSystem:
         pygame.draw.circle(self._glow_surf, (255, 255, 255, 50), (10, 10), 10)
         pygame.draw.circle(self._glow_surf, (255, 255, 255, 200), (10, 10), 4)
 
+    def __len__(self) -> int:
+        return len(self.particles)
+
+    def clear(self) -> None:
+        self.particles.clear()
+
     def emit(self, pos: Tuple[float, float], color: Color) -> None:
         """Emit particle burst."""
         for _ in range(self.PARTICLE_COUNT):
@@ -209,3 +409,40 @@ class ParticleSystem:
             
             dest = (int(p.pos.x - 10), int(p.pos.y - 10))
             screen.blit(tinted_glow, dest, special_flags=pygame.BLEND_ADD)
+
+
+class NullParticleSystem:
+    """
+    Particle system for simulate-only runs: keeps nothing, draws nothing.
+    emit() still consumes the same random draws as ParticleSystem so a seed
+    plays out the same match with or without rendering.
+    """
+    
+    PARTICLE_COUNT = ParticleSystem.PARTICLE_COUNT
+    
+    def __init__(self, rng=random) -> None:
+        self.rng = rng
+    
+    def __len__(self) -> int:
+        return 0
+    
+    def clear(self) -> None:
+        pass
+    
+    def emit(self, pos: Tuple[float, float], color: Color) -> None:
+        for _ in range(self.PARTICLE_COUNT):
+            self.rng.random()
+            self.rng.random()
+    
+    def update(self) -> None:
+        pass
+    
+    def draw(self, screen: pygame.Surface) -> None:
+        pass
+
+
+class DiscardList(list):
+    """Effect list (floating texts, explosions) that drops everything appended."""
+    
+    def append(self, item) -> None:
+        pass
@@ -103,7 +103,7 @@ class Marble:
         
         space.add(self.body, self.shape)
 
-    def apply_ai_force(self) -> bool:
+    def apply_ai_force(self, rng=random) -> bool:
         """
         Apply random force for chaotic movement.
         Returns True if marble should shoot.
@@ -133,7 +133,7 @@ class Marble:
         strength = base_strength * mass_factor
         
         # 3. Apply Force (Random jitter + potential evasion logic)
-        angle = random.uniform(0, math.tau)
+        angle = rng.uniform(0, math.tau)
         force = (math.cos(angle) * strength, math.sin(angle) * strength)
         self.body.apply_force_at_local_point(force)
         
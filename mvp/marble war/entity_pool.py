@@ -0,0 +1,44 @@
+"""
+Entity Pool for Marble War.
+List of live entities (marbles, projectiles) with deferred removal:
+entities are marked dead during the frame and dropped in a single
+compaction pass, instead of one O(n) `list.remove` per death. Power-ups
+stay a plain list: a pickup is rare, and list.remove is cheaper than
+kill() + compact() for it.
+
+Compaction keeps the survivors in order. Swap-remove would be O(1) per
+death, but it reorders the list, and the AI walks it while drawing from the
+match RNG, so the same seed would give a different match.
+"""
+
+from typing import Iterable, List, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+
+class EntityPool(list):
+    """
+    A list (iteration, indexing, len and rng.choice work unchanged) plus a
+    dead set. `dead` can be shared with whoever decides the deaths, e.g.
+    PhysicsEngine.to_remove.
+    """
+
+    def __init__(self, entities: Iterable[T] = (), dead: Optional[Set[T]] = None):
+        super().__init__(entities)
+        self.dead: Set[T] = dead if dead is not None else set()
+
+    def kill(self, entity: T) -> None:
+        """Marks an entity for removal at the next compact()."""
+        self.dead.add(entity)
+
+    def compact(self) -> List[T]:
+        """Drops every dead entity in one pass. Returns them in list order."""
+        dead = self.dead
+        if not dead:
+            return []
+        alive, removed = [], []
+        for entity in self:
+            (removed if entity in dead else alive).append(entity)
+        self[:] = alive
+        dead.clear()
+        return removed
@@ -4,18 +4,22 @@ Orchestrates Physics, Rendering, and Game State.
 """
 
 import json
+import random
 from pathlib import Path
+from typing import Optional
 import pygame
 import pymunk
 
 import config
 from assets import AssetManager
 from arenas import ArenaGenerator
-from effects import ParticleSystem
+from effects import DiscardList, NullParticleSystem, ParticleSystem
 from game_physics import PhysicsEngine
+from physics_stepper import AdaptiveStepper
 from game_renderer import GameRenderer
 from game_state import GameState
 from game_types import AudioEvent
+from span_tracer import TRACER
 from themes import ThemeManager
 
 class AudioProxy:
@@ -45,31 +49,53 @@ class AudioProxy:
         ))
 
 class MarbleWar:
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, simulate_only: bool = False,
+                 seed: Optional[int] = None):
+        """
+        simulate_only: physics and game logic only (no display, assets,
+        renderer, particles or floating texts). Audio events, kill count and
+        the winner are still recorded; a seed plays out the same match as
+        with rendering.
+        seed: every random choice of the match comes from random.Random(seed).
+        A new one is drawn from the global random when not given.
+        """
         pygame.init()
-        self.headless = headless
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        print(f"🌱 Seed: {self.seed}")
+        self.simulate_only = simulate_only
+        self.headless = headless or simulate_only
         
         # Display Setup
-        if self.headless:
+        if self.simulate_only:
+            self.screen = None
+        elif self.headless:
             self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
         else:
             self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
             pygame.display.set_caption("Marble War - Chaos Edition")
             
         # Assets & Core
-        self.assets = AssetManager()
-        self.assets.load_all()
+        self.assets = AssetManager(self.rng)
+        if self.simulate_only:
+            self.assets.choose_soundtrack() # Same RNG draws as load_all()
+        else:
+            self.assets.load_all()
         
         self.space = pymunk.Space()
         self.space.gravity = config.GRAVITY
         self.space.damping = config.SPACE_DAMPING
-        
         self.frame_count = 0
         self.audio_manager = AudioProxy(self)
         
-        self.particles = ParticleSystem()
-        self.floating_texts = []
-        self.explosions = []
+        if self.simulate_only:
+            self.particles = NullParticleSystem(self.rng)
+            self.floating_texts = DiscardList()
+            self.explosions = DiscardList()
+        else:
+            self.particles = ParticleSystem(rng=self.rng)
+            self.floating_texts = []
+            self.explosions = []
         self.kill_feed = [] # Shared list
         
         # Modules
@@ -82,6 +108,9 @@ class MarbleWar:
             self.assets,
             self.kill_feed # Pass shared list
         )
+        # space.step or an AdaptiveStepper (same step(dt) call)
+        self.stepper = (AdaptiveStepper(self.space, contacts=self.physics)
+                        if config.ADAPTIVE_PHYSICS else self.space)
         
         self.state = GameState(
             self.space, 
@@ -89,21 +118,28 @@ class MarbleWar:
             self.particles,
             self.floating_texts,
             self.explosions,
-            self.kill_feed # Pass shared list
+            self.kill_feed, # Pass shared list
+            self.rng
         )
         
         # Arena
-        self.arena_gen = ArenaGenerator(self.space)
+        self.arena_gen = ArenaGenerator(self.space, self.rng)
         self.current_arena = self.arena_gen.generate()
         
         # Renderer
-        self.renderer = GameRenderer(self.screen, self.assets, ThemeManager.get_random_theme())
+        self.theme = ThemeManager.get_random_theme(self.rng)
+        self.renderer = None if self.simulate_only else GameRenderer(self.screen, self.assets, self.theme)
+        self.recorder = None # Optional StateRecorder, fed after every step
         
     def step(self) -> bool:
         """Single simulation step."""
-        self.space.step(config.TIMESTEP)
-        self.arena_gen.update()
-        self.state.update()
+        with TRACER.span("step", frame=self.frame_count + 1):
+            if self.physics.profiler is not None:
+                self.physics.profiler.step(self.stepper, config.TIMESTEP)
+            else:
+                self.stepper.step(config.TIMESTEP)
+            self.arena_gen.update()
+            self.state.update()
         
         self.frame_count += 1
         
@@ -112,29 +148,36 @@ class MarbleWar:
             self.state.celebration_timer -= 1
             if self.state.celebration_timer <= 0:
                 return False
+
+        # Frames that get drawn are recorded (replays render without physics)
+        if self.recorder is not None:
+            self.recorder.capture(self)
                 
         return True
 
     def _draw(self):
         """Render frame."""
-        self.renderer.draw(
-            marbles=self.state.marbles,
-            powerups=self.state.powerups,
-            projectiles=self.state.projectiles,
-            particles=self.particles,
-            explosions=self.explosions,
-            floating_texts=self.floating_texts,
-            arena_gen=self.arena_gen,
-            zone_active=self.state.zone_active,
-            zone_radius=self.state.zone_radius,
-            shake_offset=self.state.shake_offset,
-            bomb_active=self.state.bomb_active,
-            bomb_holder=self.state.bomb_holder,
-            winner_team=self.state.winner_team,
-            kill_feed=self.state.kill_feed,
-            portals=self.state.portals,
-            frame_count=self.frame_count # Pass frame_count
-        )
+        if self.renderer is None:
+            return
+        with TRACER.span("draw", frame=self.frame_count):
+            self.renderer.draw(
+                marbles=self.state.marbles,
+                powerups=self.state.powerups,
+                projectiles=self.state.projectiles,
+                particles=self.particles,
+                explosions=self.explosions,
+                floating_texts=self.floating_texts,
+                arena_gen=self.arena_gen,
+                zone_active=self.state.zone_active,
+                zone_radius=self.state.zone_radius,
+                shake_offset=self.state.shake_offset,
+                bomb_active=self.state.bomb_active,
+                bomb_holder=self.state.bomb_holder,
+                winner_team=self.state.winner_team,
+                kill_feed=self.state.kill_feed,
+                portals=self.state.portals,
+                frame_count=self.frame_count # Pass frame_count
+            )
 
     def run(self):
         """Standard execution loop."""
@@ -166,6 +209,24 @@ class MarbleWar:
             json.dump(audio_data, f, indent=2)
         print(f"Audio log saved: {len(self.audio_events)} events.")
 
+    def simulate(self, max_frames: int = config.TOTAL_FRAMES) -> dict:
+        """Runs the match without drawing. Returns its outcome."""
+        while self.frame_count < max_frames and self.step():
+            pass
+        return self.outcome()
+
+    def outcome(self) -> dict:
+        """Match summary (winner is None if the frame limit was hit first)."""
+        return {
+            "seed": self.seed,
+            "frames": self.frame_count,
+            "seconds": round(self.frame_count / config.FPS, 2),
+            "winner": self.state.winner_team,
+            "eliminations": self.physics.eliminations,
+            "mode": self.state.game_mode.name,
+            "arena": self.current_arena,
+        }
+
     @property
     def audio_events(self):
         return self.audio_manager.events
@@ -5,6 +5,7 @@ Handles Pymunk space, collisions, and movement.
 
 import math
 import random
+from contextlib import contextmanager
 from typing import List, Set, Optional
 
 import pymunk
@@ -32,6 +33,9 @@ class PhysicsEngine:
         
         # Chaos State
         self.shake_intensity = 0.0
+        self.eliminations = 0 # Marbles killed so far (match stats)
+        self.profiler = None # Optional CollisionProfiler (see attach_profiler)
+        self._contacts = None # Shape pair -> contact, while inside once_per_frame()
         
         self._create_walls()
         self._setup_collision_handlers()
@@ -55,28 +59,38 @@ class PhysicsEngine:
             seg.collision_type = config.COLLISION_WALL
             self.space.add(seg)
 
+    def attach_profiler(self, profiler) -> None:
+        """Re-registers the collision callbacks wrapped by a CollisionProfiler."""
+        self.profiler = profiler
+        self._setup_collision_handlers()
+
+    def _callback(self, handler):
+        if self.profiler is None:
+            return handler
+        return self.profiler.wrap(handler.__name__.strip("_"), handler)
+
     def _setup_collision_handlers(self) -> None:
         """Setup physics collision callbacks."""
         # Marble vs Marble
         self.space.on_collision(
             config.COLLISION_MARBLE, 
             config.COLLISION_MARBLE, 
-            post_solve=self._handle_marble_marble_collision,
-            pre_solve=self._pre_solve_marble_collision # Pass as kwarg
+            post_solve=self._callback(self._handle_marble_marble_collision),
+            pre_solve=self._callback(self._pre_solve_marble_collision) # Pass as kwarg
         )
         
-        # Marble vs Wall
+        # Marble vs Wall (arena pegs, spinners and blocks are walls too)
         self.space.on_collision(
             config.COLLISION_MARBLE, 
             config.COLLISION_WALL, 
-            post_solve=self._handle_marble_wall_collision
+            post_solve=self._callback(self._handle_marble_wall_collision)
         )
         
         # Projectile vs Marble
         self.space.on_collision(
             config.COLLISION_PROJECTILE, 
             config.COLLISION_MARBLE, 
-            begin=self._handle_projectile_marble_collision
+            begin=self._callback(self._handle_projectile_marble_collision)
         )
 
     def _pre_solve_marble_collision(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> bool:
@@ -92,14 +106,50 @@ class PhysicsEngine:
             
         return True
 
-    def _handle_marble_marble_collision(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> None:
-        m1: Marble = arbiter.shapes[0].data
-        m2: Marble = arbiter.shapes[1].data
-        
+    @contextmanager
+    def once_per_frame(self):
+        """
+        Wraps the substeps of one frame (AdaptiveStepper): post_solve fires once
+        per substep, so a lasting contact would play its sound, emit particles
+        and pass the bomb k times. Inside, contacts are only collected per shape
+        pair (impulses summed, point of the strongest substep) and handled once
+        at the end, in the order they first touched.
+        """
+        self._contacts = {}
+        try:
+            yield
+        finally:
+            contacts, self._contacts = self._contacts, None
+            for handle, marbles, impulse, pos, _ in contacts.values():
+                handle(*marbles, impulse, pos)
+
+    def _contact(self, handle, arbiter: pymunk.Arbiter, *marbles) -> None:
         impulse = arbiter.total_impulse.length
-        if impulse > config.IMPULSE_THRESHOLD:
+        if self._contacts is None:
+            # contact_point_set is only read for contacts loud enough to be heard
+            pos = arbiter.contact_point_set.points[0].point_a if impulse > config.IMPULSE_THRESHOLD else None
+            handle(*marbles, impulse, pos)
+            return
+        key = frozenset(map(id, arbiter.shapes)) # Shape order can swap between substeps
+        points = arbiter.contact_point_set.points
+        pos = points[0].point_a if points else None
+        seen = self._contacts.get(key)
+        if seen is None:
+            self._contacts[key] = [handle, marbles, impulse, pos, impulse]
+            return
+        seen[2] += impulse
+        if impulse > seen[4] and pos is not None:
+            seen[3], seen[4] = pos, impulse
+
+    def _handle_marble_marble_collision(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> None:
+        self._contact(self._marble_marble_contact, arbiter, arbiter.shapes[0].data, arbiter.shapes[1].data)
+
+    def _handle_marble_wall_collision(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> None:
+        self._contact(self._marble_wall_contact, arbiter, arbiter.shapes[0].data)
+
+    def _marble_marble_contact(self, m1: Marble, m2: Marble, impulse: float, pos) -> None:
+        if impulse > config.IMPULSE_THRESHOLD and pos is not None:
             vol = min(1.0, impulse / config.IMPULSE_TO_VOLUME)
-            pos = arbiter.contact_point_set.points[0].point_a
             self.audio.play_sound("collision", vol, pos=pos)
             self.particles.emit(pos, m1.color)
             self.particles.emit(pos, m2.color)
@@ -134,13 +184,10 @@ class PhysicsEngine:
         if not m1.freeze_active: m1.face_timer = 1.0; m1.current_face = "bravo"
         if not m2.freeze_active: m2.face_timer = 1.0; m2.current_face = "bravo"
 
-    def _handle_marble_wall_collision(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data: dict) -> None:
-        impulse = arbiter.total_impulse.length
-        if impulse > config.IMPULSE_THRESHOLD:
+    def _marble_wall_contact(self, marble: Marble, impulse: float, pos) -> None:
+        if impulse > config.IMPULSE_THRESHOLD and pos is not None:
             vol = min(0.6, impulse / config.IMPULSE_TO_VOLUME)
-            pos = arbiter.contact_point_set.points[0].point_a
             self.audio.play_sound("collision", vol, pos=pos)
-            marble: Marble = arbiter.shapes[0].data
             self.particles.emit(pos, marble.color)
             
             if not marble.freeze_active:
@@ -175,6 +222,7 @@ class PhysicsEngine:
             return
 
         self.to_remove.add(marble)
+        self.eliminations += 1
         if killer: self.to_remove_projectiles.add(killer)
         
         self.audio.play_sound("elimination", 0.8, pos=marble.body.position)
@@ -198,4 +246,5 @@ class PhysicsEngine:
         if self.assets.explosion_img:
             # Use dead face if available, otherwise explosion
             face = self.assets.face_assets.get("morto", self.assets.explosion_img)
-            self.explosions.append(Explosion(marble.body.position.x, marble.body.position.y, face))
+            self.explosions.append(Explosion(marble.body.position.x, marble.body.position.y, face,
+                                             self.assets.explosion_atlas(face)))
@@ -9,12 +9,16 @@ import config
 from themes import ThemeManager, Theme
 from entities import Marble
 from effects import ParticleSystem, Explosion, FloatingText, PowerUp
+from surface_pool import SurfacePool
+from text_cache import TEXT_CACHE
 
 class GameRenderer:
     def __init__(self, screen: pygame.Surface, assets, theme: Theme):
         self.screen = screen
         self.assets = assets
         self.theme = theme
+        self.text_cache = TEXT_CACHE
+        self.surfaces = SurfacePool() # Scratch surfaces (overlays), reused across frames
         
         # Pre-render grid
         self.grid_surface = pygame.Surface((config.WIDTH, config.HEIGHT))
@@ -29,6 +33,10 @@ class GameRenderer:
              arena_gen, zone_active, zone_radius, shake_offset, 
              bomb_active, bomb_holder, winner_team, kill_feed, portals, frame_count):
         
+        # Animation clock follows the game, not the wall clock (replays)
+        ticks = frame_count * 1000 // config.FPS
+        self.surfaces.new_frame()
+        
         # Clear & Grid
         self.screen.fill(self.theme.bg_color)
         self.screen.blit(self.grid_surface, shake_offset)
@@ -37,7 +45,7 @@ class GameRenderer:
         for p in portals:
             pygame.draw.circle(self.screen, p.color, p.entry, p.radius, 3)
             pygame.draw.circle(self.screen, p.color, p.exit, p.radius // 2, 2)
-            t = pygame.time.get_ticks() / 200.0
+            t = ticks / 200.0
             r_glow = p.radius + math.sin(t) * 10
             pygame.draw.circle(self.screen, (*p.color, 50), p.entry, int(r_glow), 1)
 
@@ -50,15 +58,14 @@ class GameRenderer:
             pygame.draw.circle(self.screen, (255, 0, 0), center, int(zone_radius), 5)
             
             # Sudden Death Warning
-            t = pygame.time.get_ticks() / 200.0
+            t = ticks / 200.0
             if math.sin(t) > 0:
-                font_sd = pygame.font.SysFont("Arial", 100, bold=True)
-                txt = font_sd.render("SUDDEN DEATH", True, (255, 0, 0))
+                txt = self.text_cache.render("SUDDEN DEATH", (255, 0, 0), "Arial", 100, bold=True)
                 self.screen.blit(txt, (config.WIDTH//2 - txt.get_width()//2, 100))
 
         # Powerups
         for p in powerups:
-            p.draw(self.screen, self.assets.powerup_images)
+            p.draw(self.screen, self.assets.powerup_images, ticks)
             
         # Projectiles
         for p in projectiles:
@@ -79,13 +86,12 @@ class GameRenderer:
             # Countdown text if trapped
             trapped_t = getattr(m, 'trapped_timer', 0)
             if trapped_t > 0:
-                pulse = 10 + math.sin(pygame.time.get_ticks() / 100.0) * 5
+                pulse = 10 + math.sin(ticks / 100.0) * 5
                 pygame.draw.circle(self.screen, (255, 255, 255), pos, config.MARBLE_RADIUS + int(pulse), 3)
                 
-                font_c = pygame.font.SysFont("Arial", 50, bold=True)
                 txt_str = f"{trapped_t:.1f}s"
-                txt_bg = font_c.render(txt_str, True, (0, 0, 0))
-                txt = font_c.render(txt_str, True, (255, 255, 255))
+                txt_bg = self.text_cache.render(txt_str, (0, 0, 0), "Arial", 50, bold=True)
+                txt = self.text_cache.render(txt_str, (255, 255, 255), "Arial", 50, bold=True)
                 t_pos = (pos[0] - txt.get_width()//2, pos[1] - 100)
                 self.screen.blit(txt_bg, (t_pos[0]+2, t_pos[1]+2))
                 self.screen.blit(txt, t_pos)
@@ -145,7 +151,6 @@ class GameRenderer:
                 pygame.draw.rect(self.screen, (255, 0, 0), (bx-100, by-150, int(200*pct), 20))
                 pygame.draw.rect(self.screen, (255, 255, 255), (bx-100, by-150, 200, 20), 2)
         
-        font = pygame.font.SysFont("Arial", 30, bold=True)
         x_off = 20
         for team, count in sorted(counts.items()):
             color = (255, 255, 255)
@@ -155,7 +160,7 @@ class GameRenderer:
             elif team == "boss": color = (255, 0, 0)
             else: color = config.TEAM_COLORS.get(f"team_{team}", (255, 255, 255))
             
-            txt = font.render(f"{team.upper()}: {count}", True, color)
+            txt = self.text_cache.render(f"{team.upper()}: {count}", color, "Arial", 30, bold=True)
             self.screen.blit(txt, (x_off, 15))
             x_off += 250
             
@@ -163,20 +168,18 @@ class GameRenderer:
         if "civilian" in counts and "zombie" in counts:
             time_left = max(0, 50 - (frame_count / config.FPS))
             if time_left > 0:
-                timer_txt = font.render(f"HUMAN WIN IN: {time_left:.1f}s", True, (255, 255, 255))
+                timer_txt = self.text_cache.render(f"HUMAN WIN IN: {time_left:.1f}s", (255, 255, 255), "Arial", 30, bold=True)
                 self.screen.blit(timer_txt, (config.WIDTH - 350, 15))
 
         y = config.HEIGHT - 150
-        f_font = pygame.font.SysFont("Arial", 20)
         for msg in kill_feed[-5:]:
-            txt = f_font.render(msg, True, self.theme.text_color)
+            txt = self.text_cache.render(msg, self.theme.text_color, "Arial", 20)
             self.screen.blit(txt, (20, y))
             y += 25
 
     def _draw_victory(self, winner):
-        overlay = pygame.Surface((config.WIDTH, config.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-        font = pygame.font.SysFont("Arial", 80, bold=True)
-        txt = font.render(f"WINNER: {winner}!", True, (255, 215, 0))
+        with self.surfaces.borrow((config.WIDTH, config.HEIGHT), pygame.SRCALPHA) as overlay:
+            overlay.fill((0, 0, 0, 150))
+            self.screen.blit(overlay, (0, 0))
+        txt = self.text_cache.render(f"WINNER: {winner}!", (255, 215, 0), "Arial", 80, bold=True)
         self.screen.blit(txt, (config.WIDTH//2 - txt.get_width()//2, config.HEIGHT//2))
\ No newline at end of file
@@ -11,24 +11,34 @@ import pymunk
 import config
 from entities import Marble, Projectile
 from effects import PowerUp
+from entity_pool import EntityPool
+from spatial_index import SpatialHash
 import gamemodes
 
 class GameState:
-    def __init__(self, space, physics_engine, particles, floating_texts, explosions, kill_feed):
+    def __init__(self, space, physics_engine, particles, floating_texts, explosions, kill_feed, rng=random):
         self.space = space
+        self.rng = rng
         self.physics = physics_engine
         self.particles = particles
         self.floating_texts = floating_texts
         self.explosions = explosions
         self.kill_feed = kill_feed
         
-        self.game_mode = gamemodes.get_random_mode()
+        self.game_mode = gamemodes.get_random_mode(self.rng)
         self.physics.game_mode = self.game_mode # Link for collisions
         
-        self.marbles: List[Marble] = self.game_mode.setup_marbles(self.space)
-        self.powerups: List[PowerUp] = []
-        self.projectiles: List[Projectile] = []
-        self.portals = gamemodes.generate_portals()
+        # Deaths decided by the physics callbacks go straight into the pools
+        self.marbles: EntityPool = EntityPool(self.game_mode.setup_marbles(self.space),
+                                              dead=self.physics.to_remove)
+        self.powerups: List[PowerUp] = [] # Pickups are rare: list.remove beats a pool here
+        self.projectiles: EntityPool = EntityPool(dead=self.physics.to_remove_projectiles)
+        self.portals = gamemodes.generate_portals(self.rng)
+        
+        # Nearest-neighbour queries (rebuilt once per update).
+        # Zombies get their own grid: civilians look for them among a crowd.
+        self.index = SpatialHash(cell_size=150)
+        self.zombie_index = SpatialHash(cell_size=250)
         
         self.frame_count = 0
         self.powerup_spawn_timer = 0.0
@@ -66,6 +76,8 @@ class GameState:
         # Update Marbles
         civilians = [m for m in self.marbles if m.team == "civilian"]
         zombies = [m for m in self.marbles if m.team == "zombie"]
+        self.index.rebuild(self.marbles)
+        self.zombie_index.rebuild(zombies)
         
         # ADRENALINE LOGIC: Fewer humans = Faster humans
         adrenaline = 1.0
@@ -86,7 +98,7 @@ class GameState:
             # NEW: Predator AI for Zombies
             if m.team == "zombie" and civilians:
                 # Find nearest human
-                target = min(civilians, key=lambda c: (m.body.position - c.body.position).length)
+                target = self.index.nearest(m.body.position, lambda c: c.team == "civilian")
                 hunt_dir = (target.body.position - m.body.position).normalized()
                 # Apply pursuit force SCALED by speed_boost (0.25)
                 m.body.apply_force_at_local_point(hunt_dir * 3000 * m.speed_boost)
@@ -96,21 +108,28 @@ class GameState:
                 m.speed_boost = adrenaline
                 
                 # 1. SEPARATION FORCE (Avoid Ping-Pong with other humans)
-                for other_civ in civilians:
-                    if other_civ == m: continue
-                    diff_civ = m.body.position - other_civ.body.position
-                    dist_civ = diff_civ.length
-                    if 0 < dist_civ < 120: # If too close to another human
+                mx, my = m.body.position
+                repel_x = repel_y = 0.0
+                for other_civ, ox, oy in self.index.within((mx, my), 120):
+                    if other_civ is m or other_civ.team != "civilian": continue
+                    dx, dy = mx - ox, my - oy
+                    dist_civ = math.hypot(dx, dy)
+                    if dist_civ > 0: # If too close to another human
                         # Gentle push away to maintain spacing
-                        repel = diff_civ.normalized() * (3000 * (1.0 - dist_civ/120.0))
-                        m.body.apply_force_at_local_point(repel)
+                        push = 3000 * (1.0 - dist_civ/120.0) / dist_civ
+                        repel_x += dx * push
+                        repel_y += dy * push
+                if repel_x or repel_y:
+                    m.body.apply_force_at_local_point((repel_x, repel_y))
 
                 # 2. ZOMBIE EVASION
                 if zombies:
-                    # Filter active (non-trapped) zombies
-                    active_zombies = [z for z in zombies if getattr(z, 'trapped_timer', 0) <= 0]
-                    if active_zombies:
-                        nearest_zombie = min(active_zombies, key=lambda z: (m.body.position - z.body.position).length)
+                    # Nearest active (non-trapped) zombie; only those within 500 matter
+                    nearest_zombie = self.zombie_index.nearest(
+                        m.body.position,
+                        lambda z: getattr(z, 'trapped_timer', 0) <= 0,
+                        max_radius=500)
+                    if nearest_zombie:
                         diff = m.body.position - nearest_zombie.body.position
                         dist = diff.length
                         if dist < 500:
@@ -119,15 +138,16 @@ class GameState:
                             escape_mag = 12000 * (1.0 - (dist / 500.0))
                             m.body.apply_force_at_local_point(diff.normalized() * (4000 + escape_mag))
 
-            if m.apply_ai_force():
+            if m.apply_ai_force(self.rng):
                 self._fire_projectile(m)
                 
             # Magnet logic
             if m.magnet_active:
-                for other in self.marbles:
+                mx, my = m.body.position
+                for other, ox, oy in self.index.within((mx, my), 400):
                     if other != m and other not in self.physics.to_remove:
-                        dx = m.body.position.x - other.body.position.x
-                        dy = m.body.position.y - other.body.position.y
+                        dx = mx - ox
+                        dy = my - oy
                         dist_sq = dx*dx + dy*dy
                         if 0 < dist_sq < 400*400:
                             dist = math.sqrt(dist_sq)
@@ -169,16 +189,11 @@ class GameState:
 
     def _fire_projectile(self, shooter):
         # Find target
-        target = None
-        min_dist = float('inf')
-        for m in self.marbles:
-            if m.team != shooter.team and m not in self.physics.to_remove:
-                d = (m.body.position - shooter.body.position).length_squared
-                if d < min_dist:
-                    min_dist = d
-                    target = m
+        target = self.index.nearest(
+            shooter.body.position,
+            lambda m: m.team != shooter.team and m not in self.physics.to_remove)
         
-        angle = random.uniform(0, 6.28)
+        angle = self.rng.uniform(0, 6.28)
         if target:
             diff = target.body.position - shooter.body.position
             angle = math.atan2(diff.y, diff.x)
@@ -190,9 +205,9 @@ class GameState:
         self.powerup_spawn_timer += config.TIMESTEP
         if self.powerup_spawn_timer >= config.POWERUP_SPAWN_INTERVAL:
             self.powerup_spawn_timer = 0
-            x = random.randint(50, config.WIDTH-50)
-            y = random.randint(50, config.HEIGHT-50)
-            t = random.choice(config.POWERUP_TYPES)
+            x = self.rng.randint(50, config.WIDTH-50)
+            y = self.rng.randint(50, config.HEIGHT-50)
+            t = self.rng.choice(config.POWERUP_TYPES)
             self.powerups.append(PowerUp(x, y, t))
             
         for p in self.powerups[:]:
@@ -221,7 +236,7 @@ class GameState:
         
         if self.frame_count >= config.BOMB_START_FRAME and not self.bomb_active and self.marbles:
             self.bomb_active = True
-            self.bomb_holder = random.choice(self.marbles)
+            self.bomb_holder = self.rng.choice(self.marbles)
             self.bomb_timer = config.BOMB_DURATION
             self.last_tick = int(self.bomb_timer)
             
@@ -238,7 +253,7 @@ class GameState:
                 
                 valid = [m for m in self.marbles if m != self.bomb_holder and m not in self.physics.to_remove]
                 if valid:
-                    self.bomb_holder = random.choice(valid)
+                    self.bomb_holder = self.rng.choice(valid)
                     self.bomb_timer = config.BOMB_DURATION
                     self.last_tick = int(self.bomb_timer)
                 else:
@@ -278,28 +293,25 @@ class GameState:
                         bounce = config.ZONE_BOUNCE_FACTOR
                         dot = vx*nx + vy*ny
                         m.body.velocity = (vx - (1+bounce)*dot*nx, vy - (1+bounce)*dot*ny)
-                        m.body.apply_impulse_at_local_point((random.uniform(-100,100), random.uniform(-100,100)))
+                        m.body.apply_impulse_at_local_point((self.rng.uniform(-100,100), self.rng.uniform(-100,100)))
 
     def _update_shake(self):
         if self.physics.shake_intensity > 0: # Access from physics triggers
             self.shake_intensity = self.physics.shake_intensity
             self.physics.shake_intensity *= 0.9 # Decay in physics
             
-            self.shake_offset = (random.uniform(-self.shake_intensity, self.shake_intensity), 
-                                 random.uniform(-self.shake_intensity, self.shake_intensity))
+            self.shake_offset = (self.rng.uniform(-self.shake_intensity, self.shake_intensity), 
+                                 self.rng.uniform(-self.shake_intensity, self.shake_intensity))
             if self.shake_intensity < 0.5:
                 self.shake_intensity = 0
                 self.shake_offset = (0, 0)
 
     def _remove_dead(self):
-        for p in self.physics.to_remove_projectiles:
-            if p in self.projectiles:
-                self.space.remove(p.shape, p.body)
-                self.projectiles.remove(p)
-        self.physics.to_remove_projectiles.clear()
+        # compact() returns the dead in list order, not set order: set order
+        # depends on object ids and the order of space.remove() changes the
+        # simulation (replays).
+        for p in self.projectiles.compact():
+            self.space.remove(p.shape, p.body)
         
-        for m in self.physics.to_remove:
-            if m in self.marbles:
-                self.space.remove(m.shape, m.body)
-                self.marbles.remove(m)
-        self.physics.to_remove.clear()
+        for m in self.marbles.compact():
+            self.space.remove(m.shape, m.body)
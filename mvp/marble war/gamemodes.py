@@ -15,6 +15,9 @@ class GameMode:
     """Base class for game modes."""
     name = "Base"
     
+    def __init__(self, rng=random):
+        self.rng = rng # random.Random of the match (or the random module)
+    
     def setup_marbles(self, space: pymunk.Space) -> List[Marble]:
         return []
     
@@ -45,8 +48,8 @@ class BattleRoyale(GameMode):
         count_per_team = 12
         for start_x, start_y, team, color in positions:
             for _ in range(count_per_team):
-                x = start_x + random.uniform(-40, 40)
-                y = start_y + random.uniform(-40, 40)
+                x = start_x + self.rng.uniform(-40, 40)
+                y = start_y + self.rng.uniform(-40, 40)
                 marbles.append(Marble(x, y, team, color, space))
         return marbles
 
@@ -76,8 +79,8 @@ class ZombieOutbreak(GameMode):
         num_civilians = 60
         for i in range(num_civilians):
             cx, cy = corners[i % 4]
-            x = cx + random.uniform(-50, 50)
-            y = cy + random.uniform(-50, 50)
+            x = cx + self.rng.uniform(-50, 50)
+            y = cy + self.rng.uniform(-50, 50)
             
             civ = Marble(x, y, "civilian", (0, 100, 255), space)
             civ.trapped_timer = 30.0 # 30s countdown
@@ -141,9 +144,9 @@ class Portal:
         self.color = color
         self.radius = 60
 
-def generate_portals() -> List[Portal]:
+def generate_portals(rng=random) -> List[Portal]:
     """Occasionally generate portal pairs."""
-    if random.random() > 0.7: # 30% chance of portals
+    if rng.random() > 0.7: # 30% chance of portals
         p1 = Portal((200, config.HEIGHT//2), (config.WIDTH-200, config.HEIGHT//2), (255, 165, 0)) # Orange
         p2 = Portal((config.WIDTH-200, config.HEIGHT//2), (200, config.HEIGHT//2), (0, 191, 255)) # Blue
         return [p1, p2]
@@ -155,7 +158,7 @@ class Domination(GameMode):
     
     def setup_marbles(self, space: pymunk.Space) -> List[Marble]:
         # Same setup as Battle Royale
-        return BattleRoyale().setup_marbles(space)
+        return BattleRoyale(self.rng).setup_marbles(space)
 
     def handle_collision(self, m1: Marble, m2: Marble) -> Tuple[bool, Optional[str]]:
         # Stronger impulse wins (attacker logic) or random?
@@ -191,8 +194,8 @@ class Juggernaut(GameMode):
         
         # 50 Attackers
         for _ in range(50):
-            x = random.randint(100, config.WIDTH - 100)
-            y = random.randint(100, config.HEIGHT - 100)
+            x = self.rng.randint(100, config.WIDTH - 100)
+            y = self.rng.randint(100, config.HEIGHT - 100)
             # Ensure not spawning on boss (center)
             if abs(x - config.WIDTH//2) < 150 and abs(y - config.HEIGHT//2) < 150:
                 continue
@@ -238,9 +241,9 @@ class Juggernaut(GameMode):
         if not attackers_alive: return "THE JUGGERNAUT"
         return None
 
-def get_random_mode() -> GameMode:
-    """Select a random game mode."""
+def get_random_mode(rng=random) -> GameMode:
+    """Select a random game mode (rng: random.Random of the match)."""
     options = [BattleRoyale, ZombieOutbreak, Domination, Juggernaut]
-    mode = random.choice(options)
+    mode = rng.choice(options)
     print(f"🎲 Selected Mode: {mode.name}")
-    return mode()
\ No newline at end of file
+    return mode(rng)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Adaptive Physics Stepper for Marble War.
+Splits each frame into k substeps when something moves fast enough to
+tunnel, and lowers the solver iterations when the arena is sparse.
+
+A circle can skip a contact once it travels, in one step, more than its
+radius plus half the thinnest thing it can hit (`min_feature`, the 30px
+bars of the spinner and funnel layouts):
+
+    k = ceil(max(speed * dt / (radius + min_feature)) / safety), clamped to [1, max_substeps]
+    iterations = base * coverage / dense_coverage, clamped to [min_iterations, base]
+
+where coverage is the share of the arena covered by moving circles.
+Reading every body from pymunk costs ~4us, so the plan is only refreshed
+every `replan_every` frames.
+
+Everything is computed from the space, so the same state always gives
+the same k and iterations (replays stay deterministic).
+
+pymunk runs post_solve callbacks on every substep; pass the PhysicsEngine
+as `contacts` so their side effects (sounds, particles, bomb passes) still
+happen once per frame when k > 1 (PhysicsEngine.once_per_frame).
+"""
+
+import math
+
+import pymunk
+
+import config
+
+
+class AdaptiveStepper:
+    """Drop-in for space.step(dt): step(dt) runs k substeps of dt / k."""
+
+    def __init__(self, space: pymunk.Space, max_substeps: int = 4, safety: float = 1.0,
+                 min_feature: float = 15.0, base_iterations: int = 10, min_iterations: int = 4,
+                 dense_coverage: float = 0.15, replan_every: int = 4, contacts=None):
+        self.space = space
+        self.contacts = contacts
+        self.max_substeps = max_substeps
+        self.safety = safety
+        self.min_feature = min_feature
+        self.base_iterations = base_iterations
+        self.min_iterations = min_iterations
+        self.dense_coverage = dense_coverage
+        self.replan_every = replan_every
+        self.area = config.WIDTH * config.HEIGHT
+        self.frames = 0
+        # Current plan (for stats / benchmarks)
+        self.substeps = 1
+        self.iterations = space.iterations
+
+    def plan(self, dt: float):
+        """(substeps, iterations) for the current state of the space."""
+        worst = 0.0 # Largest (displacement per step / tunnelling margin) squared
+        covered = 0.0
+        dynamic = pymunk.Body.DYNAMIC
+        for shape in self.space.shapes:
+            body = shape.body
+            if body.body_type != dynamic or not isinstance(shape, pymunk.Circle):
+                continue
+            r = shape.radius
+            covered += r * r
+            vx, vy = body.velocity
+            travel = (vx * vx + vy * vy) / ((r + self.min_feature) * (r + self.min_feature))
+            if travel > worst:
+                worst = travel
+        covered *= math.pi
+
+        substeps = math.ceil(math.sqrt(worst) * dt / self.safety)
+        substeps = min(self.max_substeps, max(1, substeps))
+        iterations = math.ceil(self.base_iterations * covered / self.area / self.dense_coverage)
+        iterations = min(self.base_iterations, max(self.min_iterations, iterations))
+        return substeps, iterations
+
+    def step(self, dt: float = config.TIMESTEP) -> None:
+        if self.frames % self.replan_every == 0:
+            self.substeps, self.iterations = self.plan(dt)
+            self.space.iterations = self.iterations
+        self.frames += 1
+        if self.substeps > 1 and self.contacts is not None:
+            with self.contacts.once_per_frame():
+                self._substeps(dt)
+        else:
+            self._substeps(dt)
+
+    def _substeps(self, dt: float) -> None:
+        sub_dt = dt / self.substeps
+        for _ in range(self.substeps):
+            self.space.step(sub_dt)
@@ -0,0 +1,75 @@
+"""
+Replay Log for Marble War.
+A match is fully determined by its seed and the game config, so a replay is
+just the two of them (plus a few outcome fields to read at a glance).
+Re-rendering a replay with the same config gives the same frames.
+
+Usage: python replay_log.py <file.replay.json> [output.mp4]
+"""
+
+import hashlib
+import json
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+import config
+
+
+def config_hash() -> str:
+    """Short hash of every UPPER_CASE setting in config.py."""
+    settings = {k: getattr(config, k) for k in dir(config) if k.isupper()}
+    blob = json.dumps(settings, sort_keys=True, default=repr)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+@dataclass
+class ReplayLog:
+    """Seed + config hash of a match."""
+    seed: int
+    config_hash: str
+    mode: str = ""
+    arena: str = ""
+    frames: int = 0
+    winner: Optional[str] = None
+
+    @classmethod
+    def from_game(cls, game) -> "ReplayLog":
+        return cls(
+            seed=game.seed,
+            config_hash=config_hash(),
+            mode=game.state.game_mode.name,
+            arena=game.current_arena,
+            frames=game.frame_count,
+            winner=game.state.winner_team,
+        )
+
+    def save(self, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+
+    @classmethod
+    def load(cls, path: Path) -> "ReplayLog":
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def matches_config(self) -> bool:
+        """False if config.py changed since the match was recorded."""
+        return self.config_hash == config_hash()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    replay = ReplayLog.load(Path(sys.argv[1]))
+    if not replay.matches_config():
+        print(f"⚠️ Config changed since this replay was recorded ({replay.config_hash} != {config_hash()}), "
+              f"the match will play out differently.")
+
+    from video_generator import VideoGenerator
+
+    output = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(f"replay_{replay.seed}.mp4")
+    VideoGenerator().render(output, seed=replay.seed)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Seed Screening for Marble War.
+Plays N seeds in parallel with MarbleWar(simulate_only=True) (no rendering)
+and writes match length, winner and elimination count per seed to a CSV,
+so only the interesting seeds get sent to the renderer.
+
+Usage: python screen_seeds.py 200 --start 1000 --workers 4 --out seeds.csv
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
+
+import config
+
+FIELDS = ["seed", "frames", "seconds", "winner", "eliminations", "mode", "arena", "sim_time"]
+
+
+def screen_seed(seed: int, max_frames: int) -> dict:
+    """Worker: plays one seed headless and returns its outcome."""
+    from game import MarbleWar
+
+    t0 = time.perf_counter()
+    game = MarbleWar(simulate_only=True, seed=seed)
+    result = game.simulate(max_frames)
+    result["sim_time"] = round(time.perf_counter() - t0, 2)
+    return result
+
+
+def screen_seeds(seeds, out_path: Path, workers: int, max_frames: int = config.TOTAL_FRAMES):
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(screen_seed, seed, max_frames) for seed in seeds]
+        for future in concurrent.futures.as_completed(futures):
+            r = future.result()
+            results.append(r)
+            print(f"🎲 seed {r['seed']:>6} | {r['seconds']:>6.1f}s | winner {str(r['winner']):<10} | "
+                  f"{r['eliminations']:>4} kills | {r['mode']} ({r['sim_time']:.1f}s)")
+
+    results.sort(key=lambda r: r["seed"])
+    with open(out_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"✅ {len(results)} seeds screened -> {out_path}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("count", type=int, nargs="?", default=16)
+    parser.add_argument("--start", type=int, default=0, help="first seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--frames", type=int, default=config.TOTAL_FRAMES, help="frame limit per match")
+    parser.add_argument("--out", type=str, default="seed_screen.csv")
+    args = parser.parse_args()
+
+    screen_seeds(range(args.start, args.start + args.count), Path(args.out), args.workers, args.frames)
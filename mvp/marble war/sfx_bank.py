@@ -0,0 +1,205 @@
+"""
+SFX Bank for Marble War.
+Everything AudioRenderer needs from disk, decoded once: the SFX at the
+output sample rate, every pitch bucket of them pre-resampled (float32, as
+EventMixer uses them) and the background music.
+
+The bank is cached on disk as an .npz keyed by (file path, mtime, sample
+rate) of every source, so a new renderer only loads one file. A batch can
+go further and put the bank in `multiprocessing.shared_memory` once
+(`share()`); workers `attach()` to it and get read-only numpy views instead
+of decoding their own copy.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.io import wavfile
+
+import config
+from audio_mixer import PITCH_BUCKETS, PITCH_MAX, PITCH_MIN, bucket_pitch, resample
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "marble_war"
+CACHE_VERSION = 2 # 2: int32 / uint8 WAVs are converted, not scaled
+ALIGN = 64 # Byte alignment of arrays inside the shared block
+
+
+def read_wav(path: Path, samplerate: int) -> np.ndarray:
+    """int16 stereo at `samplerate`."""
+    sr, data = wavfile.read(str(path))
+    # Normalize to int16 range if needed (scipy reads as is)
+    if np.issubdtype(data.dtype, np.floating):
+        data = (data * 32767).astype(np.int16)
+    elif data.dtype == np.int32:
+        data = (data >> 16).astype(np.int16)
+    elif data.dtype == np.uint8:
+        data = (data.astype(np.int16) - 128) << 8
+    # Ensure Stereo
+    if len(data.shape) == 1:
+        data = np.stack([data, data], axis=1)
+    if sr != samplerate:
+        data = resample(data, sr / samplerate)
+    return np.ascontiguousarray(data)
+
+
+@dataclass(frozen=True)
+class SharedBankHandle:
+    """Picklable description of a bank living in shared memory."""
+    shm_name: str
+    samplerate: int
+    bg_path: str
+    layout: Tuple[Tuple[str, int, Tuple[int, ...], str], ...] # (key, offset, shape, dtype)
+
+
+class SfxBank:
+    """
+    kernels: name -> int16 stereo SFX at the bank sample rate.
+    pitched: (name, bucket) -> float32 stereo kernel (see EventMixer.kernel).
+    bg: int16 stereo background music, or None.
+    """
+
+    def __init__(self, samplerate: int, kernels: Dict[str, np.ndarray],
+                 pitched: Dict[Tuple[str, int], np.ndarray], bg: Optional[np.ndarray],
+                 bg_path: Path):
+        self.samplerate = samplerate
+        self.kernels = kernels
+        self.pitched = pitched
+        self.bg = bg
+        self.bg_path = bg_path
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    # --- building / disk cache ---
+
+    @staticmethod
+    def sources(root_dir: Path) -> Tuple[Dict[str, Path], Path]:
+        sfx = {name: root_dir / rel for name, rel in config.AUDIO_PATHS.items() if name != "bg"}
+        bg = root_dir / config.AUDIO_PATHS.get("bg", "assets/music/bg_48.wav")
+        return sfx, bg
+
+    @classmethod
+    def cache_key(cls, root_dir: Path, samplerate: int) -> str:
+        sfx, bg = cls.sources(root_dir)
+        entries = []
+        for name, path in sorted(sfx.items()) + [("bg", bg)]:
+            mtime = path.stat().st_mtime_ns if path.exists() else None
+            entries.append([name, str(path.resolve()), mtime])
+        blob = json.dumps([CACHE_VERSION, samplerate, PITCH_MIN, PITCH_MAX, PITCH_BUCKETS, entries])
+        return hashlib.sha1(blob.encode()).hexdigest()[:16]
+
+    @classmethod
+    def build(cls, root_dir: Path, samplerate: int) -> "SfxBank":
+        """Decodes and resamples everything (cold path)."""
+        sfx, bg_path = cls.sources(root_dir)
+        kernels = {}
+        for name, path in sfx.items():
+            if not path.exists():
+                print(f"⚠️ SFX missing: {path}")
+                continue
+            try:
+                kernels[name] = read_wav(path, samplerate)
+            except Exception as e:
+                print(f"⚠️ Failed to load SFX {path}: {e}")
+
+        pitched = {}
+        for name, base in kernels.items():
+            for bucket in range(PITCH_BUCKETS):
+                pitched[(name, bucket)] = np.ascontiguousarray(
+                    resample(base, bucket_pitch(bucket)), dtype=np.float32)
+
+        bg = None
+        if bg_path.exists():
+            try:
+                bg = read_wav(bg_path, samplerate)
+            except Exception as e:
+                print(f"⚠️ Failed to load background music {bg_path}: {e}")
+            if bg is not None and len(bg) == 0:
+                bg = None
+        return cls(samplerate, kernels, pitched, bg, bg_path)
+
+    @classmethod
+    def load(cls, root_dir: Path, samplerate: int, cache_dir: Optional[Path] = None) -> "SfxBank":
+        """Bank from the .npz cache, built (and cached) if the sources changed."""
+        cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+        cache_file = cache_dir / f"sfx_bank_{cls.cache_key(root_dir, samplerate)}.npz"
+        _, bg_path = cls.sources(root_dir)
+        if cache_file.exists():
+            try:
+                with np.load(cache_file) as npz:
+                    return cls.from_arrays({k: npz[k] for k in npz.files}, samplerate, bg_path)
+            except Exception as e:
+                print(f"⚠️ SFX cache unreadable, rebuilding: {e}")
+
+        bank = cls.build(root_dir, samplerate)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(cache_file.stem + f".{os.getpid()}.tmp.npz")
+            np.savez(tmp, **bank.to_arrays())
+            os.replace(tmp, cache_file) # Atomic: parallel workers may race here
+        except OSError as e:
+            print(f"⚠️ Could not write SFX cache {cache_file}: {e}")
+        return bank
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {f"sfx/{name}": k for name, k in self.kernels.items()}
+        arrays.update({f"pitched/{name}/{bucket}": k for (name, bucket), k in self.pitched.items()})
+        if self.bg is not None:
+            arrays["bg"] = self.bg
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], samplerate: int, bg_path: Path) -> "SfxBank":
+        kernels, pitched = {}, {}
+        for key, array in arrays.items():
+            kind, _, rest = key.partition("/")
+            if kind == "sfx":
+                kernels[rest] = array
+            elif kind == "pitched":
+                name, _, bucket = rest.rpartition("/")
+                pitched[(name, int(bucket))] = array
+        return cls(samplerate, kernels, pitched, arrays.get("bg"), bg_path)
+
+    # --- shared memory ---
+
+    def share(self) -> SharedBankHandle:
+        """Copies the bank into one shared memory block. Call unlink() when the batch is done."""
+        arrays = self.to_arrays()
+        layout: List[Tuple[str, int, Tuple[int, ...], str]] = []
+        offset = 0
+        for key, array in arrays.items():
+            layout.append((key, offset, array.shape, array.dtype.str))
+            offset += -(-array.nbytes // ALIGN) * ALIGN
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for (key, start, shape, dtype) in layout:
+            view = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=start)
+            view[...] = arrays[key]
+        return SharedBankHandle(self._shm.name, self.samplerate, str(self.bg_path), tuple(layout))
+
+    @classmethod
+    def attach(cls, handle: SharedBankHandle) -> "SfxBank":
+        """Read-only bank backed by the shared block of another process."""
+        shm = shared_memory.SharedMemory(name=handle.shm_name)
+        arrays = {}
+        for key, start, shape, dtype in handle.layout:
+            view = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)
+            view.flags.writeable = False
+            arrays[key] = view
+        bank = cls.from_arrays(arrays, handle.samplerate, Path(handle.bg_path))
+        bank._shm = shm # Keeps the mapping alive as long as the bank
+        return bank
+
+    def unlink(self) -> None:
+        """Frees the shared block (owner side)."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.to_arrays().values())
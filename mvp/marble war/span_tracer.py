@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Span Tracer for Marble War.
+Times pipeline phases (simulation step, draw, frame write, audio, mux) and
+writes one JSON line per span:
+
+    {"job": "marble_war_1700000000_0", "span": "step", "start": 12.345678, "ms": 0.812, "frame": 731}
+
+Tracing is off until `TRACER.open(path)`; a disabled tracer hands out a
+shared no-op span, so the instrumented code costs next to nothing.
+
+Usage: python span_tracer.py summarize batch_output/traces/*.jsonl
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "fields", "t0")
+
+    def __init__(self, tracer: "SpanTracer", name: str, fields: dict):
+        self.tracer = tracer
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        t1 = time.perf_counter()
+        self.tracer._record(self.name, self.t0, t1, self.fields)
+        return False
+
+
+class SpanTracer:
+    """Context-manager spans buffered and appended to a JSON lines file."""
+
+    def __init__(self, flush_every: int = 4096):
+        self.path: Optional[Path] = None
+        self.job = ""
+        self.flush_every = flush_every
+        self._lines: List[str] = []
+        self._origin = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def open(self, path: Union[str, Path], job: str = "") -> None:
+        """Starts tracing to `path` (appended). `job` tags every span."""
+        self.close()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.job = job or self.path.stem
+        self._origin = time.perf_counter()
+
+    def span(self, name: str, **fields):
+        """with TRACER.span("draw", frame=n): ..."""
+        if self.path is None:
+            return _NULL_SPAN
+        return _Span(self, name, fields)
+
+    def _record(self, name: str, t0: float, t1: float, fields: dict) -> None:
+        entry = {"job": self.job, "span": name, "start": round(t0 - self._origin, 6),
+                 "ms": round((t1 - t0) * 1000, 4)}
+        entry.update(fields)
+        self._lines.append(json.dumps(entry))
+        if len(self._lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.path is None or not self._lines:
+            return
+        with open(self.path, "a") as f:
+            f.write("\n".join(self._lines) + "\n")
+        self._lines = []
+
+    def close(self) -> None:
+        """Writes what is buffered and stops tracing."""
+        self.flush()
+        self.path = None
+
+
+# Shared by the whole pipeline (one trace file per video job)
+TRACER = SpanTracer()
+
+
+def load_spans(paths: List[Path]) -> Dict[str, List[float]]:
+    """Durations (ms) per span name across all files."""
+    spans: Dict[str, List[float]] = {}
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    spans.setdefault(entry["span"], []).append(entry["ms"])
+    return spans
+
+
+def summarize(paths: List[Path]) -> None:
+    spans = load_spans(paths)
+    jobs = len(paths)
+
+    print(f"\n{len(paths)} trace file(s)")
+    print(f"{'SPAN':<14} | {'COUNT':>8} | {'TOTAL (s)':>9} | {'P50 (ms)':>9} | "
+          f"{'P95 (ms)':>9} | {'MAX (ms)':>9} | {'S/JOB':>7}")
+    print("-" * 83)
+    for name, durations in sorted(spans.items(), key=lambda kv: -sum(kv[1])):
+        d = np.asarray(durations)
+        total = d.sum()
+        p50, p95 = np.percentile(d, [50, 95])
+        print(f"{name:<14} | {len(d):>8} | {total / 1000:>9.2f} | "
+              f"{p50:>9.3f} | {p95:>9.3f} | {d.max():>9.3f} | {total / 1000 / jobs:>7.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    summ = sub.add_parser("summarize", help="p50/p95 per phase across trace files")
+    summ.add_argument("paths", nargs="+", type=Path, help="trace .jsonl files or folders")
+    args = parser.parse_args()
+
+    files = []
+    for p in args.paths:
+        files.extend(sorted(p.glob("*.jsonl")) if p.is_dir() else [p])
+    summarize(files)
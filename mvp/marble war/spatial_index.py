@@ -0,0 +1,138 @@
+"""
+Spatial Index for Marble War.
+Uniform-grid hash of marble positions for nearest-neighbour and radius
+queries. GameState rebuilds it once per step, so queries see the positions
+at the start of the AI update; `within` hands those positions back so hot
+loops do not have to read them from pymunk again.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from entities import Marble
+
+Cell = Tuple[int, int]
+Entry = Tuple[Marble, float, float]
+
+
+class SpatialHash:
+    """Uniform grid keyed by (cell_x, cell_y)."""
+
+    def __init__(self, cell_size: float = 150.0) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, List[Entry]] = {}
+        self._bounds = (0, 0, -1, -1) # min_cx, min_cy, max_cx, max_cy
+
+    def rebuild(self, marbles: Iterable[Marble]) -> None:
+        self.cells = {}
+        size = self.cell_size
+        min_cx = min_cy = math.inf
+        max_cx = max_cy = -math.inf
+        for m in marbles:
+            x, y = m.body.position
+            cell = (int(x // size), int(y // size))
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = [(m, x, y)]
+                min_cx = min(min_cx, cell[0]); max_cx = max(max_cx, cell[0])
+                min_cy = min(min_cy, cell[1]); max_cy = max(max_cy, cell[1])
+            else:
+                bucket.append((m, x, y))
+        if self.cells:
+            self._bounds = (min_cx, min_cy, max_cx, max_cy)
+        else:
+            self._bounds = (0, 0, -1, -1)
+
+    def within(self, pos, r: float) -> List[Entry]:
+        """(marble, x, y) for every marble whose center is closer than r to pos."""
+        px, py = pos
+        size = self.cell_size
+        r_sq = r * r
+        found = []
+        for cx in range(int((px - r) // size), int((px + r) // size) + 1):
+            for cy in range(int((py - r) // size), int((py + r) // size) + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for m, x, y in bucket:
+                    dx = x - px
+                    dy = y - py
+                    if dx*dx + dy*dy < r_sq:
+                        found.append((m, x, y))
+        return found
+
+    def nearest(self, pos, predicate: Optional[Callable[[Marble], bool]] = None,
+                max_radius: float = math.inf) -> Optional[Marble]:
+        """
+        Closest marble to pos matching predicate (within max_radius), or None.
+        Searches rings of cells outwards and stops once no closer ring is left.
+        """
+        if not self.cells:
+            return None
+        px, py = pos
+        size = self.cell_size
+        qx, qy = int(px // size), int(py // size)
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        # Beyond this ring every cell is outside the occupied area
+        last_ring = max(qx - min_cx, max_cx - qx, qy - min_cy, max_cy - qy)
+
+        best = None
+        best_sq = max_radius * max_radius if max_radius != math.inf else math.inf
+        ring = 0
+        while ring <= last_ring:
+            for cell in self._ring(qx, qy, ring):
+                bucket = self.cells.get(cell)
+                if bucket is None:
+                    continue
+                for m, x, y in bucket:
+                    dx = x - px
+                    dy = y - py
+                    d_sq = dx*dx + dy*dy
+                    if d_sq < best_sq and (predicate is None or predicate(m)):
+                        best_sq = d_sq
+                        best = m
+            # Anything in ring + 1 is at least ring * size away
+            reach = ring * size
+            if reach * reach >= best_sq:
+                break
+            ring += 1
+        return best
+
+    @staticmethod
+    def _ring(qx: int, qy: int, ring: int):
+        if ring == 0:
+            yield (qx, qy)
+            return
+        for cx in range(qx - ring, qx + ring + 1):
+            yield (cx, qy - ring)
+            yield (cx, qy + ring)
+        for cy in range(qy - ring + 1, qy + ring):
+            yield (qx - ring, cy)
+            yield (qx + ring, cy)
+
+
+class LinearIndex:
+    """Brute-force index with the same API (reference and benchmarks)."""
+
+    def __init__(self) -> None:
+        self.entries: List[Entry] = []
+
+    def rebuild(self, marbles: Iterable[Marble]) -> None:
+        self.entries = [(m, *m.body.position) for m in marbles]
+
+    def within(self, pos, r: float) -> List[Entry]:
+        px, py = pos
+        r_sq = r * r
+        return [e for e in self.entries if (e[1] - px)**2 + (e[2] - py)**2 < r_sq]
+
+    def nearest(self, pos, predicate: Optional[Callable[[Marble], bool]] = None,
+                max_radius: float = math.inf) -> Optional[Marble]:
+        px, py = pos
+        best = None
+        best_sq = max_radius * max_radius if max_radius != math.inf else math.inf
+        for m, x, y in self.entries:
+            d_sq = (x - px)**2 + (y - py)**2
+            if d_sq < best_sq and (predicate is None or predicate(m)):
+                best_sq = d_sq
+                best = m
+        return best
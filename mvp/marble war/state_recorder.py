@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+State Recorder for Marble War.
+Records, frame by frame, everything GameRenderer.draw reads (marbles,
+projectiles, power-ups, particles, explosions, floating texts, zone, bomb,
+kill feed, spinner poses) into a folder of columnar files: one raw binary
+file per column, opened again as numpy memmaps. `RenderOnly` feeds those
+frames back to GameRenderer.draw, so a new theme or a visual fix can be
+rendered without running pymunk again. (replay_log.py only keeps the seed,
+and re-simulates.)
+
+    match.rec/
+        recording.json      seed, theme, arena layout, portals, strings, row counts
+        frames.<col>.bin    one row per frame (scalars + rows per table)
+        marbles.<col>.bin   one row per marble per frame
+        ...
+
+Particles are stored as their state after the step (position, life,
+color) rather than as emits, so replaying them does not depend on the
+match RNG.
+
+Usage: python state_recorder.py record --seed 7 --out match.rec
+       python state_recorder.py render match.rec --theme Matrix --out match_matrix.mp4
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from pymunk import Vec2d
+
+import config
+
+RECORDING_VERSION = 1
+FLUSH_EVERY = 256 # Frames buffered before the columns are appended to disk
+KILL_FEED = 5 # Messages the HUD shows
+
+# Marble flags
+ASSASSIN, FREEZE, MAGNET = 1, 2, 4
+
+# table -> [(column, dtype)]
+SCHEMA: Dict[str, List[tuple]] = {
+    "frames": [("frame_count", "<i4"), ("zone_active", "u1"), ("zone_radius", "<f8"),
+               ("shake_x", "<f8"), ("shake_y", "<f8"), ("bomb_active", "u1"),
+               ("bomb_x", "<f8"), ("bomb_y", "<f8"), ("winner", "<i4")]
+              + [(f"feed{i}", "<i4") for i in range(KILL_FEED)],
+    "marbles": [("x", "<f8"), ("y", "<f8"), ("r", "u1"), ("g", "u1"), ("b", "u1"),
+                ("team", "<i4"), ("face", "<i4"), ("trapped", "<f8"), ("flags", "u1"),
+                ("hp", "<i4"), ("max_hp", "<i4")],
+    "projectiles": [("x", "<f8"), ("y", "<f8")],
+    "powerups": [("x", "<f8"), ("y", "<f8"), ("type", "<i4")],
+    "particles": [("x", "<f8"), ("y", "<f8"), ("life", "<f8"), ("r", "u1"), ("g", "u1"), ("b", "u1")],
+    "explosions": [("x", "<f8"), ("y", "<f8"), ("alpha", "<i4"), ("image", "<i4")],
+    "texts": [("x", "<f8"), ("y", "<f8"), ("text", "<i4"), ("r", "u1"), ("g", "u1"), ("b", "u1"),
+              ("size", "<i4"), ("life", "<f8")],
+    "spinners": [("x", "<f8"), ("y", "<f8"), ("angle", "<f8")],
+}
+ENTITY_TABLES = [t for t in SCHEMA if t != "frames"]
+# Rows per frame of every entity table live in the frames table
+SCHEMA["frames"] += [(f"n_{t}", "<i4") for t in ENTITY_TABLES]
+
+
+class StateRecorder:
+    """Attach with `game.recorder = StateRecorder(path, game)`; close() when done."""
+
+    def __init__(self, path: Union[str, Path], game) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.frames = 0
+        self.rows = {t: 0 for t in SCHEMA}
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._columns = {t: {col: [] for col, _ in cols} for t, cols in SCHEMA.items()}
+        self._files = {t: {col: open(self.path / f"{t}.{col}.bin", "wb") for col, _ in cols}
+                       for t, cols in SCHEMA.items()}
+
+        # Explosion images are asset surfaces: stored by asset name
+        self._images = {}
+        if game.assets.explosion_img is not None:
+            self._images[id(game.assets.explosion_img)] = "explosion"
+        for name, surf in game.assets.face_assets.items():
+            self._images[id(surf)] = f"face:{name}"
+
+        from replay_log import config_hash
+        self.header = {
+            "version": RECORDING_VERSION,
+            "seed": game.seed,
+            "config_hash": config_hash(),
+            "mode": game.state.game_mode.name,
+            "arena": game.current_arena,
+            "theme": game.theme.name,
+            "layout": game.arena_gen.layout,
+            "portals": [[list(p.entry), list(p.exit), list(p.color), p.radius] for p in game.state.portals],
+        }
+
+    def _id(self, text: Optional[str]) -> int:
+        if text is None:
+            return -1
+        i = self._string_ids.get(text)
+        if i is None:
+            i = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return i
+
+    def capture(self, game) -> None:
+        """Appends the state GameRenderer.draw would see now."""
+        st = game.state
+        cols = self._columns
+
+        c = cols["marbles"]
+        for m in st.marbles:
+            x, y = m.body.position
+            c["x"].append(x); c["y"].append(y)
+            c["r"].append(m.color[0]); c["g"].append(m.color[1]); c["b"].append(m.color[2])
+            c["team"].append(self._id(m.team)); c["face"].append(self._id(m.current_face))
+            c["trapped"].append(getattr(m, "trapped_timer", 0))
+            c["flags"].append(ASSASSIN * m.assassin_mode | FREEZE * m.freeze_active | MAGNET * m.magnet_active)
+            c["hp"].append(m.hp); c["max_hp"].append(m.max_hp)
+
+        c = cols["projectiles"]
+        for p in st.projectiles:
+            x, y = p.body.position
+            c["x"].append(x); c["y"].append(y)
+
+        c = cols["powerups"]
+        for p in st.powerups:
+            c["x"].append(p.position.x); c["y"].append(p.position.y); c["type"].append(self._id(p.type))
+
+        c = cols["particles"]
+        ps = game.particles
+        n = len(ps)
+        c["x"].append(ps.pos[:n, 0].copy()); c["y"].append(ps.pos[:n, 1].copy())
+        c["life"].append(ps.life[:n].copy())
+        rgb = np.array(ps._palette_colors, dtype=np.uint8).reshape(-1, 3)[ps.color[:n]]
+        c["r"].append(rgb[:, 0]); c["g"].append(rgb[:, 1]); c["b"].append(rgb[:, 2])
+
+        c = cols["explosions"]
+        for e in game.explosions:
+            c["x"].append(e.pos.x); c["y"].append(e.pos.y); c["alpha"].append(e.alpha)
+            c["image"].append(self._id(self._images.get(id(e.image), "explosion")))
+
+        c = cols["texts"]
+        for ft in game.floating_texts:
+            c["x"].append(ft.pos.x); c["y"].append(ft.pos.y); c["text"].append(self._id(ft.text))
+            c["r"].append(ft.color[0]); c["g"].append(ft.color[1]); c["b"].append(ft.color[2])
+            c["size"].append(ft.size); c["life"].append(ft.life)
+
+        c = cols["spinners"]
+        for body in game.arena_gen.moving_bodies:
+            c["x"].append(body.position.x); c["y"].append(body.position.y); c["angle"].append(body.angle)
+
+        c = cols["frames"]
+        c["frame_count"].append(game.frame_count)
+        c["zone_active"].append(st.zone_active); c["zone_radius"].append(st.zone_radius)
+        c["shake_x"].append(st.shake_offset[0]); c["shake_y"].append(st.shake_offset[1])
+        c["bomb_active"].append(st.bomb_active)
+        holder = st.bomb_holder.body.position if st.bomb_holder else (math.nan, math.nan)
+        c["bomb_x"].append(holder[0]); c["bomb_y"].append(holder[1])
+        c["winner"].append(self._id(st.winner_team))
+        feed = st.kill_feed[-KILL_FEED:]
+        for i in range(KILL_FEED):
+            c[f"feed{i}"].append(self._id(feed[i]) if i < len(feed) else -1)
+        c["n_marbles"].append(len(st.marbles)); c["n_projectiles"].append(len(st.projectiles))
+        c["n_powerups"].append(len(st.powerups)); c["n_particles"].append(n)
+        c["n_explosions"].append(len(game.explosions)); c["n_texts"].append(len(game.floating_texts))
+        c["n_spinners"].append(len(game.arena_gen.moving_bodies))
+
+        self.frames += 1
+        if self.frames % FLUSH_EVERY == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        for table, cols in SCHEMA.items():
+            for col, dtype in cols:
+                values = self._columns[table][col]
+                if not values:
+                    continue
+                if isinstance(values[0], np.ndarray): # Particle columns: one array per frame
+                    array = np.concatenate(values).astype(dtype, copy=False)
+                else:
+                    array = np.asarray(values, dtype=dtype)
+                array.tofile(self._files[table][col])
+                values.clear()
+            self.rows[table] = self._count_rows(table)
+
+    def _count_rows(self, table: str) -> int:
+        dtype = np.dtype(SCHEMA[table][0][1])
+        return os.fstat(self._files[table][SCHEMA[table][0][0]].fileno()).st_size // dtype.itemsize
+
+    def close(self) -> None:
+        """Flushes the columns and writes the header."""
+        self.flush()
+        for cols in self._files.values():
+            for f in cols.values():
+                f.close()
+        header = dict(self.header, frames=self.frames, rows=self.rows, strings=self.strings,
+                      schema={t: cols for t, cols in SCHEMA.items()})
+        with open(self.path / "recording.json", "w") as f:
+            json.dump(header, f)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(p.stat().st_size for p in self.path.glob("*.bin"))
+
+
+class Recording:
+    """Read side: header + every column as a read-only memmap."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with open(self.path / "recording.json") as f:
+            self.header = json.load(f)
+        self.frames: int = self.header["frames"]
+        self.strings: List[str] = self.header["strings"]
+        self.tables: Dict[str, Dict[str, np.ndarray]] = {}
+        for table, cols in self.header["schema"].items():
+            rows = self.header["rows"][table]
+            self.tables[table] = {
+                col: (np.memmap(self.path / f"{table}.{col}.bin", dtype=dtype, mode="r", shape=(rows,))
+                      if rows else np.empty(0, dtype=dtype))
+                for col, dtype in cols}
+        counts = self.tables["frames"]
+        self.offsets = {t: np.concatenate([[0], np.cumsum(counts[f"n_{t}"], dtype=np.int64)])
+                        for t in ENTITY_TABLES}
+
+    def rows(self, table: str, frame: int) -> Dict[str, np.ndarray]:
+        """Columns of `table` for one frame."""
+        lo, hi = self.offsets[table][frame], self.offsets[table][frame + 1]
+        return {col: values[lo:hi] for col, values in self.tables[table].items()}
+
+    def string(self, i: int) -> Optional[str]:
+        return self.strings[i] if i >= 0 else None
+
+
+class _Body:
+    __slots__ = ("position",)
+
+    def __init__(self, x: float, y: float):
+        self.position = Vec2d(x, y)
+
+
+class ReplayMarble:
+    """The Marble attributes GameRenderer reads."""
+    __slots__ = ("body", "color", "team", "current_face", "trapped_timer",
+                 "assassin_mode", "freeze_active", "magnet_active", "hp", "max_hp")
+
+
+class ReplayProjectile:
+    __slots__ = ("body",)
+    radius = config.PROJECTILE_RADIUS
+
+    def __init__(self, x: float, y: float):
+        self.body = _Body(x, y)
+
+    def draw(self, screen, image=None) -> None:
+        from entities import Projectile # pygame stays out of the recording side
+        Projectile.draw(self, screen, image)
+
+
+class RenderOnly:
+    """
+    Draws recorded frames with GameRenderer, without pymunk or the game
+    logic. theme: theme name, the recorded one if None.
+    """
+
+    def __init__(self, path: Union[str, Path], theme: Optional[str] = None) -> None:
+        import pygame
+        import pymunk
+        from arenas import ArenaGenerator
+        from assets import AssetManager
+        from effects import ParticleSystem
+        from game_renderer import GameRenderer
+        from gamemodes import Portal
+        from themes import ThemeManager
+
+        self.rec = Recording(path)
+        header = self.rec.header
+        if not pygame.get_init():
+            pygame.init()
+        self.screen = pygame.display.get_surface()
+        if self.screen is None or self.screen.get_size() != (config.WIDTH, config.HEIGHT):
+            self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+
+        self.assets = AssetManager()
+        self.assets.load_images()
+        self.theme = ThemeManager.get_theme(theme or header["theme"])
+        self.renderer = GameRenderer(self.screen, self.assets, self.theme)
+        self.arena = ArenaGenerator.from_layout(pymunk.Space(), [tuple(spec) for spec in header["layout"]])
+        self.portals = []
+        for entry, exit_pos, color, radius in header["portals"]:
+            portal = Portal(tuple(entry), tuple(exit_pos), tuple(color))
+            portal.radius = radius
+            self.portals.append(portal)
+        self.particles = ParticleSystem()
+
+        self._images = {"explosion": self.assets.explosion_img}
+        self._images.update({f"face:{name}": surf for name, surf in self.assets.face_assets.items()})
+
+    def __len__(self) -> int:
+        return self.rec.frames
+
+    def draw(self, i: int) -> None:
+        """Renders recorded frame i (0-based) on self.screen."""
+        from effects import Explosion, FloatingText, PowerUp
+
+        rec, string = self.rec, self.rec.string
+        f = {col: values[i] for col, values in rec.tables["frames"].items()}
+
+        c = rec.rows("marbles", i)
+        marbles = []
+        for x, y, r, g, b, team, face, trapped, flags, hp, max_hp in zip(
+                *(c[col].tolist() for col, _ in SCHEMA["marbles"])):
+            m = ReplayMarble()
+            m.body = _Body(x, y)
+            m.color = (r, g, b)
+            m.team, m.current_face = string(team), string(face)
+            m.trapped_timer = trapped
+            m.assassin_mode, m.freeze_active, m.magnet_active = bool(flags & ASSASSIN), bool(flags & FREEZE), bool(flags & MAGNET)
+            m.hp, m.max_hp = hp, max_hp
+            marbles.append(m)
+
+        c = rec.rows("projectiles", i)
+        projectiles = [ReplayProjectile(x, y) for x, y in zip(c["x"].tolist(), c["y"].tolist())]
+
+        c = rec.rows("powerups", i)
+        powerups = [PowerUp(x, y, string(t)) for x, y, t in zip(c["x"].tolist(), c["y"].tolist(), c["type"].tolist())]
+
+        c = rec.rows("particles", i)
+        self.particles.set_state(np.column_stack([c["x"], c["y"]]), c["life"],
+                                 np.column_stack([c["r"], c["g"], c["b"]]))
+
+        c = rec.rows("explosions", i)
+        explosions = []
+        for x, y, alpha, image in zip(c["x"].tolist(), c["y"].tolist(), c["alpha"].tolist(), c["image"].tolist()):
+            img = self._images.get(string(image)) or self.assets.explosion_img
+            e = Explosion(x, y, img, self.assets.explosion_atlas(img))
+            e.alpha = alpha
+            explosions.append(e)
+
+        c = rec.rows("texts", i)
+        texts = []
+        for x, y, text, r, g, b, size, life in zip(*(c[col].tolist() for col, _ in SCHEMA["texts"])):
+            ft = FloatingText(x, y, string(text), (r, g, b), size)
+            ft.life = life
+            texts.append(ft)
+
+        c = rec.rows("spinners", i)
+        for body, x, y, angle in zip(self.arena.moving_bodies, c["x"].tolist(), c["y"].tolist(), c["angle"].tolist()):
+            body.position = (x, y)
+            body.angle = angle
+
+        bomb_holder = None
+        if not math.isnan(f["bomb_x"]):
+            bomb_holder = ReplayMarble()
+            bomb_holder.body = _Body(float(f["bomb_x"]), float(f["bomb_y"]))
+        shake = (float(f["shake_x"]), float(f["shake_y"]))
+        if shake == (0.0, 0.0):
+            shake = (0, 0)
+
+        self.renderer.draw(
+            marbles=marbles,
+            powerups=powerups,
+            projectiles=projectiles,
+            particles=self.particles,
+            explosions=explosions,
+            floating_texts=texts,
+            arena_gen=self.arena,
+            zone_active=bool(f["zone_active"]),
+            zone_radius=float(f["zone_radius"]),
+            shake_offset=shake,
+            bomb_active=bool(f["bomb_active"]),
+            bomb_holder=bomb_holder,
+            winner_team=string(int(f["winner"])),
+            kill_feed=[string(int(f[f"feed{k}"])) for k in range(KILL_FEED) if f[f"feed{k}"] >= 0],
+            portals=self.portals,
+            frame_count=int(f["frame_count"]),
+        )
+
+    def frames(self):
+        """Draws every frame in order, yielding the screen after each one."""
+        for i in range(len(self)):
+            self.draw(i)
+            yield self.screen
+
+
+def record(seed: int, out: Path, frames: int = config.TOTAL_FRAMES) -> StateRecorder:
+    """Simulates a match (no drawing) and records it."""
+    from game import MarbleWar
+    game = MarbleWar(headless=True, seed=seed)
+    recorder = game.recorder = StateRecorder(out, game)
+    while game.frame_count < frames and game.step():
+        pass
+    recorder.close()
+    return recorder
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec_cmd = sub.add_parser("record", help="simulate a seed and record every frame")
+    rec_cmd.add_argument("--seed", type=int, required=True)
+    rec_cmd.add_argument("--frames", type=int, default=config.TOTAL_FRAMES)
+    rec_cmd.add_argument("--out", type=Path, required=True)
+    ren_cmd = sub.add_parser("render", help="render a recording to a (silent) video")
+    ren_cmd.add_argument("recording", type=Path)
+    ren_cmd.add_argument("--theme", type=str, default=None)
+    ren_cmd.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    if args.command == "record":
+        recorder = record(args.seed, args.out, args.frames)
+        print(f"💾 {recorder.frames} frames, {recorder.nbytes / 2**20:.1f} MB -> {args.out} "
+              f"({time.perf_counter() - t0:.1f}s)")
+    else:
+        sys.path.append(str(Path(__file__).resolve().parent.parent))
+        from common.frame_sink import FrameSink
+        player = RenderOnly(args.recording, theme=args.theme)
+        sink = FrameSink(args.out, fps=config.FPS, preset="medium", crf=18, loglevel="error")
+        try:
+            for screen in player.frames():
+                sink.write(screen)
+        finally:
+            sink.close()
+        print(f"🎬 {len(player)} frames ({player.theme.name}) -> {args.out} ({time.perf_counter() - t0:.1f}s)")
@@ -0,0 +1,75 @@
+"""
+Surface Pool for Marble War.
+Reusable scratch surfaces keyed by (size, flags), so overlays drawn every
+frame (a 1080x1920 SRCALPHA surface is ~8 MB) are allocated once per
+renderer instead of once per frame. Allocation counters (total and for
+the current frame) show whether drawing has reached a steady state.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+import pygame
+
+PoolKey = Tuple[Tuple[int, int], int]
+
+
+class SurfacePool:
+    """acquire()/release() pairs, or `with pool.borrow(size, flags) as surf:`."""
+
+    def __init__(self) -> None:
+        self._free: Dict[PoolKey, List[pygame.Surface]] = defaultdict(list)
+        self._keys: Dict[int, PoolKey] = {} # id(surface) -> key, for release()
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.stats = {"borrows": 0, "allocations": 0, "bytes": 0,
+                      "frame_allocations": 0, "frame_bytes": 0}
+
+    def new_frame(self) -> None:
+        """Starts the per-frame counters (GameRenderer.draw calls it)."""
+        self.stats["frame_allocations"] = 0
+        self.stats["frame_bytes"] = 0
+
+    def acquire(self, size: Tuple[int, int], flags: int = 0) -> pygame.Surface:
+        """A surface of that size and flags. Its content is undefined: fill it."""
+        key = ((int(size[0]), int(size[1])), flags)
+        self.stats["borrows"] += 1
+        free = self._free[key]
+        if free:
+            return free.pop()
+
+        surf = pygame.Surface(key[0], flags)
+        self._keys[id(surf)] = key
+        nbytes = surf.get_bytesize() * key[0][0] * key[0][1]
+        self.stats["allocations"] += 1
+        self.stats["bytes"] += nbytes
+        self.stats["frame_allocations"] += 1
+        self.stats["frame_bytes"] += nbytes
+        return surf
+
+    def release(self, surf: pygame.Surface) -> None:
+        self._free[self._keys[id(surf)]].append(surf)
+
+    @contextmanager
+    def borrow(self, size: Tuple[int, int], flags: int = 0):
+        surf = self.acquire(size, flags)
+        try:
+            yield surf
+        finally:
+            self.release(surf)
+
+    def clear(self) -> None:
+        """Drops every free surface (surfaces still borrowed stay valid)."""
+        for free in self._free.values():
+            for surf in free:
+                del self._keys[id(surf)]
+        self._free.clear()
+
+    def report(self) -> str:
+        s = self.stats
+        return (f"{s['borrows']} borrows, {s['allocations']} allocations "
+                f"({s['bytes'] / 2**20:.1f} MB), last frame {s['frame_allocations']} "
+                f"({s['frame_bytes'] / 2**20:.1f} MB)")
@@ -0,0 +1,71 @@
+import hashlib
+import os
+import sys
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+# Add the marble war dir to path to import the game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import MarbleWar
+from replay_log import ReplayLog, config_hash
+
+FRAMES = 180
+
+
+def frame_hashes(seed, frames=FRAMES):
+    game = MarbleWar(headless=True, seed=seed)
+    hashes = []
+    for _ in range(frames):
+        if not game.step():
+            break
+        game._draw()
+        hashes.append(hashlib.sha1(pygame.image.tobytes(game.screen, "RGB")).hexdigest())
+    return game, hashes
+
+
+class TestDeterminism(unittest.TestCase):
+    def test_same_seed_same_frames(self):
+        _, first = frame_hashes(1234)
+        _, second = frame_hashes(1234)
+        self.assertEqual(len(first), FRAMES)
+        self.assertEqual(first, second)
+
+    def test_global_random_does_not_leak_in(self):
+        import random
+        random.seed(1)
+        _, first = frame_hashes(99, frames=60)
+        random.seed(2)
+        _, second = frame_hashes(99, frames=60)
+        self.assertEqual(first, second)
+
+    def test_simulate_only_plays_the_same_match(self):
+        game, _ = frame_hashes(7, frames=600)
+        sim = MarbleWar(simulate_only=True, seed=7)
+        sim.simulate(max_frames=600)
+        self.assertEqual(sim.outcome(), game.outcome())
+        self.assertEqual([(e.t, e.name) for e in sim.audio_events],
+                         [(e.t, e.name) for e in game.audio_events])
+
+    def test_replay_log_round_trip(self):
+        game = MarbleWar(simulate_only=True, seed=42)
+        game.simulate(max_frames=10)
+        replay = ReplayLog.from_game(game)
+        path = os.path.join(os.path.dirname(__file__), "_tmp.replay.json")
+        try:
+            replay.save(path)
+            loaded = ReplayLog.load(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(loaded, replay)
+        self.assertEqual(loaded.seed, 42)
+        self.assertEqual(loaded.config_hash, config_hash())
+        self.assertTrue(loaded.matches_config())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pymunk
+
+import config
+from game import MarbleWar
+from physics_stepper import AdaptiveStepper
+
+
+def free_spot(space, bodies, clearance):
+    """A point with nothing but `bodies` within `clearance` (walls included)."""
+    for y in range(int(clearance), config.HEIGHT - int(clearance), 20):
+        for x in range(int(clearance), config.WIDTH - int(clearance), 20):
+            hits = space.point_query((x, y), clearance, pymunk.ShapeFilter())
+            if all(hit.shape.body in bodies for hit in hits):
+                return x, y
+    raise AssertionError("no free spot in the arena")
+
+
+def one_frame(seed, substeps, contacts=True):
+    """
+    Steps one frame with `substeps` forced, after parking two touching
+    marbles (the first holding the bomb) in a free spot. Returns the audio
+    events of the frame; every bomb pass plays "powerup".
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = MarbleWar(simulate_only=True, seed=seed)
+    m1, m2 = game.state.marbles[:2]
+    r = config.MARBLE_RADIUS
+    x, y = free_spot(game.space, (m1.body, m2.body), 4 * r)
+    m1.body.position, m2.body.position = (x - r + 1, y), (x + r - 1, y) # 2px overlap
+    m1.body.velocity = m2.body.velocity = (0, 0)
+    game.physics.bomb_active, game.physics.bomb_holder = True, m1
+
+    stepper = AdaptiveStepper(game.space, contacts=game.physics if contacts else None)
+    stepper.plan = lambda dt: (substeps, stepper.base_iterations)
+    game.stepper = stepper
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.step()
+    return [(e.name, round(e.vol, 6)) for e in game.audio_events]
+
+
+class TestAdaptiveStepper(unittest.TestCase):
+    def test_substeps_fire_collision_side_effects_once(self):
+        for seed in (3, 11):
+            events_1 = one_frame(seed, 1)
+            events_2 = one_frame(seed, 2)
+            with self.subTest(seed=seed):
+                self.assertEqual([e for e in events_1 if e[0] == "powerup"], [("powerup", 0.3)])
+                self.assertEqual(len(events_2), len(events_1))
+                self.assertEqual(events_2, events_1)
+
+    def test_without_contacts_substeps_repeat_them(self):
+        # What once_per_frame() prevents
+        events = one_frame(3, 2, contacts=False)
+        self.assertEqual([e for e in events if e[0] == "powerup"], [("powerup", 0.3)] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
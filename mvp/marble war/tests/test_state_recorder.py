@@ -0,0 +1,57 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+# Add the marble war dir to path to import the game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import MarbleWar
+from state_recorder import RenderOnly, StateRecorder
+
+FRAMES = 240
+
+
+def screen_hash(screen):
+    return hashlib.sha1(pygame.image.tobytes(screen, "RGB")).hexdigest()
+
+
+class TestStateRecorder(unittest.TestCase):
+    def test_render_only_matches_live_frames(self):
+        for seed in (0, 28): # Juggernaut (projectiles, explosions, texts) / spinners
+            with tempfile.TemporaryDirectory() as tmp, self.subTest(seed=seed):
+                game = MarbleWar(headless=True, seed=seed)
+                game.recorder = StateRecorder(os.path.join(tmp, "match.rec"), game)
+                live = []
+                while game.frame_count < FRAMES and game.step():
+                    game._draw()
+                    live.append(screen_hash(game.screen))
+                game.recorder.close()
+
+                player = RenderOnly(os.path.join(tmp, "match.rec"))
+                replayed = [screen_hash(screen) for screen in player.frames()]
+                self.assertEqual(len(replayed), len(live))
+                self.assertEqual(replayed, live)
+
+    def test_theme_override(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            game = MarbleWar(headless=True, seed=3)
+            game.recorder = StateRecorder(os.path.join(tmp, "match.rec"), game)
+            for _ in range(10):
+                game.step()
+            game.recorder.close()
+
+            other = next(t for t in ("Matrix", "Midnight") if t != game.theme.name)
+            player = RenderOnly(os.path.join(tmp, "match.rec"), theme=other)
+            self.assertEqual(player.theme.name, other)
+            player.draw(len(player) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+# Add the marble war dir to path to import the game modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import MarbleWar
+from surface_pool import SurfacePool
+
+
+class TestSurfacePool(unittest.TestCase):
+    def test_reuses_surfaces_by_size_and_flags(self):
+        pygame.init()
+        pool = SurfacePool()
+        with pool.borrow((64, 32), pygame.SRCALPHA) as a:
+            with pool.borrow((64, 32), pygame.SRCALPHA) as b:
+                self.assertIsNot(a, b) # Both borrowed at once
+            with pool.borrow((64, 32)) as c:
+                self.assertIsNot(c, b) # Other flags
+        with pool.borrow((64, 32), pygame.SRCALPHA) as again:
+            self.assertIn(again, (a, b))
+        self.assertEqual(pool.stats["allocations"], 3)
+        self.assertEqual(pool.stats["borrows"], 4)
+
+    def test_no_steady_state_allocations(self):
+        game = MarbleWar(headless=True, seed=0)
+        for _ in range(30):
+            game.step()
+        # Every overlay at once: victory, sudden death, bomb
+        state = game.state
+        state.winner_team = state.marbles[0].team
+        state.zone_active, state.zone_radius = True, 400
+        state.bomb_active, state.bomb_holder = True, state.marbles[0]
+
+        pool = game.renderer.surfaces
+        game._draw() # Warm-up frame allocates
+        allocated = pool.stats["allocations"]
+        self.assertGreater(allocated, 0)
+        for _ in range(30):
+            game.frame_count += 1
+            game._draw()
+            self.assertEqual(pool.stats["frame_allocations"], 0)
+            self.assertEqual(pool.stats["frame_bytes"], 0)
+        self.assertEqual(pool.stats["allocations"], allocated)
+
+
+if __name__ == "__main__":
+    unittest.main()
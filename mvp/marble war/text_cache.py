@@ -0,0 +1,80 @@
+"""
+Text Cache for Marble War.
+LRU caches for fonts (SysFont scans the system font list on every call) and
+for rendered text surfaces, with hit/miss counters for per-video reports.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+
+from game_types import Color
+
+FontKey = Tuple[str, int, bool]
+
+
+class TextCache:
+    """Fonts keyed by (name, size, bold), surfaces by (text, color, font)."""
+
+    def __init__(self, max_fonts: int = 32, max_surfaces: int = 512) -> None:
+        self.max_fonts = max_fonts
+        self.max_surfaces = max_surfaces
+        self._fonts: "OrderedDict[FontKey, pygame.font.Font]" = OrderedDict()
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    def clear(self) -> None:
+        """Drops every font and surface (fonts die with pygame.quit())."""
+        self._fonts.clear()
+        self._surfaces.clear()
+
+    def reset_stats(self) -> None:
+        self.stats = {"font_hits": 0, "font_misses": 0, "text_hits": 0, "text_misses": 0}
+
+    def font(self, name: str, size: int, bold: bool = False) -> pygame.font.Font:
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.stats["font_hits"] += 1
+            return font
+
+        self.stats["font_misses"] += 1
+        font = pygame.font.SysFont(name, size, bold=bold)
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def render(self, text: str, color: Color, name: str = "Arial", size: int = 30,
+               bold: bool = False) -> pygame.Surface:
+        """
+        Antialiased text surface, shared between callers: do not draw on it.
+        Callers that change its alpha must reset it (set_alpha(None)) after blitting.
+        """
+        key = (text, tuple(color), (name, size, bold))
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.stats["text_hits"] += 1
+            return surf
+
+        self.stats["text_misses"] += 1
+        surf = self.font(name, size, bold).render(text, True, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def report(self) -> str:
+        s = self.stats
+        total = s["text_hits"] + s["text_misses"]
+        rate = s["text_hits"] / total * 100 if total else 0.0
+        return (f"fonts {s['font_hits']} hits / {s['font_misses']} misses, "
+                f"text {s['text_hits']} hits / {s['text_misses']} misses ({rate:.1f}% hit rate)")
+
+
+# Shared by GameRenderer and FloatingText
+TEXT_CACHE = TextCache()
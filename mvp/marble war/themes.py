@@ -5,7 +5,7 @@ Controls colors, fonts, and post-processing styles.
 
 import random
 from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Tuple
 
 @dataclass
 class Theme:
@@ -19,8 +19,8 @@ class Theme:
 
 class ThemeManager:
     @staticmethod
-    def get_random_theme() -> Theme:
-        themes = [
+    def themes() -> List[Theme]:
+        return [
             Theme(
                 name="Cyberpunk",
                 bg_color=(5, 5, 8),
@@ -72,7 +72,18 @@ class ThemeManager:
                 bloom_enabled=True
             )
         ]
-        
-        selected = random.choice(themes)
+
+    @staticmethod
+    def get_random_theme(rng=random) -> Theme:
+        selected = rng.choice(ThemeManager.themes())
         print(f"🎨 Selected Theme: {selected.name}")
         return selected
+
+    @staticmethod
+    def get_theme(name: str) -> Theme:
+        """Theme by name (case-insensitive)."""
+        for theme in ThemeManager.themes():
+            if theme.name.lower() == name.lower():
+                return theme
+        names = ", ".join(t.name for t in ThemeManager.themes())
+        raise ValueError(f"Unknown theme '{name}' (available: {names})")
@@ -1,14 +1,15 @@
 """
 Video Generator Module.
 Runs the game simulation and pipes video frames to FFmpeg.
+With an AudioRenderer the soundtrack is mixed while the game runs and fed
+to the same FFmpeg process through a named pipe (single pass, no mux step).
 """
 
 import os
 import sys
-import subprocess
 import pygame
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Set headless before anything else
 os.environ["SDL_VIDEODRIVER"] = "dummy"
@@ -17,38 +18,55 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from game import MarbleWar
 import config
 
+# Shared helpers live in mvp/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.audio_pipe import AudioPipe
+from common.frame_sink import FrameSink
+from replay_log import ReplayLog
+from span_tracer import TRACER
+from text_cache import TEXT_CACHE
+
 class VideoGenerator:
     def __init__(self):
         print("🎥 Initializing Video Generator...")
         self.root_dir = Path(__file__).parent
+        self.frames_written = 0
+        self.seed: Optional[int] = None
         
-    def render(self, output_path: Path) -> List[Dict]:
+    def render(self, output_path: Path, audio=None, seed: Optional[int] = None) -> List[Dict]:
         """
         Runs the simulation and generates the video file.
+        audio: optional AudioRenderer. When given (and named pipes are
+        available) the final video, with its soundtrack, is written in one pass.
+        seed: match seed (random when None). A replay log (seed + config hash)
+        is written next to the video as <name>.replay.json.
         Returns: List of audio events.
         """
         print(f"🎬 Generating Video: {output_path.name}")
+        TEXT_CACHE.reset_stats()
         
-        # 1. Setup FFmpeg Pipe
-        command = [
-            'ffmpeg', '-y', '-v', 'error', # Less verbosity
-            '-f', 'rawvideo', '-vcodec', 'rawvideo',
-            '-s', f'{config.WIDTH}x{config.HEIGHT}',
-            '-pix_fmt', 'rgb24', '-r', str(config.FPS),
-            '-i', '-',
-            '-c:v', 'libx264', '-preset', 'medium', '-crf', '18',
-            '-pix_fmt', 'yuv420p',
-            str(output_path)
-        ]
-        
-        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        # 1. Setup FFmpeg Pipe (spawned on the first frame, encodes on a writer thread)
+        audio_pipe: Optional[AudioPipe] = None
+        stream = None
+        extra_inputs, extra_output_args = [], []
+        if audio is not None and AudioPipe.supported():
+            audio_pipe = AudioPipe(audio.samplerate, channels=2)
+            stream = audio.open_stream()
+            extra_inputs = audio_pipe.input_args()
+            extra_output_args = ["-map", "0:v", "-map", "1:a", "-c:a", "aac", "-b:a", "192k"]
+        sink = FrameSink(output_path, fps=config.FPS, preset='medium', crf=18, loglevel='error',
+                         extra_inputs=extra_inputs, extra_output_args=extra_output_args)
         
         # 2. Init Game (Headless)
         # We re-init for every video to ensure clean state (Chaos RNG)
-        game = MarbleWar(headless=True)
+        game = MarbleWar(headless=True, seed=seed)
+        self.seed = game.seed
+        if audio is not None:
+            audio.rng.seed(game.seed) # Same pitch variations on re-render
         
         # 3. Main Loop
         max_frames = config.TOTAL_FRAMES
+        events_mixed = 0
         
         try:
             while game.frame_count < max_frames:
@@ -60,29 +78,49 @@ class VideoGenerator:
                 # Render
                 game._draw()
                 
+                # Audio up to the end of this frame (events of step N are at (N-1)*dt).
+                # Queued before the frame: FFmpeg probes the audio input while
+                # video is already waiting, so audio must never lag behind.
+                if stream is not None:
+                    with TRACER.span("audio_stream", frame=game.frame_count):
+                        new_events = game.audio_events[events_mixed:]
+                        events_mixed += len(new_events)
+                        stream.add_events([{"t": e.t, "name": e.name, "vol": e.vol, "x": e.x} for e in new_events])
+                        block = stream.advance((sink.frame_count + 1) * audio.samplerate // config.FPS)
+                        audio_pipe.write(block.tobytes())
+                
                 # Capture frame
-                frame_data = pygame.image.tostring(game.screen, 'RGB')
-                process.stdin.write(frame_data)
+                with TRACER.span("frame_write", frame=game.frame_count):
+                    sink.write(game.screen)
                 
                 # Progress
                 if game.frame_count % 120 == 0:
                     pct = (game.frame_count / max_frames) * 100
                     # Print in place to avoid log spam
-                    sys.stdout.write(f"\r⏳ Progress: {pct:.1f}% ({game.frame_count}/{max_frames}) | Mode: {game.state.game_mode.name}")
+                    enc = sink.progress
+                    sys.stdout.write(f"\r⏳ Progress: {pct:.1f}% ({game.frame_count}/{max_frames}) | Mode: {game.state.game_mode.name} | Encoder: {enc.fps:.0f} fps, lag {sink.encoder_lag}")
                     sys.stdout.flush()
                     
         except BrokenPipeError:
             print("\n❌ FFmpeg pipe broken!")
         finally:
             print("") # Newline
-            if process.stdin:
-                process.stdin.close()
-            process.wait()
+            self.frames_written = sink.frame_count
+            if audio_pipe is not None:
+                # EOF on the audio input first, FFmpeg then finishes on stdin close
+                audio_pipe.close(timeout=10.0 if sink.process else 0.0)
+            sink.close()
+            print(f"🔤 Text cache: {TEXT_CACHE.report()}")
+            if game.renderer is not None:
+                print(f"🧱 Surface pool: {game.renderer.surfaces.report()}")
+            # Fonts are tied to this pygame session
+            TEXT_CACHE.clear()
             
             # Important: Quit pygame to free resources, 
             # but usually MarbleWar.run() handles it. Here we handle it.
             pygame.quit()
             
+        ReplayLog.from_game(game).save(output_path.with_suffix(".replay.json"))
         print(f"✅ Video Generation Complete: {len(game.audio_events)} audio events captured.")
         
         # Convert internal AudioEvents to list of dicts for renderer
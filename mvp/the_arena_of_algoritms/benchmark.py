@@ -1,8 +1,15 @@
+import argparse
+import csv
+import json
+import os
+import random
 import pygame
 import time
+import numpy as np
 from src.config import *
+from src import effects
 from src.systems.battle import ALGORITHMS, BattleManager
-from src.audio import SoundManager
+from src.audio import RECORDING_MANAGER, SoundManager
 
 class MockLogger:
     def info(self, msg): pass
@@ -55,5 +62,130 @@ def run_benchmark():
     pygame.quit()
     return results
 
+# --- Perf mode: what each algorithm costs to run (wall clock) ---
+
+PERF_FIELDS = [
+    "algorithm", "frames", "cleared_at_s",
+    "update_ms", "update_p95_ms", "draw_ms", "draw_p95_ms",
+    "projectiles_ms", "particles_ms", "peak_particles", "peak_projectiles",
+]
+
+def _perf_algorithm(algo_class, algo_name, frames, seed, sound_manager, logger, surface):
+    """Runs one algorithm on the top rings for `frames` frames, like BattleManager.update + RenderSystem.draw."""
+    random.seed(seed)
+    np.random.seed(seed)
+    effects.GLOBAL_PARTICLES = []
+    RECORDING_MANAGER.reset() # Only matters in EXPORT_MODE
+
+    bm = BattleManager(sound_manager, logger)
+    random.seed(seed) # Same state for every algorithm, whatever BattleManager drew
+    algo = bm.instantiate_entity(algo_class, bm.center_top, bm.rings_top)
+    pm = bm.projectile_manager
+    dt = 1.0 / FPS
+
+    update_t, draw_t = np.zeros(frames), np.zeros(frames)
+    projectiles_t, particles_t = 0.0, 0.0
+    peak_particles = peak_projectiles = 0
+    cleared_at = None
+    clock = time.perf_counter
+
+    for i in range(frames):
+        t0 = clock()
+        algo.update(dt)
+        t1 = clock()
+        pm.update(dt, bm.rings_top)
+        t2 = clock()
+        effects.update_particles()
+        t3 = clock()
+        for r in bm.rings_top:
+            r.update_visuals(dt)
+
+        surface.fill(BLACK)
+        for r in bm.rings_top:
+            r.draw(surface)
+        t4 = clock()
+        algo.draw(surface)
+        t5 = clock()
+        pm.draw(surface)
+        t6 = clock()
+        effects.draw_particles(surface)
+        t7 = clock()
+
+        update_t[i] = t1 - t0
+        draw_t[i] = t5 - t4
+        projectiles_t += (t2 - t1) + (t6 - t5)
+        particles_t += (t3 - t2) + (t7 - t6)
+        peak_particles = max(peak_particles, len(effects.GLOBAL_PARTICLES))
+        peak_projectiles = max(peak_projectiles, len(pm.projectiles))
+        if cleared_at is None and not any(r.alive for r in bm.rings_top):
+            cleared_at = (i + 1) * dt
+
+    return {
+        "algorithm": algo_name,
+        "frames": frames,
+        "cleared_at_s": round(cleared_at, 2) if cleared_at is not None else "",
+        "update_ms": round(update_t.mean() * 1000, 4),
+        "update_p95_ms": round(np.percentile(update_t, 95) * 1000, 4),
+        "draw_ms": round(draw_t.mean() * 1000, 4),
+        "draw_p95_ms": round(np.percentile(draw_t, 95) * 1000, 4),
+        "projectiles_ms": round(projectiles_t / frames * 1000, 4),
+        "particles_ms": round(particles_t / frames * 1000, 4),
+        "peak_particles": peak_particles,
+        "peak_projectiles": peak_projectiles,
+    }
+
+def run_perf(frames=1800, seed=42, out=None, only=None):
+    """
+    Wall-clock cost of every algorithm from load_algorithms(), headless, same
+    seed for all. Per frame: ms in entity.update / entity.draw, plus the shared
+    projectile and particle systems they feed, and peak object counts.
+    Results go to `out` (.csv or .json) for regression tracking.
+    """
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    sound_manager = SoundManager()
+    logger = MockLogger()
+    
+    results = []
+    print(f"{'ALGORITHM':<20} | {'UPDATE ms':>9} | {'p95':>7} | {'DRAW ms':>8} | {'p95':>7} | "
+          f"{'PROJ ms':>7} | {'PART ms':>7} | {'PEAK PART':>9} | {'PEAK PROJ':>9} | CLEARED")
+    print("-" * 118)
+    for algo_class, algo_name, _ in ALGORITHMS:
+        if only and algo_name not in only and algo_class.__name__ not in only:
+            continue
+        r = _perf_algorithm(algo_class, algo_name, frames, seed, sound_manager, logger, surface)
+        results.append(r)
+        cleared = f"{r['cleared_at_s']}s" if r["cleared_at_s"] != "" else "-"
+        print(f"{algo_name:<20} | {r['update_ms']:>9.3f} | {r['update_p95_ms']:>7.3f} | {r['draw_ms']:>8.3f} | "
+              f"{r['draw_p95_ms']:>7.3f} | {r['projectiles_ms']:>7.3f} | {r['particles_ms']:>7.3f} | "
+              f"{r['peak_particles']:>9} | {r['peak_projectiles']:>9} | {cleared}")
+
+    if out:
+        if os.path.splitext(out)[1].lower() == ".json":
+            with open(out, "w") as f:
+                json.dump({"frames": frames, "seed": seed, "results": results}, f, indent=2)
+        else:
+            with open(out, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=PERF_FIELDS)
+                writer.writeheader()
+                writer.writerows(results)
+        print(f"Saved {out}")
+
+    pygame.quit()
+    return results
+
 if __name__ == "__main__":
-    run_benchmark()
+    parser = argparse.ArgumentParser(description="Algorithm benchmarks")
+    parser.add_argument("--perf", action="store_true", help="Wall-clock cost per algorithm instead of time to clear")
+    parser.add_argument("--frames", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="Perf results file (.csv or .json)")
+    parser.add_argument("--only", nargs="*", help="Algorithm names or class names (e.g. NaniteCloud)")
+    args = parser.parse_args()
+
+    if args.perf:
+        run_perf(args.frames, args.seed, args.out, args.only)
+    else:
+        run_benchmark()
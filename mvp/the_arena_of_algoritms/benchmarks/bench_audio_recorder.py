@@ -0,0 +1,73 @@
+"""
+Benchmark: AudioRecorder (keeps every event, mixes in save) vs
+StreamingAudioRecorder (rolling buffer, flushed as time advances) on a
+synthetic match: a 0.2 s note every 6 frames plus a kick and a hihat per
+beat, at 60 fps. Each recorder runs in its own process so peak RSS is its
+own. Checks the two wavs are byte-identical.
+
+Usage: python benchmarks/bench_audio_recorder.py [minutes]
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FPS = 60
+
+def run(backend, minutes, path):
+    from src.audio import SAMPLE_RATE, AudioRecorder, StreamingAudioRecorder, peak_rss_mb
+    rng = np.random.default_rng(0)
+    recorder = StreamingAudioRecorder() if backend == "stream" else AudioRecorder()
+    recorder.is_recording = True
+    t = np.arange(int(0.2 * SAMPLE_RATE)) / SAMPLE_RATE
+    t0 = time.perf_counter()
+    for frame in range(int(minutes * 60 * FPS)):
+        if frame % 6 == 0:
+            freq = rng.uniform(260, 530)
+            recorder.add_samples((np.sin(2 * np.pi * freq * t) * 4000).astype(np.int16), recorder.current_time)
+        if frame % 30 == 0:
+            recorder.add_samples(rng.integers(-8000, 8000, 4000).astype(np.int16), recorder.current_time)
+            recorder.add_samples(rng.integers(-3000, 3000, 2000).astype(np.int16), recorder.current_time)
+        recorder.update_time(1 / FPS)
+    t_run = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    recorder.save(path)
+    t_save = time.perf_counter() - t0
+    return t_run, t_save, peak_rss_mb()
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        with contextlib.redirect_stdout(io.StringIO()): # Only the result line goes out
+            result = run(sys.argv[2], float(sys.argv[3]), sys.argv[4])
+        print(*result)
+        sys.exit()
+
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        rows, digests = [], []
+        for backend in ("batch", "stream"):
+            path = os.path.join(tmp, f"{backend}.wav")
+            res = subprocess.run([sys.executable, __file__, "--child", backend, str(minutes), path],
+                                 capture_output=True, text=True, check=True)
+            rows.append((backend, *map(float, res.stdout.split())))
+            digests.append(hashlib.sha1(Path(path).read_bytes()).hexdigest())
+
+    print(f"\n{minutes:g} min match at {FPS} fps")
+    print(f"{'RECORDER':<10} | {'RUN (s)':>8} | {'SAVE (s)':>8} | {'PEAK RSS (MB)':>13}")
+    print("-" * 50)
+    for name, t_run, t_save, rss in rows:
+        print(f"{name:<10} | {t_run:>8.2f} | {t_save:>8.2f} | {rss:>13.1f}")
+    print(f"Identical wav: {digests[0] == digests[1]}")
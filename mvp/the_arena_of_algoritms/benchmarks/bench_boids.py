@@ -0,0 +1,85 @@
+"""
+Benchmark: NaniteCloud.update with the scalar boids loop (three O(n^2)
+Vector2 passes per boid) vs the numpy backend (one distance pass, cell list
+from CELL_LIST_MIN boids), at n = 100 / 500 / 2000. Also checks that the
+default 100-boid cloud still clears its rings in about the same time.
+
+Usage: python benchmarks/bench_boids.py [n...]
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import FPS, HALF_HEIGHT, RING_HP, RING_RADII, SCREEN_WIDTH
+from src.entities.base import Ring
+from src.entities.nanite import NaniteCloud
+from src.systems.boids import boids_steering
+
+CENTER = (SCREEN_WIDTH // 2, HALF_HEIGHT // 2)
+DT = 1.0 / FPS
+
+
+def make_cloud(n, backend, seed=0, hp=RING_HP):
+    random.seed(seed)
+    rings = [Ring(r, h, CENTER, (255, 255, 255)) for r, h in zip(RING_RADII, hp)]
+    return NaniteCloud(CENTER, rings, num_particles=n, backend=backend)
+
+
+def ms_per_update(n, backend, warmup, frames):
+    """Mean ms per update once the cloud has reached the ring."""
+    cloud = make_cloud(n, backend, hp=[10 ** 12] * len(RING_HP)) # Rings never die
+    for _ in range(warmup):
+        cloud.update(DT)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        cloud.update(DT)
+    return (time.perf_counter() - t0) / frames * 1000
+
+
+def ms_per_steering(n, warmup, frames):
+    """Just boids_steering (no target pull, integration or ring damage), same frames as ms_per_update."""
+    cloud = make_cloud(n, "numpy", hp=[10 ** 12] * len(RING_HP))
+    for _ in range(warmup):
+        cloud.update(DT)
+    total = 0.0
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        boids_steering(cloud.pos, cloud.vel, cloud.perception, cloud.max_speed, cloud.max_force)
+        total += time.perf_counter() - t0
+        cloud.update(DT)
+    return total / frames * 1000
+
+
+def time_to_clear(backend, seed, timeout=180.0):
+    cloud = make_cloud(100, backend, seed)
+    t = 0.0
+    while any(r.alive for r in cloud.rings) and t < timeout:
+        cloud.update(DT)
+        t += DT
+    return t
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 500, 2000]
+
+    print(f"\n{'BOIDS':>6} | {'SCALAR (ms)':>11} | {'NUMPY (ms)':>10} | {'SPEEDUP':>7} | {'STEERING ONLY (ms)':>18}")
+    print("-" * 66)
+    for n in sizes:
+        # The scalar loop is ~n^2 * 3 Vector2 calls: fewer frames when it is slow
+        frames = min(60, max(1, 600_000 // n ** 2))
+        scalar = ms_per_update(n, "scalar", warmup=2, frames=frames)
+        vec = ms_per_update(n, "numpy", warmup=2, frames=60)
+        print(f"{n:>6} | {scalar:>11.2f} | {vec:>10.2f} | {scalar / vec:>6.1f}x | {ms_per_steering(n, warmup=2, frames=60):>18.2f}")
+
+    print(f"\n{'SEED':>4} | {'CLEAR scalar (s)':>16} | {'CLEAR numpy (s)':>15}")
+    print("-" * 42)
+    for seed in range(3):
+        print(f"{seed:>4} | {time_to_clear('scalar', seed):>16.2f} | {time_to_clear('numpy', seed):>15.2f}")
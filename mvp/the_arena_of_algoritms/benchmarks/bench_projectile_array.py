@@ -0,0 +1,100 @@
+"""
+Benchmark: ProjectileManager (a dict per projectile, list rebuilt every
+frame) vs ProjectileArray (one structured numpy array, compacted in place):
+memory held and ms per update with 1k / 10k live projectiles, half
+'continuous' and half 'destination' (topped up every frame). Checks both
+end with the same ring HP and projectiles.
+
+Usage: python benchmarks/bench_projectile_array.py [projectiles...]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import effects
+from src.config import HALF_HEIGHT, RING_RADII, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.entities.base import Ring
+from src.systems.projectile_manager import ProjectileArray, ProjectileManager
+
+COLORS = [(255, 255, 255), (255, 230, 50), (255, 50, 50)]
+
+
+def make_rings():
+    rings = []
+    for center in ((SCREEN_WIDTH // 2, HALF_HEIGHT // 2), (SCREEN_WIDTH // 2, HALF_HEIGHT + HALF_HEIGHT // 2)):
+        rings += [Ring(r, 10 ** 12, center, (255, 255, 255)) for r in RING_RADII] # Never die
+    return rings
+
+
+def top_up(pm, rings, count, rng):
+    while len(pm.projectiles) < count:
+        ring = rng.choice(rings)
+        angle = rng.uniform(0, 2 * math.pi)
+        target = (ring.center[0] + math.cos(angle) * ring.radius, ring.center[1] + math.sin(angle) * ring.radius)
+        pos = (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+        mode = 'continuous' if rng.random() < 0.5 else 'destination'
+        pm.add_projectile(pos, target, rng.uniform(300, 900), 10, rng.choice(COLORS), mode)
+
+
+def held_bytes(cls, count):
+    """Memory held by `count` live projectiles (tracemalloc)."""
+    rng = random.Random(0)
+    rings = make_rings()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pm = cls()
+    top_up(pm, rings, count, rng)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held
+
+
+def positions(pm):
+    if isinstance(pm, ProjectileArray):
+        return np.column_stack([pm.projectiles['x'], pm.projectiles['y']])
+    return np.array([p['pos'] for p in pm.projectiles]).reshape(-1, 2)
+
+
+def run(cls, count, frames, seed=0):
+    rng = random.Random(seed)
+    random.seed(seed) # Note rolls and particles
+    effects.GLOBAL_PARTICLES = []
+    rings = make_rings()
+    pm = cls()
+    total = 0.0
+    for _ in range(frames):
+        top_up(pm, rings, count, rng)
+        t0 = time.perf_counter()
+        pm.update(1 / 60, rings)
+        total += time.perf_counter() - t0
+        effects.GLOBAL_PARTICLES = [] # Not what is measured
+    return total / frames * 1000, [r.hp for r in rings], positions(pm)
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10, 1000, 10000]
+    frames = 120
+
+    print(f"\n{'PROJECTILES':>11} | {'DICTS (KB)':>10} | {'ARRAY (KB)':>10} | {'DICTS ms':>8} | "
+          f"{'ARRAY ms':>8} | {'SPEEDUP':>7} | SAME (ring HP, positions)")
+    print("-" * 98)
+    for count in sizes:
+        dict_kb, array_kb = held_bytes(ProjectileManager, count) / 1024, held_bytes(ProjectileArray, count) / 1024
+        dict_ms, dict_hp, dict_pos = run(ProjectileManager, count, frames)
+        array_ms, array_hp, array_pos = run(ProjectileArray, count, frames)
+        same = (np.allclose(dict_hp, array_hp, rtol=0, atol=1e-6) and dict_pos.shape == array_pos.shape
+                and np.allclose(dict_pos, array_pos, rtol=0, atol=1e-6))
+        print(f"{count:>11} | {dict_kb:>10.1f} | {array_kb:>10.1f} | {dict_ms:>8.2f} | {array_ms:>8.2f} | "
+              f"{dict_ms / array_ms:>6.1f}x | {'yes' if same else 'NO'}")
@@ -0,0 +1,111 @@
+"""
+Benchmark: ProjectileManager.update with ring candidates from the
+SpatialGrid vs the linear scan of every ring it replaced, under a stress
+load of 2k 'continuous' projectiles (topped up every frame) against both
+sides' rings. Checks both give the same ring HP and projectiles, with
+rings that never die and with rings that die (grid rebuilds) mid-run.
+
+Usage: python benchmarks/bench_projectile_grid.py [projectiles] [frames]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import HALF_HEIGHT, RING_RADII, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.entities.base import Ring
+from src.systems.projectile_manager import ProjectileManager
+
+
+class LinearProjectileManager(ProjectileManager):
+    """update() before the grid: every projectile against every ring."""
+
+    def update(self, dt, rings):
+        for p in self.projectiles:
+            if not p['active']: continue
+            dx = p['target'][0] - p['pos'][0]
+            dy = p['target'][1] - p['pos'][1]
+            dist_to_target = math.hypot(dx, dy)
+            move_dist = p['speed'] * dt
+            hit = False
+            if p['mode'] == 'continuous':
+                if dist_to_target > 0:
+                    step = min(move_dist, dist_to_target)
+                    p['pos'][0] += (dx / dist_to_target) * step
+                    p['pos'][1] += (dy / dist_to_target) * step
+                for ring in rings:
+                    if ring.alive:
+                        d_ring = math.hypot(p['pos'][0] - ring.center[0], p['pos'][1] - ring.center[1])
+                        if abs(d_ring - ring.radius) < 20:
+                            self._apply_hit(p, ring)
+                            hit = True
+                            p['active'] = False
+                            break
+                if not hit and dist_to_target < 5:
+                    p['active'] = False
+            elif p['mode'] == 'destination':
+                if dist_to_target < 20:
+                    for ring in rings:
+                        if ring.alive:
+                            d_ring = math.hypot(p['pos'][0] - ring.center[0], p['pos'][1] - ring.center[1])
+                            if abs(d_ring - ring.radius) < 80:
+                                self._apply_hit(p, ring)
+                    p['active'] = False
+                else:
+                    p['pos'][0] += (dx / dist_to_target) * move_dist
+                    p['pos'][1] += (dy / dist_to_target) * move_dist
+        self.projectiles = [p for p in self.projectiles if p['active']]
+
+
+def make_rings(hp):
+    rings = []
+    for center in ((SCREEN_WIDTH // 2, HALF_HEIGHT // 2), (SCREEN_WIDTH // 2, HALF_HEIGHT + HALF_HEIGHT // 2)):
+        rings += [Ring(r, hp, center, (255, 255, 255)) for r in RING_RADII]
+    return rings
+
+
+def top_up(pm, rings, count, rng):
+    """Fires from anywhere on screen at a random point of a random ring until there are `count`."""
+    while len(pm.projectiles) < count:
+        ring = rng.choice(rings)
+        angle = rng.uniform(0, 2 * math.pi)
+        target = (ring.center[0] + math.cos(angle) * ring.radius, ring.center[1] + math.sin(angle) * ring.radius)
+        pos = (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+        pm.add_projectile(pos, target, rng.uniform(300, 900), 10, (255, 255, 255), 'continuous')
+
+
+def run(cls, count, frames, hp=10 ** 12, seed=0):
+    rng = random.Random(seed)
+    random.seed(seed) # _apply_hit's note roll
+    rings = make_rings(hp)
+    pm = cls()
+    total = 0.0
+    for _ in range(frames):
+        top_up(pm, rings, count, rng)
+        t0 = time.perf_counter()
+        pm.update(1 / 60, rings)
+        total += time.perf_counter() - t0
+    state = ([r.hp for r in rings], [tuple(p['pos']) for p in pm.projectiles])
+    return total / frames * 1000, state, sum(not r.alive for r in rings)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    print(f"\n{count} continuous projectiles, {frames} frames, 8 rings")
+    print(f"{'RINGS':<18} | {'LINEAR (ms)':>11} | {'GRID (ms)':>9} | {'SPEEDUP':>7} | {'DIED':>4} | SAME")
+    print("-" * 68)
+    for label, hp in (("never die", 10 ** 12), ("die mid-run", 20000)):
+        linear_ms, linear_state, died = run(LinearProjectileManager, count, frames, hp)
+        grid_ms, grid_state, _ = run(ProjectileManager, count, frames, hp)
+        print(f"{label:<18} | {linear_ms:>11.2f} | {grid_ms:>9.2f} | {linear_ms / grid_ms:>6.1f}x | {died:>4} | "
+              f"{'yes' if linear_state == grid_state else 'NO'}")
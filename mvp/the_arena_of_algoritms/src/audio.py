@@ -3,6 +3,8 @@ import numpy as np
 import math
 import wave
 import os
+import sys
+import tempfile
 from .config import *
 
 # --- Audio Configuration ---
@@ -36,6 +38,10 @@ class AudioRecorder:
         self.events = []
         self.is_recording = EXPORT_MODE
         self.current_time = 0.0
+
+    def reset(self):
+        self.events.clear()
+        self.current_time = 0.0
         
     def add_samples(self, samples, start_time):
         if not self.is_recording: return
@@ -86,7 +92,170 @@ class AudioRecorder:
             wf.writeframes(mixed.astype(np.int16).tobytes())
         print(f"Audio saved to {filename}")
 
-RECORDING_MANAGER = AudioRecorder()
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (None where unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024 # bytes on macOS, KB on Linux
+
+class StreamingAudioRecorder:
+    """
+    AudioRecorder that mixes as it goes instead of keeping every event.
+    Events are added into a rolling float32 buffer (buffer_seconds long, grown
+    for longer events); once update_time passes a block, it can no longer
+    change and is flushed:
+      - gain=None (default): to a float32 spill file, because save()
+        normalizes by the peak of the whole match, like AudioRecorder.
+        save() then scales it in blocks, so the wav is bit-identical.
+      - gain=g: scaled by g and written as 16-bit straight to `sink` (an
+        open wave writer, or a binary stream such as ffmpeg's stdin).
+    Events starting before the flushed point (none in the game, which
+    always starts them at current_time) patch the spill file.
+    """
+    def __init__(self, sample_rate=SAMPLE_RATE, buffer_seconds=4.0, block_seconds=1.0,
+                 gain=None, sink=None, spill_dir=None):
+        if gain is not None and sink is None:
+            raise ValueError("A fixed gain streams to a sink: pass sink=")
+        self.sample_rate = sample_rate
+        self.capacity = int(buffer_seconds * sample_rate)
+        self.block = int(block_seconds * sample_rate)
+        self.gain = gain
+        self.sink = sink
+        self.spill_dir = spill_dir
+        self.is_recording = EXPORT_MODE
+        self.stats = {}
+        self._spill = None
+        self.reset()
+
+    def reset(self):
+        if self._spill:
+            self._spill.close()
+        self._spill = None
+        self.buffer = np.zeros(self.capacity, dtype=np.float32)
+        self.base = 0          # Sample index of buffer[0]; everything before it is flushed
+        self.last_end = 0.0    # End (s) of the latest-ending event, like AudioRecorder.save
+        self.max_abs = np.float32(0)
+        self.patched = False   # A late event changed flushed samples: max_abs is stale
+        self.current_time = 0.0
+        self.stats = {"events": 0, "late_events": 0, "blocks_flushed": 0,
+                      "samples_flushed": 0, "peak_buffer_samples": self.capacity}
+
+    def add_samples(self, samples, start_time):
+        if not self.is_recording: return
+        self.stats["events"] += 1
+        self.last_end = max(self.last_end, start_time + len(samples) / self.sample_rate)
+        if self.stats["events"] % 1000 == 0:
+            from .utils import logger
+            logger.info(f"Audio Stream: {self.stats['events']} events, {self.stats['samples_flushed'] / self.sample_rate:.1f}s flushed")
+
+        start_idx = int(start_time * self.sample_rate)
+        if start_idx < 0: return
+        samples = samples.astype(np.float32)
+        if start_idx < self.base:
+            samples = self._patch(start_idx, samples)
+            start_idx = self.base
+            if not len(samples): return
+        end = start_idx - self.base + len(samples)
+        if end > len(self.buffer):
+            grown = np.zeros(end + self.capacity, dtype=np.float32)
+            grown[:len(self.buffer)] = self.buffer
+            self.buffer = grown
+            self.stats["peak_buffer_samples"] = max(self.stats["peak_buffer_samples"], len(grown))
+        self.buffer[start_idx - self.base:end] += samples
+
+    def update_time(self, dt):
+        self.current_time += dt
+        if not self.is_recording: return
+        done = int(self.current_time * self.sample_rate) # New events start at current_time or later
+        if done - self.base >= self.block:
+            self._flush(done)
+
+    def _flush(self, until):
+        while self.base < until:
+            n = min(until - self.base, len(self.buffer))
+            self._write(self.buffer[:n])
+            self.buffer[:-n] = self.buffer[n:].copy()
+            self.buffer[-n:] = 0
+            self.base += n
+            self.stats["blocks_flushed"] += 1
+            self.stats["samples_flushed"] += n
+        if len(self.buffer) > self.capacity and not self.buffer[self.capacity:].any():
+            self.buffer = self.buffer[:self.capacity].copy() # Back to size after a long event
+
+    def _write(self, block):
+        if self.gain is not None:
+            self._write_pcm((block * self.gain).astype(np.int16))
+            return
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._spill.write(block.tobytes())
+        if len(block):
+            self.max_abs = max(self.max_abs, np.max(np.abs(block)))
+
+    def _write_pcm(self, pcm):
+        if hasattr(self.sink, "writeframes"):
+            self.sink.writeframes(pcm.tobytes())
+        else:
+            self.sink.write(pcm.tobytes())
+
+    def _patch(self, start_idx, samples):
+        """Adds the part of a late event that lands before self.base; returns the rest."""
+        if self.gain is not None:
+            raise ValueError(f"Event at sample {start_idx} is older than the streamed audio ({self.base})")
+        self.stats["late_events"] += 1
+        self.patched = True
+        head = samples[:self.base - start_idx]
+        self._spill.seek(start_idx * 4)
+        flushed = np.frombuffer(self._spill.read(len(head) * 4), dtype=np.float32)
+        self._spill.seek(start_idx * 4)
+        self._spill.write((flushed + head).tobytes())
+        self._spill.seek(0, os.SEEK_END)
+        return samples[len(head):]
+
+    def _spill_blocks(self):
+        self._spill.seek(0)
+        while True:
+            data = self._spill.read(self.block * 4)
+            if not data: return
+            yield np.frombuffer(data, dtype=np.float32)
+
+    def save(self, filename="simulation_audio.wav"):
+        if not self.stats["events"]:
+            print("No audio events to save.")
+            return
+        print(f"Writing {self.stats['events']} streamed audio events...")
+        final_duration = max(self.last_end, self.current_time)
+        total_len = int(final_duration * self.sample_rate) + 1000 # Same length as AudioRecorder.save
+        self._flush(total_len)
+        if self.gain is not None:
+            return
+
+        if self.patched:
+            self.max_abs = max((np.max(np.abs(b)) for b in self._spill_blocks()), default=np.float32(0))
+        with wave.open(filename, 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            for block in self._spill_blocks():
+                if self.max_abs > 0:
+                    block = (block / self.max_abs) * 30000
+                wf.writeframes(block.astype(np.int16).tobytes())
+        self._spill.close()
+        self._spill = None
+        print(f"Audio saved to {filename} ({self.report()})")
+
+    def report(self):
+        s = self.stats
+        rss = peak_rss_mb()
+        return (f"{s['events']} events ({s['late_events']} late), "
+                f"{s['samples_flushed'] / self.sample_rate:.1f}s flushed in {s['blocks_flushed']} blocks, "
+                f"buffer peak {s['peak_buffer_samples'] * 4 / 2**20:.1f} MB"
+                + (f", peak RSS {rss:.0f} MB" if rss is not None else ""))
+
+RECORDING_MANAGER = StreamingAudioRecorder() if AUDIO_BACKEND == 'stream' else AudioRecorder()
 
 def generate_wave(frequency, duration, wave_type='sine', amplitude=0.09):
     key = (int(frequency), round(duration, 3), wave_type, amplitude)
@@ -72,6 +72,12 @@ PIANO_SCALE = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25] #
 FIB_PITCH = 440.0
 SPAWN_PITCH_BASE = 261.63
 
+# Projectiles: 'dict' (ProjectileManager) or 'numpy' (ProjectileArray, faster from ~100 live projectiles)
+PROJECTILE_BACKEND = 'dict'
+
+# Export audio: 'stream' (StreamingAudioRecorder, mixed as the match runs) or 'batch' (AudioRecorder, mixed in save)
+AUDIO_BACKEND = 'stream'
+
 # Export Settings
 EXPORT_MODE = True
 DEBUG_MODE = True # Enable comprehensive telemetry and debug overlays
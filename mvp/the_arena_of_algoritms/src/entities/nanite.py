@@ -1,10 +1,12 @@
 import pygame
 import math
 import random
+import numpy as np
 from .base import Entity
 from ..config import WHITE
 from ..effects import spawn_particles
 from ..audio import generate_note_sound
+from ..systems.boids import boids_steering
 
 class NaniteCloud(Entity):
     """
@@ -12,14 +14,21 @@ class NaniteCloud(Entity):
     1. Separation: Avoid crowding neighbors
     2. Alignment: Steer towards average heading of neighbors
     3. Cohesion: Steer towards average position of neighbors
+
+    backend 'numpy' (default) computes the three forces for the whole cloud
+    from one distance pass (src/systems/boids.py), from the positions at the
+    start of the frame. 'scalar' is the original per-boid loop, where each
+    boid already sees the boids moved before it in the same frame.
     """
     NAME = "NANITE CLOUD"
     COLOR = (180, 180, 180)
+    BACKEND = 'numpy'
 
-    def __init__(self, center, rings, projectile_manager=None):
+    def __init__(self, center, rings, projectile_manager=None, num_particles=100, backend=None):
         super().__init__(center, rings, projectile_manager)
         self.particles = []
-        self.num_particles = 100
+        self.num_particles = num_particles
+        self.backend = backend or self.BACKEND
         self.color = self.COLOR # Silver
         
         for _ in range(self.num_particles):
@@ -33,10 +42,19 @@ class NaniteCloud(Entity):
         self.max_speed = 4.0
         self.max_force = 0.2
         self.perception = 50.0
+        
+        if self.backend == 'numpy':
+            # Arrays replace the dicts (same starting cloud)
+            self.pos = np.array([tuple(p['pos']) for p in self.particles], dtype=np.float64).reshape(-1, 2)
+            self.vel = np.array([tuple(p['vel']) for p in self.particles], dtype=np.float64).reshape(-1, 2)
+            self.particles = []
 
     def update(self, dt):
         alive_rings = [r for r in self.rings if r.alive]
         if not alive_rings: return
+        if self.backend == 'numpy':
+            self._update_numpy(dt, alive_rings)
+            return
 
         for p in self.particles:
             # Reset acceleration
@@ -87,6 +105,48 @@ class NaniteCloud(Entity):
                     if random.random() < 0.1:
                         spawn_particles(p['pos'].x, p['pos'].y, self.color, 1)
 
+    def _update_numpy(self, dt, alive_rings):
+        pos, vel = self.pos, self.vel
+        center = np.array(self.center, dtype=np.float64)
+        sep, ali, coh = boids_steering(pos, vel, self.perception, self.max_speed, self.max_force)
+        acc = sep * 1.5 + ali * 1.0 + coh * 1.0
+        
+        # Target Force (towards the same angle on the smallest alive ring)
+        rel = pos - center
+        angle = np.arctan2(rel[:, 1], rel[:, 0])
+        radius = alive_rings[0].radius
+        target = center + np.column_stack([np.cos(angle), np.sin(angle)]) * radius
+        desired = target - pos
+        length = np.hypot(desired[:, 0], desired[:, 1])
+        pull = length > 0
+        steer = np.zeros_like(pos)
+        steer[pull] = desired[pull] / length[pull][:, None] * self.max_speed - vel[pull]
+        speed = np.hypot(steer[:, 0], steer[:, 1])
+        over = speed > self.max_force
+        steer[over] *= (self.max_force / speed[over])[:, None]
+        acc += steer * 2.0 # Strong pull to ring
+        
+        # Physics update
+        vel += acc
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        over = speed > self.max_speed
+        vel[over] *= (self.max_speed / speed[over])[:, None]
+        pos += vel
+        
+        # Damage (in boid order, like the scalar loop, so the random draws match)
+        dist = np.hypot(pos[:, 0] - center[0], pos[:, 1] - center[1])
+        radii = np.array([ring.radius for ring in alive_rings], dtype=np.float64)
+        hits = np.abs(dist[:, None] - radii[None, :]) < 10
+        for i in np.flatnonzero(hits.any(axis=1)).tolist():
+            for ring, hit in zip(alive_rings, hits[i].tolist()):
+                if hit:
+                    ring.take_damage(690 * dt) # Increased damage (+25%)
+                    if ring.note_frequency and random.random() < 0.05:
+                         generate_note_sound(ring.note_frequency, 0.05).play()
+                    
+                    if random.random() < 0.1:
+                        spawn_particles(pos[i, 0], pos[i, 1], self.color, 1)
+
     def separation(self, boid):
         steering = pygame.Vector2(0, 0)
         total = 0
@@ -141,5 +201,9 @@ class NaniteCloud(Entity):
         return steering
 
     def draw(self, surface):
+        if self.backend == 'numpy':
+            for x, y in self.pos.astype(np.int64).tolist():
+                pygame.draw.circle(surface, self.color, (x, y), 2)
+            return
         for p in self.particles:
             pygame.draw.circle(surface, self.color, (int(p['pos'].x), int(p['pos'].y)), 2)
\ No newline at end of file
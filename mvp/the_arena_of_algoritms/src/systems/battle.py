@@ -3,7 +3,7 @@ import random
 from ..config import *
 from ..audio import PIANO_FREQUENCIES
 from ..effects import update_particles
-from .projectile_manager import ProjectileManager
+from .projectile_manager import ProjectileArray, ProjectileManager
 from ..utils.loader import load_algorithms
 from ..entities import Ring
 
@@ -45,7 +45,7 @@ class BattleManager:
         self.winner_team = None # 'top' or 'bot'
         
         # Initialize Systems
-        self.projectile_manager = ProjectileManager()
+        self.projectile_manager = ProjectileArray() if PROJECTILE_BACKEND == 'numpy' else ProjectileManager()
         
         # Select Random Algorithms
         self.algo_selection = random.sample(ALGORITHMS, 2)
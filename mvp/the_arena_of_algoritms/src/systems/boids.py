@@ -0,0 +1,81 @@
+import numpy as np
+
+# From this many boids on, the neighbour search uses a cell list instead of
+# the full n x n distance matrix (faster from ~250 boids, bench_boids.py)
+CELL_LIST_MIN = 250
+
+def _clamp(steer, limit):
+    """Scales rows longer than limit down to limit (Vector2 normalize * limit)."""
+    length = np.hypot(steer[:, 0], steer[:, 1])
+    over = length > limit
+    steer[over] *= (limit / length[over])[:, None]
+    return steer
+
+def _steer(desired, has, vel, max_speed, max_force):
+    """Reynolds steering towards `desired` for rows where `has` (others stay 0)."""
+    steer = np.where(has[:, None], desired, 0.0)
+    length = np.hypot(steer[:, 0], steer[:, 1])
+    moving = has & (length > 0)
+    steer[moving] = steer[moving] / length[moving][:, None] * max_speed - vel[moving]
+    return _clamp(steer, max_force)
+
+def _neighbour_sums(pos, vel, rows, cols, perception, out):
+    """Adds the sums boids `rows` need from candidates `cols` into out."""
+    sep_sum, sep_n, ali_sum, coh_sum, near_n = out
+    dx = pos[rows, 0][:, None] - pos[cols, 0][None, :]
+    dy = pos[rows, 1][:, None] - pos[cols, 1][None, :]
+    d2 = dx * dx + dy * dy
+    d = np.sqrt(d2)
+    other = rows[:, None] != cols[None, :]
+    near = other & (d < perception)
+    close = other & (d < perception / 2)
+
+    weight = np.where(close, 1.0 / (d2 + 0.1), 0.0)
+    sep_sum[rows, 0] += (weight * dx).sum(axis=1)
+    sep_sum[rows, 1] += (weight * dy).sum(axis=1)
+    sep_n[rows] += close.sum(axis=1)
+    near_f = near.astype(np.float64)
+    ali_sum[rows] += near_f @ vel[cols]
+    coh_sum[rows] += near_f @ pos[cols]
+    near_n[rows] += near.sum(axis=1)
+
+def _cell_list_sums(pos, vel, perception, out):
+    """Same sums, comparing each cell only with its 3x3 neighbourhood."""
+    cells = np.floor(pos / perception).astype(np.int64)
+    cells -= cells.min(axis=0)
+    width = cells[:, 0].max() + 3 # Neighbour keys never wrap into another row
+    keys = (cells[:, 1] + 1) * width + cells[:, 0] + 1
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    occupied, starts, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+    span = {k: (s, s + c) for k, s, c in zip(occupied.tolist(), starts.tolist(), counts.tolist())}
+
+    offsets = [dy * width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+    for key, (start, end) in span.items():
+        rows = order[start:end]
+        cols = np.concatenate([order[slice(*span[key + o])] for o in offsets if key + o in span])
+        _neighbour_sums(pos, vel, rows, cols, perception, out)
+
+def boids_steering(pos, vel, perception, max_speed, max_force):
+    """
+    Separation, alignment and cohesion for every boid at once, from one
+    pairwise distance pass (a cell list above CELL_LIST_MIN boids).
+    Same rules as NaniteCloud.separation / alignment / cohesion.
+    pos, vel: (n, 2) float arrays. Returns three (n, 2) arrays.
+    """
+    n = len(pos)
+    out = (np.zeros((n, 2)), np.zeros(n), np.zeros((n, 2)), np.zeros((n, 2)), np.zeros(n))
+    if n >= CELL_LIST_MIN:
+        _cell_list_sums(pos, vel, perception, out)
+    elif n:
+        idx = np.arange(n)
+        _neighbour_sums(pos, vel, idx, idx, perception, out)
+    sep_sum, sep_n, ali_sum, coh_sum, near_n = out
+
+    has_sep, has_near = sep_n > 0, near_n > 0
+    sep_n = np.maximum(sep_n, 1)[:, None]
+    near_n = np.maximum(near_n, 1)[:, None]
+    sep = _steer(sep_sum / sep_n, has_sep, vel, max_speed, max_force)
+    ali = _steer(ali_sum / near_n, has_near, vel, max_speed, max_force)
+    coh = _steer(coh_sum / near_n - pos, has_near, vel, max_speed, max_force)
+    return sep, ali, coh
@@ -6,6 +6,8 @@ class SpatialGrid:
         self.cols = int(width / cell_size) + 1
         self.rows = int(height / cell_size) + 1
         self.grid = {}
+        self._first = {}  # id(obj) -> order of its first insert
+        self._unique = {} # cell -> retrieve_unique result, until the next insert / clear
 
     def _get_cell(self, x, y):
         cx = int(x / self.cell_size)
@@ -14,12 +16,17 @@ class SpatialGrid:
 
     def clear(self):
         self.grid = {}
+        self._first = {}
+        self._unique = {}
 
     def insert(self, obj, x, y):
         cell = self._get_cell(x, y)
         if cell not in self.grid:
             self.grid[cell] = []
         self.grid[cell].append(obj)
+        self._first.setdefault(id(obj), len(self._first))
+        if self._unique:
+            self._unique = {}
 
     def retrieve(self, x, y):
         cell = self._get_cell(x, y)
@@ -31,3 +38,13 @@ class SpatialGrid:
                 if key in self.grid:
                     objects.extend(self.grid[key])
         return objects
+
+    def retrieve_unique(self, x, y):
+        """retrieve() without duplicates, in insertion order. Cached per cell: do not modify."""
+        cell = self._get_cell(x, y)
+        objects = self._unique.get(cell)
+        if objects is None:
+            seen = {id(obj): obj for obj in self.retrieve(x, y)}
+            objects = [seen[k] for k in sorted(seen, key=self._first.get)]
+            self._unique[cell] = objects
+        return objects
@@ -1,12 +1,23 @@
 import pygame
 import math
 import random
+import numpy as np
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT
 from ..effects import spawn_particles
 from ..audio import generate_note_sound
+from .physics import SpatialGrid
+
+CONTINUOUS_HIT = 20 # Distance to a ring border that counts as a hit
+AOE_HIT = 80        # Blast reach of a 'destination' impact
 
 class ProjectileManager:
     def __init__(self):
         self.projectiles = []
+        # Ring candidates per hit band. retrieve() covers +-1 cell and rings are
+        # sampled every cell / 2, so a cell must be >= 4/3 of its band.
+        self.grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT, 30)
+        self.aoe_grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT, 120)
+        self._grid_rings = None # Alive rings the grids were built from
 
     def add_projectile(self, pos, target, speed, damage, color, collision_mode='destination'):
         """
@@ -24,7 +35,30 @@ class ProjectileManager:
             'active': True
         })
 
+    def _build_grid(self, rings):
+        """
+        Alive rings into both grids (polygon vertices, cell / 2 apart). Checked
+        once per frame, rebuilt only when a ring died or moved, so the cached
+        per-cell candidates survive between frames.
+        """
+        key = [(ring, ring.center, ring.radius) for ring in rings if ring.alive]
+        if key == self._grid_rings:
+            return
+        self._grid_rings = key
+        for grid in (self.grid, self.aoe_grid):
+            grid.clear()
+            spacing = grid.cell_size / 2
+            for ring in rings:
+                if not ring.alive: continue
+                cx, cy = ring.center
+                sides = max(16, math.ceil(2 * math.pi * ring.radius / spacing))
+                for k in range(sides):
+                    angle = 2 * math.pi * k / sides
+                    grid.insert(ring, cx + math.cos(angle) * ring.radius, cy + math.sin(angle) * ring.radius)
+
     def update(self, dt, rings):
+        if self.projectiles:
+            self._build_grid(rings)
         for p in self.projectiles:
             if not p['active']: continue
             
@@ -45,12 +79,12 @@ class ProjectileManager:
                     p['pos'][0] += (dx / dist_to_target) * step
                     p['pos'][1] += (dy / dist_to_target) * step
                 
-                # Check collision with ANY ring
-                for ring in rings:
+                # Check collision with ANY ring near it
+                for ring in self.grid.retrieve_unique(p['pos'][0], p['pos'][1]):
                     if ring.alive:
                         d_ring = math.hypot(p['pos'][0] - ring.center[0], p['pos'][1] - ring.center[1])
                         # Hitbox check (Projectile vs Ring border)
-                        if abs(d_ring - ring.radius) < 20:
+                        if abs(d_ring - ring.radius) < CONTINUOUS_HIT:
                             self._apply_hit(p, ring)
                             hit = True
                             p['active'] = False # Bullet destroys on impact
@@ -64,10 +98,10 @@ class ProjectileManager:
                     # Reached target -> Explode AOE
                     # Apply damage to rings near impact
                     spawn_particles(p['pos'][0], p['pos'][1], p['color'], 15)
-                    for ring in rings:
+                    for ring in self.aoe_grid.retrieve_unique(p['pos'][0], p['pos'][1]):
                         if ring.alive:
                             d_ring = math.hypot(p['pos'][0] - ring.center[0], p['pos'][1] - ring.center[1])
-                            if abs(d_ring - ring.radius) < 80:
+                            if abs(d_ring - ring.radius) < AOE_HIT:
                                 self._apply_hit(p, ring)
                     p['active'] = False
                 else:
@@ -87,3 +121,133 @@ class ProjectileManager:
     def draw(self, surface):
         for p in self.projectiles:
              pygame.draw.circle(surface, p['color'], (int(p['pos'][0]), int(p['pos'][1])), 6)
+
+
+# --- Structured-array backend ---
+
+PROJECTILE_DTYPE = np.dtype([
+    ('x', np.float64), ('y', np.float64),
+    ('vx', np.float64), ('vy', np.float64), # px/s, towards the target
+    ('ttl', np.float64),                    # Seconds left to the target
+    ('mode', np.int8),                      # MODES index
+    ('owner', np.int16),                    # owner_colors index (one per shooter color)
+    ('damage', np.float64),
+])
+MODES = ['destination', 'continuous']
+DESTINATION, CONTINUOUS = 0, 1
+
+class ProjectileArray:
+    """
+    ProjectileManager on one numpy structured array (PROJECTILE_DTYPE rows)
+    instead of a dict per projectile: same add_projectile / update / draw.
+    Movement and hit tests are vectorized; hits are then applied in row
+    (= firing) order, like the dict loop, so ring damage, random rolls and
+    particles happen in the same sequence. Dead rows are compacted in place.
+
+    The target is kept as time to live: a projectile is at its target when
+    ttl reaches 0. A 'destination' projectile that overshoots turns back,
+    like the dict version stepping towards its target again.
+    """
+
+    def __init__(self, capacity=256):
+        self.data = np.zeros(capacity, dtype=PROJECTILE_DTYPE)
+        self.count = 0
+        self.owner_colors = []
+        self._owners = {} # color -> owner index
+
+    @property
+    def projectiles(self):
+        """Live rows (a view: len() and field access like data['x']). No __len__ on the
+        manager itself: entities test `if self.projectile_manager:`."""
+        return self.data[:self.count]
+
+    def add_projectile(self, pos, target, speed, damage, color, collision_mode='destination'):
+        if self.count == len(self.data):
+            grown = np.zeros(2 * len(self.data), dtype=PROJECTILE_DTYPE)
+            grown[:self.count] = self.data[:self.count]
+            self.data = grown
+
+        owner = self._owners.get(tuple(color))
+        if owner is None:
+            owner = self._owners[tuple(color)] = len(self.owner_colors)
+            self.owner_colors.append(tuple(color))
+
+        dx, dy = target[0] - pos[0], target[1] - pos[1]
+        dist = math.hypot(dx, dy)
+        speed = max(speed, 1e-9)
+        ux, uy = (dx / dist, dy / dist) if dist > 0 else (0.0, 0.0)
+        self.data[self.count] = (pos[0], pos[1], ux * speed, uy * speed, dist / speed,
+                                 MODES.index(collision_mode), owner, damage)
+        self.count += 1
+
+    def update(self, dt, rings):
+        n = self.count
+        if n == 0:
+            return
+        p = self.data[:n]
+        alive_rings = [ring for ring in rings if ring.alive]
+        continuous = p['mode'] == CONTINUOUS
+        speed = np.hypot(p['vx'], p['vy'])
+        to_target = p['ttl'] * speed # Distance before this frame's move
+
+        # 'destination' within 20px explodes where it is, the rest moves (and may overshoot)
+        exploding = ~continuous & (to_target < 20)
+        moving = ~exploding
+        step = np.where(continuous, np.minimum(dt, p['ttl']), dt) * moving
+        p['x'] += p['vx'] * step
+        p['y'] += p['vy'] * step
+        p['ttl'] -= step
+        turned = p['ttl'] < 0
+        if turned.any():
+            p['vx'][turned] *= -1
+            p['vy'][turned] *= -1
+            p['ttl'][turned] *= -1
+
+        # Ring distances for every row (rings are few)
+        if alive_rings:
+            cx = np.array([ring.center[0] for ring in alive_rings], dtype=np.float64)
+            cy = np.array([ring.center[1] for ring in alive_rings], dtype=np.float64)
+            radius = np.array([ring.radius for ring in alive_rings], dtype=np.float64)
+            band = np.abs(np.hypot(p['x'][:, None] - cx, p['y'][:, None] - cy) - radius)
+            near = np.where(continuous[:, None], band < CONTINUOUS_HIT, band < AOE_HIT)
+        else:
+            near = np.zeros((n, 0), dtype=bool)
+
+        dead = exploding.copy()
+        # Rows with something to apply, in firing order
+        events = np.flatnonzero(exploding | (continuous & near.any(axis=1))).tolist()
+        for i in events:
+            hits = [ring for ring, hit in zip(alive_rings, near[i].tolist()) if hit]
+            if exploding[i]:
+                spawn_particles(float(p['x'][i]), float(p['y'][i]), self.owner_colors[p['owner'][i]], 15)
+                for ring in hits:
+                    if ring.alive:
+                        self._apply_hit(i, ring)
+            else:
+                ring = next((ring for ring in hits if ring.alive), None) # Earlier hits may have killed it
+                if ring is not None:
+                    self._apply_hit(i, ring)
+                    dead[i] = True
+
+        # 'continuous' that started the frame on its target without hitting anything
+        dead |= continuous & (to_target < 5)
+
+        keep = ~dead
+        kept = int(np.count_nonzero(keep))
+        if kept < n:
+            self.data[:kept] = p[keep]
+            self.count = kept
+
+    def _apply_hit(self, i, ring):
+        row = self.data[i]
+        ring.take_damage(float(row['damage']))
+        if random.random() < 0.3 and ring.note_frequency:
+            generate_note_sound(ring.note_frequency, 0.2).play()
+        if row['mode'] == CONTINUOUS:
+             spawn_particles(float(row['x']), float(row['y']), self.owner_colors[row['owner']], 5)
+
+    def draw(self, surface):
+        p = self.projectiles
+        colors = self.owner_colors
+        for x, y, owner in zip(p['x'].astype(np.int64).tolist(), p['y'].astype(np.int64).tolist(), p['owner'].tolist()):
+             pygame.draw.circle(surface, colors[owner], (x, y), 6)
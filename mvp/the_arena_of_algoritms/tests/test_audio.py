@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+import wave
+
+import numpy as np
+
+from src.audio import AudioRecorder, StreamingAudioRecorder
+
+SR = 8000
+DT = 1 / 60
+
+def event_set(seed=7, extras=True):
+    """(frame, samples, start_time) like the game (at current_time) plus a late and a long event."""
+    rng = np.random.default_rng(seed)
+    events = []
+    for frame in range(0, 900, 3):
+        n = int(rng.integers(200, 4000))
+        events.append((frame, rng.uniform(-6000, 6000, n).astype(np.float32), frame * DT))
+    if not extras:
+        return events
+    events.append((600, rng.uniform(-9000, 9000, 3000).astype(np.float32), 2.0))  # Already flushed
+    events.append((700, rng.uniform(-3000, 3000, 5 * SR).astype(np.float32), 700 * DT))  # Longer than the buffer
+    events.append((800, np.full(100, 5.0), -1.0))  # Negative start: skipped by both
+    return sorted(events, key=lambda e: e[0])
+
+def record(recorder, events, frames=1000):
+    recorder.is_recording = True
+    pending = list(events)
+    for frame in range(frames):
+        while pending and pending[0][0] == frame:
+            _, samples, start = pending.pop(0)
+            recorder.add_samples(samples, start)
+        recorder.update_time(DT)
+    return recorder
+
+class TestStreamingAudio(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def save(self, recorder, name):
+        path = os.path.join(self.tmp.name, name)
+        recorder.save(path)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_bit_identical_to_batch_mix(self):
+        events = event_set()
+        batch = self.save(record(AudioRecorder(SR), events), "batch.wav")
+        streaming = record(StreamingAudioRecorder(SR, buffer_seconds=2.0, block_seconds=0.5), events)
+        self.assertGreater(streaming.stats["samples_flushed"], 0) # Mixed while running, not only in save
+        self.assertEqual(streaming.stats["late_events"], 1)
+        self.assertEqual(self.save(streaming, "stream.wav"), batch)
+
+    def test_not_recording_writes_nothing(self):
+        recorder = StreamingAudioRecorder(SR, buffer_seconds=2.0, block_seconds=0.5, spill_dir=self.tmp.name)
+        recorder.is_recording = False
+        for _, samples, start in event_set(extras=False):
+            recorder.add_samples(samples, start)
+        for _ in range(1000):
+            recorder.update_time(DT)
+        recorder.save(os.path.join(self.tmp.name, "off.wav"))
+        self.assertEqual(recorder.stats["samples_flushed"], 0)
+        self.assertIsNone(recorder._spill)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_fixed_gain_streams_to_sink(self):
+        events = event_set(seed=3, extras=False)
+        path = os.path.join(self.tmp.name, "sink.wav")
+        with wave.open(path, 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(SR)
+            recorder = record(StreamingAudioRecorder(SR, buffer_seconds=2.0, gain=0.5, sink=wf), events)
+            recorder.save()
+        with wave.open(path, 'rb') as wf:
+            pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+
+        expected = np.zeros(len(pcm), dtype=np.float32)
+        for _, samples, start in events:
+            i = int(start * SR)
+            expected[i:i + len(samples)] += samples
+        np.testing.assert_array_equal(pcm, (expected * 0.5).astype(np.int16))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.systems import boids
+from src.systems.boids import boids_steering
+from src.entities.base import Ring
+from src.entities.nanite import NaniteCloud
+
+CENTER = (540, 480)
+
+def make_rings():
+    return [Ring(r, 10 ** 9, CENTER, (255, 255, 255)) for r in (100, 180, 260, 340)]
+
+def scalar_cloud(n, seed):
+    random.seed(seed)
+    return NaniteCloud(CENTER, make_rings(), num_particles=n, backend='scalar')
+
+class TestBoids(unittest.TestCase):
+    def assert_forces_match(self, cloud):
+        pos = np.array([tuple(p['pos']) for p in cloud.particles])
+        vel = np.array([tuple(p['vel']) for p in cloud.particles])
+        sep, ali, coh = boids_steering(pos, vel, cloud.perception, cloud.max_speed, cloud.max_force)
+        for i, p in enumerate(cloud.particles):
+            np.testing.assert_allclose(sep[i], tuple(cloud.separation(p)), atol=1e-9)
+            np.testing.assert_allclose(ali[i], tuple(cloud.alignment(p)), atol=1e-9)
+            np.testing.assert_allclose(coh[i], tuple(cloud.cohesion(p)), atol=1e-9)
+
+    def test_forces_match_scalar(self):
+        for n in (100, 300):
+            cloud = scalar_cloud(n, seed=n)
+            for _ in range(30): # Spread the cloud out first
+                cloud.update(1 / 60)
+            with self.subTest(n=n):
+                self.assert_forces_match(cloud)
+
+    def test_cell_list_matches_scalar(self):
+        cloud = scalar_cloud(300, seed=3)
+        for _ in range(30):
+            cloud.update(1 / 60)
+        old = boids.CELL_LIST_MIN
+        boids.CELL_LIST_MIN = 0
+        try:
+            self.assert_forces_match(cloud)
+        finally:
+            boids.CELL_LIST_MIN = old
+
+    def test_numpy_cloud_tracks_scalar(self):
+        # The numpy backend moves every boid from the frame-start positions
+        # (the scalar loop sees boids already moved this frame), so the clouds
+        # drift apart in detail but must settle on the ring the same way.
+        ring_gap = lambda pos: np.abs(np.hypot(*(pos - CENTER).T) - 100).mean()
+        speed = lambda vel: np.hypot(*vel.T).mean()
+        random.seed(7)
+        vec = NaniteCloud(CENTER, make_rings(), backend='numpy')
+        ref = scalar_cloud(100, seed=7)
+        np.testing.assert_allclose(vec.pos, [tuple(p['pos']) for p in ref.particles])
+        for _ in range(360):
+            vec.update(1 / 60)
+            ref.update(1 / 60)
+        ref_pos = np.array([tuple(p['pos']) for p in ref.particles])
+        ref_vel = np.array([tuple(p['vel']) for p in ref.particles])
+        self.assertLess(ring_gap(vec.pos), 2.0)
+        self.assertAlmostEqual(ring_gap(vec.pos), ring_gap(ref_pos), delta=0.5)
+        self.assertAlmostEqual(speed(vec.vel), speed(ref_vel), delta=0.5)
+
+if __name__ == '__main__':
+    unittest.main()
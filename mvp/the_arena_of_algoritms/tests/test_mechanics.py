@@ -1,6 +1,8 @@
 import unittest
 import math
+import random
 from src.systems.physics import SpatialGrid
+from src.systems.projectile_manager import ProjectileArray, ProjectileManager, CONTINUOUS_HIT, AOE_HIT
 from src.entities.base import Entity, Ring
 
 class TestPhysics(unittest.TestCase):
@@ -20,6 +22,59 @@ class TestPhysics(unittest.TestCase):
         retrieved_far = grid.retrieve(900, 900)
         self.assertNotIn(obj, retrieved_far)
 
+    def test_retrieve_unique_keeps_insertion_order(self):
+        grid = SpatialGrid(1000, 1000, 100)
+        grid.insert("a", 150, 50)
+        grid.insert("b", 50, 50)
+        grid.insert("a", 60, 60)
+        self.assertEqual(grid.retrieve_unique(50, 50), ["a", "b"])
+
+class TestProjectileGrid(unittest.TestCase):
+    def test_candidates_cover_hit_bands(self):
+        rings = [Ring(r, 1000, (540, 480), (255, 255, 255)) for r in (100, 180, 260, 340)]
+        pm = ProjectileManager()
+        pm._build_grid(rings)
+        rng = random.Random(0)
+        for _ in range(5000):
+            x, y = rng.uniform(-50, 1130), rng.uniform(-50, 1010)
+            d = math.hypot(x - 540, y - 480)
+            for grid, band in ((pm.grid, CONTINUOUS_HIT), (pm.aoe_grid, AOE_HIT)):
+                hits = [r for r in rings if abs(d - r.radius) < band]
+                candidates = grid.retrieve_unique(x, y)
+                self.assertEqual([r for r in candidates if r in hits], hits)
+
+class TestProjectileArray(unittest.TestCase):
+    def run_backend(self, cls):
+        random.seed(1)
+        rng = random.Random(1)
+        rings = [Ring(r, 5000, (540, 480), (255, 255, 255)) for r in (100, 180, 260, 340)]
+        pm = cls()
+        for frame in range(90):
+            for _ in range(5):
+                ring = rng.choice(rings)
+                angle = rng.uniform(0, 2 * math.pi)
+                target = (540 + math.cos(angle) * ring.radius, 480 + math.sin(angle) * ring.radius)
+                pos = (rng.uniform(0, 1080), rng.uniform(0, 960))
+                mode = rng.choice(['continuous', 'destination'])
+                pm.add_projectile(pos, target, rng.uniform(200, 900), 100, (255, 0, 0), mode)
+            pm.update(1 / 60, rings)
+        if cls is ProjectileArray:
+            positions = list(zip(pm.projectiles['x'].tolist(), pm.projectiles['y'].tolist()))
+        else:
+            positions = [tuple(p['pos']) for p in pm.projectiles]
+        return [r.hp for r in rings], positions
+
+    def test_matches_dict_backend(self):
+        ref_hp, ref_pos = self.run_backend(ProjectileManager)
+        hp, pos = self.run_backend(ProjectileArray)
+        self.assertLess(min(ref_hp), 5000) # Something was hit
+        for a, b in zip(hp, ref_hp):
+            self.assertAlmostEqual(a, b, places=6)
+        self.assertEqual(len(pos), len(ref_pos))
+        for a, b in zip(pos, ref_pos):
+            self.assertAlmostEqual(a[0], b[0], places=6)
+            self.assertAlmostEqual(a[1], b[1], places=6)
+
 class TestRingMechanics(unittest.TestCase):
     def test_damage(self):
         ring = Ring(100, 1000, (0,0), (255,255,255))
@@ -12,6 +12,10 @@ from visuals import Particle, Trail, draw_neon_arc, ScreenShake, FloatingText
 from video_renderer import VelocityOddsRenderer
 import sound_gen
 
+# Shared helpers live in mvp/common
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.frame_sink import FrameSink
+
 # Global Constants
 WIDTH = 1080
 HEIGHT = 1920
@@ -19,25 +23,16 @@ FPS = 60
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 
-def get_ffmpeg_command(output_file):
-    return [
-        'ffmpeg', '-y', '-f', 'rawvideo', '-vcodec', 'rawvideo',
-        '-s', f'{WIDTH}x{HEIGHT}', '-pix_fmt', 'rgb24', '-r', str(FPS),
-        '-i', '-', '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '23',
-        '-pix_fmt', 'yuv420p', output_file
-    ]
-
 class FFMPEGRecorder:
     def __init__(self, output_file="temp_video.mp4"):
         self.output_file = output_file
-        command = get_ffmpeg_command(output_file)
-        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        # libx264 ultrafast/crf 23, fed straight from surface memory
+        self.process = FrameSink(output_file, fps=FPS, preset='ultrafast', crf=23)
         self.frame_count = 0
 
     def capture(self, surface):
         try:
-            data = pygame.image.tobytes(surface, 'RGB')
-            self.process.stdin.write(data)
+            self.process.write(surface)
             self.frame_count += 1
         except:
             self.stop()
@@ -45,7 +40,7 @@ class FFMPEGRecorder:
 
     def stop(self):
         if self.process:
-            self.process.communicate()
+            self.process.close()
             self.process = None
 
 def mux_audio_video(video_path, audio_path, output_path):
@@ -97,31 +92,19 @@ def main():
             renderer.render_frame(screen, sim, particles, trails, floating_texts, shaker, recorder.frame_count)
             recorder.capture(screen)
             
-                        # Condição de Fim: Todos terminaram
-            
-                        if sim.game_over and end_frame is None:
-            
-                            end_frame = recorder.frame_count
-            
-                            win_text = f"WINNER: {sim.winner_player.name}!"
-            
-                            # Adiciona o texto e garante que ele dure a celebração toda
-            
-                            winner_msg = FloatingText(WIDTH//2, HEIGHT//2, win_text, sim.winner_player.color, renderer.font_big)
-            
-                            winner_msg.life = 10.0 # Vida longa para não sumir nos 2 segundos
-            
-                            floating_texts.append(winner_msg)
-            
-                            print(f"\n🏆 Game Over! Winner: {sim.winner_player.name} (${sim.winner_player.money:,.0f})")
-            
-                        
-            
-                        # Só encerra o loop APÓS os quadros de celebração
-            
-                        if end_frame is not None and (recorder.frame_count - end_frame) >= POST_VICTORY_FRAMES:
-            
-                            break
+            # Condição de Fim: Todos terminaram
+            if sim.game_over and end_frame is None:
+                end_frame = recorder.frame_count
+                win_text = f"WINNER: {sim.winner_player.name}!"
+                # Adiciona o texto e garante que ele dure a celebração toda
+                winner_msg = FloatingText(WIDTH//2, HEIGHT//2, win_text, sim.winner_player.color, renderer.font_big)
+                winner_msg.life = 10.0 # Vida longa para não sumir nos 2 segundos
+                floating_texts.append(winner_msg)
+                print(f"\n🏆 Game Over! Winner: {sim.winner_player.name} (${sim.winner_player.money:,.0f})")
+
+            # Só encerra o loop APÓS os quadros de celebração
+            if end_frame is not None and (recorder.frame_count - end_frame) >= POST_VICTORY_FRAMES:
+                break
             
             
             if recorder.frame_count > FPS * 180: break